@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import argparse
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+
+@dataclass(slots=True)
+class ManifestSpec:
+    workloads: int = 1000
+    statefulset_ratio: float = 0.15
+    pvc_ratio: float = 0.10
+    lb_ratio: float = 0.05
+    configmaps_per_workload: float = 1.0
+    configmap_kb: int = 16
+    docs_per_file: int = 50
+    namespaces: int = 20
+    seed: int = 42
+
+
+_CPU = ["50m", "100m", "250m", "500m", "1", "1500m", "2"]
+_MEM = ["64Mi", "128Mi", "256Mi", "512Mi", "1Gi", "2Gi", "4Gi"]
+_SIZES = ["1Gi", "10Gi", "20Gi", "50Gi", "100Gi"]
+_CLASSES = ["gp3", "gp2", "io2", "st1"]
+
+
+def _container(rng: random.Random, idx: int) -> str:
+    if rng.random() < 0.1:  # some containers miss requests to exercise defaults
+        return f"        - name: c{idx}\n          image: busybox\n"
+    return (
+        f"        - name: c{idx}\n"
+        f"          image: nginx\n"
+        f"          resources:\n"
+        f"            requests:\n"
+        f'              cpu: "{rng.choice(_CPU)}"\n'
+        f'              memory: "{rng.choice(_MEM)}"\n'
+    )
+
+
+def _workload(rng: random.Random, i: int, ns: str, stateful: bool) -> str:
+    kind = "StatefulSet" if stateful else "Deployment"
+    containers = "".join(_container(rng, c) for c in range(rng.randint(1, 3)))
+    doc = (
+        f"apiVersion: apps/v1\n"
+        f"kind: {kind}\n"
+        f"metadata:\n"
+        f"  name: wl-{i}\n"
+        f"  namespace: {ns}\n"
+        f"  labels:\n"
+        f"    app: wl-{i}\n"
+        f"    team: team-{i % 7}\n"
+        f"spec:\n"
+        f"  replicas: {rng.randint(1, 6)}\n"
+        f"  template:\n"
+        f"    metadata:\n"
+        f"      labels:\n"
+        f"        app: wl-{i}\n"
+        f"    spec:\n"
+        f"      containers:\n"
+        f"{containers}"
+    )
+    if stateful:
+        doc += (
+            f"  volumeClaimTemplates:\n"
+            f"    - metadata:\n"
+            f"        name: data\n"
+            f"      spec:\n"
+            f"        storageClassName: {rng.choice(_CLASSES)}\n"
+            f"        resources:\n"
+            f"          requests:\n"
+            f'            storage: "{rng.choice(_SIZES)}"\n'
+        )
+    return doc
+
+
+def _pvc(rng: random.Random, i: int, ns: str) -> str:
+    return (
+        f"apiVersion: v1\n"
+        f"kind: PersistentVolumeClaim\n"
+        f"metadata:\n"
+        f"  name: pvc-{i}\n"
+        f"  namespace: {ns}\n"
+        f"spec:\n"
+        f"  storageClassName: {rng.choice(_CLASSES)}\n"
+        f"  resources:\n"
+        f"    requests:\n"
+        f"      storage: {rng.choice(_SIZES)}\n"
+    )
+
+
+def _service(i: int, ns: str) -> str:
+    return (
+        f"apiVersion: v1\n"
+        f"kind: Service\n"
+        f"metadata:\n"
+        f"  name: lb-{i}\n"
+        f"  namespace: {ns}\n"
+        f"spec:\n"
+        f"  type: LoadBalancer\n"
+        f"  ports:\n"
+        f"    - port: 80\n"
+    )
+
+
+def _configmap(i: int, ns: str, payload: str) -> str:
+    return (
+        f"apiVersion: v1\n"
+        f"kind: ConfigMap\n"
+        f"metadata:\n"
+        f"  name: cm-{i}\n"
+        f"  namespace: {ns}\n"
+        f"data:\n"
+        f"  blob: |\n"
+        f"{payload}"
+    )
+
+
+def generate_documents(spec: ManifestSpec) -> List[str]:
+    rng = random.Random(spec.seed)
+    line = "    " + "x" * 76 + "\n"
+    payload = line * max(1, (spec.configmap_kb * 1024) // len(line))
+    docs: List[str] = []
+    cm_budget = 0.0
+    for i in range(spec.workloads):
+        ns = f"ns-{i % spec.namespaces}"
+        docs.append(_workload(rng, i, ns, rng.random() < spec.statefulset_ratio))
+        if rng.random() < spec.pvc_ratio:
+            docs.append(_pvc(rng, i, ns))
+        if rng.random() < spec.lb_ratio:
+            docs.append(_service(i, ns))
+        cm_budget += spec.configmaps_per_workload
+        while cm_budget >= 1.0:
+            docs.append(_configmap(i, ns, payload))
+            cm_budget -= 1.0
+    return docs
+
+
+def generate_manifests(out_dir: Path, spec: ManifestSpec) -> List[Path]:
+    """Write a synthetic multi-document manifest set and return the file paths."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    docs = generate_documents(spec)
+    paths: List[Path] = []
+    per_file = max(1, spec.docs_per_file)
+    for n, start in enumerate(range(0, len(docs), per_file)):
+        path = out_dir / f"render-{n:05d}.yaml"
+        path.write_text("---\n".join(docs[start : start + per_file]), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def main() -> None:  # pragma: no cover - manual entry point
+    parser = argparse.ArgumentParser(description="Generate synthetic EKS manifest sets")
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--workloads", type=int, default=1000)
+    parser.add_argument("--configmap-kb", type=int, default=16)
+    parser.add_argument("--docs-per-file", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    spec = ManifestSpec(
+        workloads=args.workloads,
+        configmap_kb=args.configmap_kb,
+        docs_per_file=args.docs_per_file,
+        seed=args.seed,
+    )
+    paths = generate_manifests(args.out_dir, spec)
+    print(f"Wrote {len(paths)} files to {args.out_dir}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
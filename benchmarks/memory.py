@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import tracemalloc
+from typing import Any, Callable, Dict, List, Type, get_type_hints
+
+from pydantic import create_model
+
+from eks_cost_estimator.models.resources import ServiceItem, StorageItem, WorkloadItem
+from eks_cost_estimator.models.results import (
+    LoadBalancerCost,
+    NodeBinAllocation,
+    StorageCost,
+    WorkloadCost,
+)
+
+
+RECORD_TYPES: List[Type[Any]] = [
+    WorkloadItem,
+    StorageItem,
+    ServiceItem,
+    WorkloadCost,
+    StorageCost,
+    LoadBalancerCost,
+    NodeBinAllocation,
+]
+
+_SAMPLE_VALUES: Dict[str, Any] = {"int": 3, "float": 0.25, "str": "Deployment"}
+
+
+def _sample_kwargs(cls: Type[Any]) -> Dict[str, Any]:
+    kwargs: Dict[str, Any] = {}
+    for f in dataclasses.fields(cls):
+        if f.default is not dataclasses.MISSING:
+            continue
+        kwargs[f.name] = _SAMPLE_VALUES[str(f.type)]
+    kwargs["namespace"] = "default"
+    return kwargs
+
+
+def _pydantic_mirror(cls: Type[Any]) -> Type[Any]:
+    """Build the BaseModel equivalent of a record, as the pipeline used before."""
+    fields: Dict[str, Any] = {}
+    hints = get_type_hints(cls)
+    for f in dataclasses.fields(cls):
+        default = ... if f.default is dataclasses.MISSING else f.default
+        fields[f.name] = (hints[f.name], default)
+    return create_model(f"{cls.__name__}Model", **fields)
+
+
+def bytes_per_row(factory: Callable[[int], Any], rows: int) -> float:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        # Distinct name strings per row, as with real manifests
+        kept = [factory(i) for i in range(rows)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return (after - before) / rows
+
+
+def measure(rows: int = 100_000) -> Dict[str, Dict[str, float]]:
+    report: Dict[str, Dict[str, float]] = {}
+    for cls in RECORD_TYPES:
+        kwargs = _sample_kwargs(cls)
+        name_field = "workload" if "workload" in kwargs else "name"
+        model = _pydantic_mirror(cls)
+
+        def make_record(i: int, cls: Type[Any] = cls) -> Any:
+            return cls(**{**kwargs, name_field: f"row-{i}"})
+
+        def make_model(i: int, model: Type[Any] = model) -> Any:
+            return model(**{**kwargs, name_field: f"row-{i}"})
+
+        slotted = bytes_per_row(make_record, rows)
+        pydantic_bytes = bytes_per_row(make_model, rows)
+        report[cls.__name__] = {
+            "slotted_bytes_per_row": round(slotted, 1),
+            "pydantic_bytes_per_row": round(pydantic_bytes, 1),
+            "ratio": round(pydantic_bytes / slotted, 2) if slotted else 0.0,
+        }
+    return report
+
+
+def main() -> None:  # pragma: no cover - manual entry point
+    parser = argparse.ArgumentParser(description="Per-row memory footprint of pipeline records")
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+    print(json.dumps(measure(args.rows), indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
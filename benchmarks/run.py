@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks.generate import ManifestSpec, generate_manifests
+from eks_cost_estimator.calculators.binpack import simulate_binpack
+from eks_cost_estimator.calculators.compute import compute_costs
+from eks_cost_estimator.calculators.elb import elb_costs
+from eks_cost_estimator.calculators.storage import storage_costs
+from eks_cost_estimator.core.orchestrator import EstimationConfig, orchestrate
+from eks_cost_estimator.output.render import render_csv, render_json, render_table
+from eks_cost_estimator.parsers.yaml_parser import parse_files
+from eks_cost_estimator.pricing.rates import derive_rates, get_baseline
+from eks_cost_estimator.utils.timings import Timings
+
+
+SCENARIOS: Dict[str, ManifestSpec] = {
+    "1k": ManifestSpec(workloads=1_000),
+    "10k": ManifestSpec(workloads=10_000),
+    "100k": ManifestSpec(workloads=100_000, configmaps_per_workload=0.5),
+}
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+DEFAULT_THRESHOLD = 0.25  # fail when throughput drops by more than 25%
+PRICING_LOOKUPS = 1_000
+# Bin-packing cost grows with node count; the 100k scenario skips it
+BINPACK_MAX_WORKLOADS = 10_000
+
+
+def run_scenario(
+    spec: ManifestSpec, *, workdir: Path, measure_memory: bool = False
+) -> Dict[str, Dict[str, float]]:
+    """Run every pipeline stage on a generated manifest set.
+
+    Returns per-stage ``wall_s``, ``items`` and ``items_per_s``. With
+    ``measure_memory`` a second, tracemalloc-enabled pass adds ``peak_bytes``;
+    tracing is kept out of the timed pass because it slows allocation-heavy stages
+    by an order of magnitude.
+    """
+    paths = [str(p) for p in generate_manifests(workdir, spec)]
+    report = _run_stages(paths, trace_memory=False)
+    if measure_memory:
+        traced = _run_stages(paths, trace_memory=True)
+        for name, entry in report.items():
+            entry["peak_bytes"] = traced[name]["peak_bytes"]
+    return report
+
+
+def _run_stages(paths: List[str], *, trace_memory: bool) -> Dict[str, Dict[str, float]]:
+    timings = Timings(trace_memory=trace_memory)
+    timings.start()
+    items: Dict[str, int] = {}
+    try:
+        with timings.stage("parse"):
+            parsed = parse_files(paths, timings=timings)
+        # Throughput counts every document in the stream, including prefiltered ones
+        items["parse"] = timings.counters.get("documents", 0) + timings.counters.get(
+            "documents_skipped", 0
+        )
+
+        with timings.stage("pricing"):
+            for _ in range(PRICING_LOOKUPS):
+                baseline = get_baseline(region="eu-west-3", instance="m6i.large")
+                rates = derive_rates(
+                    price=baseline["price"],
+                    vcpu=baseline["vcpu"],
+                    memory_gb=baseline["memory_gb"],
+                    cpu_weight=0.6,
+                    mem_weight=0.4,
+                )
+        items["pricing"] = PRICING_LOOKUPS
+
+        with timings.stage("compute"):
+            compute_costs(parsed.workloads, rates)
+        items["compute"] = len(parsed.workloads)
+
+        with timings.stage("storage"):
+            storage_costs(parsed.storage)
+        items["storage"] = len(parsed.storage)
+
+        with timings.stage("elb"):
+            elb_costs(parsed.services)
+        items["elb"] = len(parsed.services)
+
+        if len(parsed.workloads) <= BINPACK_MAX_WORKLOADS:
+            with timings.stage("binpack"):
+                simulate_binpack(
+                    parsed.workloads,
+                    instance_type="m6i.large",
+                    node_cpu_vcpu=baseline["vcpu"],
+                    node_mem_gb=baseline["memory_gb"],
+                )
+            items["binpack"] = sum(w.replicas for w in parsed.workloads)
+
+        cfg = EstimationConfig(
+            region="eu-west-3",
+            baseline_instance="m6i.large",
+            baseline_price_override=None,
+            cpu_weight=0.6,
+            mem_weight=0.4,
+        )
+        result = orchestrate(paths, cfg)
+        rows = len(result.workloads) + len(result.storage) + len(result.load_balancers)
+        with timings.stage("render_json"):
+            render_json(result)
+        with timings.stage("render_csv"):
+            render_csv(result)
+        with timings.stage("render_table"), contextlib.redirect_stdout(io.StringIO()):
+            render_table(result)
+        with timings.stage("render_table_top"), contextlib.redirect_stdout(io.StringIO()):
+            render_table(result, top=50)
+        for name in ("render_json", "render_csv", "render_table", "render_table_top"):
+            items[name] = rows
+    finally:
+        timings.stop()
+
+    report: Dict[str, Dict[str, float]] = {}
+    for name, count in items.items():
+        st = timings.stages[name]
+        entry: Dict[str, float] = {
+            "wall_s": st.wall_s,
+            "items": count,
+            "items_per_s": count / st.wall_s if st.wall_s > 0 else 0.0,
+        }
+        if trace_memory:
+            entry["peak_bytes"] = st.peak_bytes
+        report[name] = entry
+    return report
+
+
+def compare(
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    baselines: Dict[str, Dict[str, Dict[str, float]]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[str]:
+    """Return one message per stage whose throughput regressed beyond ``threshold``."""
+    regressions: List[str] = []
+    for scenario, stages in results.items():
+        base_stages = baselines.get(scenario, {})
+        for stage, metrics in stages.items():
+            base = base_stages.get(stage)
+            if not base or base.get("items_per_s", 0) <= 0:
+                continue
+            ratio = metrics["items_per_s"] / base["items_per_s"]
+            if ratio < 1.0 - threshold:
+                regressions.append(
+                    f"{scenario}/{stage}: {metrics['items_per_s']:.0f} items/s vs baseline "
+                    f"{base['items_per_s']:.0f} ({(1 - ratio) * 100:.0f}% slower)"
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="EKS cost estimator benchmarks")
+    parser.add_argument(
+        "--scenario", action="append", choices=sorted(SCENARIOS), help="Default: 1k and 10k"
+    )
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--baselines", type=Path, default=BASELINES_PATH)
+    parser.add_argument("--update-baselines", action="store_true")
+    parser.add_argument(
+        "--memory", action="store_true", help="Add per-stage tracemalloc peaks (extra pass)"
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    scenarios = args.scenario or ["1k", "10k"]
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for name in scenarios:
+        with tempfile.TemporaryDirectory(prefix=f"eks-bench-{name}-") as tmp:
+            results[name] = run_scenario(
+                SCENARIOS[name], workdir=Path(tmp), measure_memory=args.memory
+            )
+
+    report: Dict[str, Any] = {"results": results}
+    if args.update_baselines:
+        stored = json.loads(args.baselines.read_text()) if args.baselines.exists() else {}
+        stored.update(results)
+        args.baselines.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+        regressions: List[str] = []
+    else:
+        baselines = json.loads(args.baselines.read_text()) if args.baselines.exists() else {}
+        regressions = compare(results, baselines, args.threshold)
+    report["regressions"] = regressions
+
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+    for msg in regressions:
+        print(f"REGRESSION {msg}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+import csv
+import heapq
+import json
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from eks_cost_estimator.calculators.hpa import (
+    HOURS_PER_MONTH,
+    SimulationError,
+    hourly_replicas,
+    join_hpas,
+)
+from eks_cost_estimator.calculators.jobsim import (
+    BATCH_KINDS,
+    DEFAULT_HORIZON_MINUTES,
+    DEFAULT_SCALE_DOWN_UTILIZATION,
+)
+from eks_cost_estimator.calculators.packer import NodeIndex
+from eks_cost_estimator.models.resources import HpaItem, PodEvent, WorkloadItem
+from eks_cost_estimator.models.results import AutoscalerSimulationResult
+from eks_cost_estimator.utils.units import parse_cpu, parse_mem_gb
+
+
+# cluster-autoscaler's default --scale-down-unneeded-time
+DEFAULT_SCALE_DOWN_DELAY_MINUTES = 10.0
+ARRIVE_EVENTS = frozenset({"add", "arrive", "create", "start"})
+DEPART_EVENTS = frozenset({"delete", "depart", "remove", "stop"})
+
+_EPS = 1e-9
+
+
+@lru_cache(maxsize=4096)
+def _trace_cpu(value: str) -> float:
+    return parse_cpu(value)
+
+
+@lru_cache(maxsize=4096)
+def _trace_mem(value: str) -> float:
+    try:
+        return float(value)  # plain numbers are GB
+    except ValueError:
+        return parse_mem_gb(value)
+
+
+def _trace_event(record: Mapping[str, Any]) -> PodEvent:
+    event = str(record["event"]).strip().lower()
+    minute = float(record["minute"])
+    if minute < 0:
+        raise ValueError(f"negative minute {minute}")
+    pod = str(record["pod"])
+    if event in ARRIVE_EVENTS:
+        cpu = _trace_cpu(str(record.get("cpu") or 0))
+        mem = _trace_mem(str(record.get("memory") or 0))
+        return PodEvent(minute, pod, True, cpu, mem)
+    if event in DEPART_EVENTS:
+        return PodEvent(minute, pod, False)
+    raise ValueError(f"unknown event '{event}'")
+
+
+def read_pod_trace(path: Path) -> List[PodEvent]:
+    """Read pod arrival/departure events from CSV (with a header row) or NDJSON.
+
+    Records have ``minute`` (from the start of the month), ``event`` (``add`` or
+    ``delete``), ``pod`` and, for additions, ``cpu`` and ``memory`` requests as
+    Kubernetes quantities (plain numbers are vCPU and GB).
+    """
+    try:
+        f = open(path, encoding="utf-8", newline="")
+    except OSError as e:
+        raise SimulationError(f"Cannot read pod trace {path}: {e}") from e
+    events: List[PodEvent] = []
+    with f:
+        ndjson = f.read(256).lstrip().startswith("{")
+        f.seek(0)
+        # NDJSON lines (str) or CSV rows (dict)
+        rows: Iterable[Any] = (line for line in f if line.strip()) if ndjson else csv.DictReader(f)
+        for n, row in enumerate(rows, start=1):
+            try:
+                events.append(_trace_event(json.loads(row) if ndjson else row))
+            except (KeyError, TypeError, ValueError) as e:
+                raise SimulationError(f"Pod trace {path}, record {n}: {e}") from e
+    return events
+
+
+def events_from_workloads(
+    workloads: Sequence[WorkloadItem],
+    hpas: Sequence[HpaItem],
+    profile: Optional[Mapping[str, Tuple[float, ...]]] = None,
+) -> Tuple[List[PodEvent], List[HpaItem]]:
+    """Pod events for parsed manifests over a month.
+
+    Long-running replicas arrive at minute 0; HPA-scaled workloads add and remove pods
+    at hour boundaries following ``hourly_replicas``. Also returns the HPAs whose scale
+    target was not found.
+    """
+    joined, unmatched = join_hpas(workloads, hpas)
+    events: List[PodEvent] = []
+    for i, w in enumerate(workloads):
+        if i in joined or w.kind in BATCH_KINDS:
+            continue
+        cpu, mem = w.cpu_vcpu_per_replica, w.memory_gb_per_replica
+        events.extend(PodEvent(0.0, f"{i}/{k}", True, cpu, mem) for k in range(w.replicas))
+    if joined:
+        for chunk, replicas in hourly_replicas(workloads, joined, profile):
+            for i, row in zip(chunk, replicas.astype(int).tolist()):
+                cpu, mem = workloads[i].cpu_vcpu_per_replica, workloads[i].memory_gb_per_replica
+                current = 0
+                for hour, n in enumerate(row):
+                    minute = float(hour * 60)
+                    if n > current:
+                        events.extend(
+                            PodEvent(minute, f"{i}/{k}", True, cpu, mem) for k in range(current, n)
+                        )
+                    elif n < current:
+                        events.extend(
+                            PodEvent(minute, f"{i}/{k}", False) for k in range(n, current)
+                        )
+                    current = n
+    return events, unmatched
+
+
+@dataclass(slots=True)
+class _Node:
+    id: int
+    cpu_used: float = 0.0
+    mem_used: float = 0.0
+    pods: Set[str] = field(default_factory=set)
+    unneeded_since: Optional[float] = None
+    order_key: Tuple[float, int] = (0.0, 0)
+    cpu_key: Tuple[float, int] = (0.0, 0)
+    mem_key: Tuple[float, int] = (0.0, 0)
+
+
+class _Cluster(NodeIndex):
+    """Node state for the autoscaler replay, accounted minute by minute."""
+
+    def __init__(
+        self,
+        *,
+        cpu_cap: float,
+        mem_cap: float,
+        threshold: float,
+        delay: float,
+        max_nodes: Optional[int],
+        min_nodes: int,
+        hours: int,
+    ) -> None:
+        self.cpu_cap = cpu_cap
+        self.mem_cap = mem_cap
+        self.threshold = threshold
+        self.delay = delay
+        self.max_nodes = max_nodes
+        self.min_nodes = min_nodes
+        self._nodes: Dict[int, _Node] = {}
+        self._order: List[Tuple[float, int]] = []
+        self._by_cpu: List[Tuple[float, int]] = []
+        self._by_mem: List[Tuple[float, int]] = []
+        self._next_id = 0
+        self._pods: Dict[str, Tuple[_Node, float, float]] = {}
+        self._pending: Dict[str, Tuple[float, float]] = {}  # insertion order is FIFO
+        self._freed = False
+        # (due minute, node id, unneeded_since): stale entries are skipped on pop
+        self._unneeded: List[Tuple[float, int, float]] = []
+        self._cpu_used = 0.0
+        self._mem_used = 0.0
+        self.now = 0.0
+        self.node_minutes = [0.0] * hours
+        self.pending_minutes = 0.0
+        self.scale_ups = self.scale_downs = self.unschedulable = 0
+        self.peak = 0
+        self.peak_minute = 0.0
+        self.peak_pending = 0
+
+    def advance(self, t: float) -> None:
+        if t <= self.now:
+            return
+        count = len(self._nodes)
+        if count:
+            buckets = self.node_minutes
+            t0 = self.now
+            while t0 < t:
+                hour = int(t0 // 60)
+                end = min(t, (hour + 1) * 60.0)
+                buckets[hour] += count * (end - t0)
+                t0 = end
+        self.pending_minutes += len(self._pending) * (t - self.now)
+        self.now = t
+
+    def _mark(self, node: _Node) -> None:
+        if (
+            node.cpu_used < self.threshold * self.cpu_cap
+            and node.mem_used < self.threshold * self.mem_cap
+        ):
+            if node.unneeded_since is None:
+                node.unneeded_since = self.now
+                heapq.heappush(self._unneeded, (self.now + self.delay, node.id, self.now))
+        else:
+            node.unneeded_since = None
+
+    def _bind(self, node: _Node, pod: str, cpu: float, mem: float) -> None:
+        self._unindex(node)
+        node.cpu_used += cpu
+        node.mem_used += mem
+        node.pods.add(pod)
+        self._index(node)
+        self._pods[pod] = (node, cpu, mem)
+        self._cpu_used += cpu
+        self._mem_used += mem
+        self._mark(node)
+
+    def _unbind(self, pod: str) -> Tuple[_Node, float, float]:
+        node, cpu, mem = entry = self._pods.pop(pod)
+        self._unindex(node)
+        node.pods.discard(pod)
+        if node.pods:
+            node.cpu_used -= cpu
+            node.mem_used -= mem
+        else:
+            node.cpu_used = node.mem_used = 0.0  # drop accumulated float drift
+        self._index(node)
+        self._cpu_used -= cpu
+        self._mem_used -= mem
+        self._mark(node)
+        return entry
+
+    def _schedule(self, pod: str, cpu: float, mem: float) -> bool:
+        node = self._best_node(cpu, mem)
+        if node is None:
+            if self.max_nodes is not None and len(self._nodes) >= self.max_nodes:
+                return False
+            node = _Node(id=self._next_id)
+            self._next_id += 1
+            self._nodes[node.id] = node
+            self._index(node)
+            self.scale_ups += 1
+            if len(self._nodes) > self.peak:
+                self.peak, self.peak_minute = len(self._nodes), self.now
+        self._bind(node, pod, cpu, mem)
+        return True
+
+    def arrive(self, event: PodEvent) -> None:
+        pod, cpu, mem = event.pod, event.cpu_vcpu, event.memory_gb
+        if pod in self._pods or pod in self._pending:
+            return
+        if cpu > self.cpu_cap + _EPS or mem > self.mem_cap + _EPS:
+            self.unschedulable += 1
+            return
+        if not self._schedule(pod, cpu, mem):
+            self._pending[pod] = (cpu, mem)
+            self.peak_pending = max(self.peak_pending, len(self._pending))
+
+    def depart(self, event: PodEvent) -> None:
+        if self._pending.pop(event.pod, None) is not None:
+            return
+        if event.pod in self._pods:
+            self._unbind(event.pod)
+            self._freed = True
+
+    def retry_pending(self) -> None:
+        if not (self._pending and self._freed):
+            return
+        self._freed = False
+        for pod, (cpu, mem) in list(self._pending.items()):
+            if self._schedule(pod, cpu, mem):
+                del self._pending[pod]
+
+    def _drain(self, node: _Node) -> bool:
+        """Move the pods on ``node`` to other non-empty nodes and delete it, or change nothing."""
+        if node.pods:
+            others = len(self._nodes) - 1
+            if (
+                others * self.cpu_cap - (self._cpu_used - node.cpu_used) < node.cpu_used - _EPS
+                or others * self.mem_cap - (self._mem_used - node.mem_used) < node.mem_used - _EPS
+            ):
+                return False
+            moves: List[Tuple[str, float, float]] = []
+            pods = sorted(node.pods, key=lambda p: self._pods[p][1] + self._pods[p][2])
+            for pod in reversed(pods):
+                _, cpu, mem = self._pods[pod]
+                target = self._best_node(cpu, mem, exclude=node.id)
+                # Moving onto an empty node would not save one
+                if target is None or not target.pods:
+                    for moved, m_cpu, m_mem in reversed(moves):
+                        self._unbind(moved)
+                        self._bind(node, moved, m_cpu, m_mem)
+                    return False
+                self._unbind(pod)
+                self._bind(target, pod, cpu, mem)
+                moves.append((pod, cpu, mem))
+        self._unindex(node)
+        del self._nodes[node.id]
+        self.scale_downs += 1
+        return True
+
+    def scale_down(self, until: float) -> None:
+        """Remove nodes that have been under the threshold for the delay, up to ``until``."""
+        heap = self._unneeded
+        retry: List[Tuple[float, int, float]] = []
+        while heap and heap[0][0] <= until:
+            due, node_id, since = heapq.heappop(heap)
+            node = self._nodes.get(node_id)
+            if node is None or node.unneeded_since != since:
+                continue
+            self.advance(due)
+            if len(self._nodes) <= self.min_nodes or self._pending or not self._drain(node):
+                # Still unneeded: try again after the next events or another delay
+                retry.append((max(due + self.delay, until), node_id, since))
+        for entry in retry:
+            heapq.heappush(heap, entry)
+
+
+def simulate_autoscaler(
+    events: Sequence[PodEvent],
+    *,
+    instance_type: str,
+    node_cpu_vcpu: float,
+    node_mem_gb: float,
+    node_hourly_price: float,
+    overhead_cpu_vcpu: float = 0.2,
+    overhead_mem_gb: float = 0.5,
+    scale_down_utilization: float = DEFAULT_SCALE_DOWN_UTILIZATION,
+    scale_down_delay_minutes: float = DEFAULT_SCALE_DOWN_DELAY_MINUTES,
+    max_nodes: Optional[int] = None,
+    min_nodes: int = 0,
+    horizon_minutes: int = DEFAULT_HORIZON_MINUTES,
+) -> AutoscalerSimulationResult:
+    """Replay pod events against cluster-autoscaler rules and account node time.
+
+    Arriving pods go to the best-fit node; when none fits a node is added, up to
+    ``max_nodes`` (beyond it pods stay pending until capacity frees up). A node whose
+    CPU and memory requests both stay under ``scale_down_utilization`` of allocatable
+    for ``scale_down_delay_minutes`` is removed once its pods fit on other non-empty
+    nodes. Within a minute departures are applied before arrivals. Node state is kept
+    in sorted indexes (see ``NodeIndex``) and scale-down candidates in a heap, so the
+    cost per event is logarithmic in the node count.
+    """
+    cpu_cap = max(0.0, float(node_cpu_vcpu) - overhead_cpu_vcpu)
+    mem_cap = max(0.0, float(node_mem_gb) - overhead_mem_gb)
+    cluster = _Cluster(
+        cpu_cap=cpu_cap,
+        mem_cap=mem_cap,
+        threshold=scale_down_utilization,
+        delay=scale_down_delay_minutes,
+        max_nodes=max_nodes,
+        min_nodes=min_nodes,
+        hours=math.ceil(horizon_minutes / 60),
+    )
+    replayed = 0
+    minute: Optional[float] = None
+    for event in sorted(events, key=lambda e: (e.minute, e.arrive)):
+        if event.minute >= horizon_minutes:
+            break
+        if event.minute != minute:
+            cluster.retry_pending()
+            cluster.scale_down(event.minute)
+            cluster.advance(event.minute)
+            minute = event.minute
+        if event.arrive:
+            cluster.arrive(event)
+        else:
+            cluster.depart(event)
+        replayed += 1
+    cluster.retry_pending()
+    cluster.scale_down(horizon_minutes)
+    cluster.advance(horizon_minutes)
+
+    node_minutes = sum(cluster.node_minutes)
+    average = node_minutes / horizon_minutes if horizon_minutes else 0.0
+    return AutoscalerSimulationResult(
+        instance_type=instance_type,
+        horizon_minutes=horizon_minutes,
+        scale_down_utilization=scale_down_utilization,
+        scale_down_delay_minutes=scale_down_delay_minutes,
+        max_nodes=max_nodes,
+        events=replayed,
+        scale_ups=cluster.scale_ups,
+        scale_downs=cluster.scale_downs,
+        pods_unschedulable=cluster.unschedulable,
+        peak_pending_pods=cluster.peak_pending,
+        pending_pod_hours=cluster.pending_minutes / 60.0,
+        peak_node_count=cluster.peak,
+        peak_minute=cluster.peak_minute,
+        average_node_count=average,
+        node_hours=node_minutes / 60.0,
+        monthly_node_cost=average * HOURS_PER_MONTH * node_hourly_price,
+        hourly_cost=[m / 60.0 * node_hourly_price for m in cluster.node_minutes],
+    )
@@ -1,14 +1,42 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
+from eks_cost_estimator.calculators.hpa import HOURS_PER_MONTH
+from eks_cost_estimator.calculators.packer import IncrementalPacker, unique_entries
 from eks_cost_estimator.models.resources import WorkloadItem
-from eks_cost_estimator.models.results import (
-    BinPackingResult,
-    NodeBin,
-    NodeBinAllocation,
-)
+from eks_cost_estimator.models.results import BinPackingResult, NodeBin
+
+
+DEFAULT_POOL = "default"
+# Below this many replicas in total, worker process start-up costs more than packing
+PARALLEL_MIN_REPLICAS = 20_000
+# Labels the kubelet sets on every node; a pool's own labels take precedence
+LABEL_OS = "kubernetes.io/os"
+LABEL_ARCH = "kubernetes.io/arch"
+LABEL_INSTANCE_TYPE = "node.kubernetes.io/instance-type"
+_GRAVITON = re.compile(r"^[a-z]+\d+g")  # m6g, c7gn, t4g: arm64 instance families
+
+
+@dataclass(frozen=True, slots=True)
+class Taint:
+    key: str
+    value: Optional[str] = None
+    effect: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class NodePool:
+    name: str
+    instance_type: str
+    labels: Dict[str, str] = field(default_factory=dict)
+    taints: Tuple[Taint, ...] = ()
+    node_cpu_vcpu: Optional[float] = None  # resolved from the pricing catalog when None
+    node_mem_gb: Optional[float] = None
+    hourly_price: Optional[float] = None  # resolved with the sizes
 
 
 @dataclass(slots=True)
@@ -48,98 +76,245 @@ def simulate_binpack(
     overhead_cpu_vcpu: float = 0.2,
     overhead_mem_gb: float = 0.5,
 ) -> BinPackingResult:
-    # Effective capacities
-    cpu_cap = max(0.0, float(node_cpu_vcpu) - float(overhead_cpu_vcpu))
-    mem_cap = max(0.0, float(node_mem_gb) - float(overhead_mem_gb))
-
-    items = _flatten_items(workloads)
-
-    # Sort items by max utilization fraction descending
-    def key(i: _Item) -> Tuple[float, float]:
-        frac_cpu = i.cpu / cpu_cap if cpu_cap > 0 else 1.0
-        frac_mem = i.mem / mem_cap if mem_cap > 0 else 1.0
-        return (max(frac_cpu, frac_mem), i.cpu + i.mem)
-
-    items.sort(key=key, reverse=True)
-
-    # Nodes state
-    nodes_cpu_used: List[float] = []
-    nodes_mem_used: List[float] = []
-    nodes_allocs: List[dict[Tuple[str, Optional[str], str], int]] = []
-
-    for it in items:
-        for _ in range(it.replicas):
-            # Find best fit node
-            best_idx: Optional[int] = None
-            best_score: float = 1e9
-            for idx in range(len(nodes_cpu_used)):
-                new_cpu = nodes_cpu_used[idx] + it.cpu
-                new_mem = nodes_mem_used[idx] + it.mem
-                if new_cpu <= cpu_cap + 1e-9 and new_mem <= mem_cap + 1e-9:
-                    # score: leftover sum (lower is better)
-                    score = (cpu_cap - new_cpu) + (mem_cap - new_mem)
-                    if score < best_score:
-                        best_score = score
-                        best_idx = idx
-            if best_idx is None:
-                # create new node
-                nodes_cpu_used.append(it.cpu)
-                nodes_mem_used.append(it.mem)
-                nodes_allocs.append({})
-                best_idx = len(nodes_cpu_used) - 1
-            else:
-                nodes_cpu_used[best_idx] += it.cpu
-                nodes_mem_used[best_idx] += it.mem
-
-            key_alloc = (it.name, it.namespace, it.kind)
-            nodes_allocs[best_idx][key_alloc] = nodes_allocs[best_idx].get(key_alloc, 0) + 1
-
-    # Build result structure
-    total_cpu_used = sum(nodes_cpu_used)
-    total_mem_used = sum(nodes_mem_used)
-    total_cpu_cap = cpu_cap * len(nodes_cpu_used)
-    total_mem_cap = mem_cap * len(nodes_cpu_used)
+    """Best-fit decreasing packing of all replicas onto nodes of one instance type.
 
-    nodes: List[NodeBin] = []
-    for idx, (cpu_used, mem_used, alloc_map) in enumerate(
-        zip(nodes_cpu_used, nodes_mem_used, nodes_allocs)
-    ):
-        allocs: List[NodeBinAllocation] = []
-        for (name, ns, kind), reps in alloc_map.items():
-            # find the item spec for cpu/mem per replica
-            itm = next((x for x in items if x.name == name and x.namespace == ns and x.kind == kind), None)
-            cpu_total = (itm.cpu if itm else 0.0) * reps
-            mem_total = (itm.mem if itm else 0.0) * reps
-            allocs.append(
-                NodeBinAllocation(
-                    workload=name,
-                    namespace=ns,
-                    kind=kind,
-                    replicas=reps,
-                    cpu_vcpu=cpu_total,
-                    memory_gb=mem_total,
-                )
-            )
-        nodes.append(
-            NodeBin(
-                index=idx + 1,
-                cpu_capacity=cpu_cap,
-                mem_capacity_gb=mem_cap,
-                cpu_used=cpu_used,
-                mem_used_gb=mem_used,
-                allocations=sorted(allocs, key=lambda a: (a.workload, a.namespace or "")),
-            )
+    Workloads sharing a (name, namespace, kind) key are packed as one entry per request
+    shape (see ``unique_entries``).
+    """
+    packer = IncrementalPacker(
+        instance_type=instance_type,
+        node_cpu_vcpu=node_cpu_vcpu,
+        node_mem_gb=node_mem_gb,
+        overhead_cpu_vcpu=overhead_cpu_vcpu,
+        overhead_mem_gb=overhead_mem_gb,
+    )
+    packer.add_many(
+        unique_entries(
+            ((it.name, it.namespace, it.kind), it.cpu, it.mem, it.replicas)
+            for it in _flatten_items(workloads)
+        )
+    )
+    return packer.result()
+
+
+def _parse_taint(raw: str) -> Taint:
+    key_value, _, effect = raw.partition(":")
+    key, sep, value = key_value.partition("=")
+    if not key:
+        raise ValueError(f"Invalid taint '{raw}'; use key[=value][:effect]")
+    return Taint(key=key, value=value if sep else None, effect=effect or None)
+
+
+def _parse_instance(
+    raw: str, spec: str
+) -> Tuple[str, Optional[float], Optional[float], Optional[float]]:
+    instance, *sizes = raw.split("/")
+    if len(sizes) not in (0, 2, 3):
+        raise ValueError(
+            f"Invalid node pool instance '{raw}' in '{spec}'; use INSTANCE[/VCPU/MEM_GB[/PRICE]]"
         )
+    try:
+        values: List[Optional[float]] = [float(v) for v in sizes]
+    except ValueError as e:
+        raise ValueError(f"Invalid node pool size '{raw}' in '{spec}': {e}") from e
+    values += [None] * (3 - len(values))
+    return instance, values[0], values[1], values[2]
+
+
+def parse_node_pool(spec: str) -> NodePool:
+    """Parse ``NAME:INSTANCE[/VCPU/MEM_GB[/PRICE]][:LABEL=VALUE,...][:TAINT,...]``.
 
+    Sizes and the hourly price default to the pricing catalog entry of the instance.
+    Taints are ``key[=value][:effect]``; e.g.
+    ``gpu:g5.xlarge/4/16/1.006:nodegroup=gpu:nvidia.com/gpu=true:NoSchedule``.
+    """
+    parts = spec.split(":", 3)
+    if len(parts) < 2 or not parts[0] or not parts[1]:
+        raise ValueError(f"Invalid node pool '{spec}'; use NAME:INSTANCE[:LABELS][:TAINTS]")
+    instance, cpu, mem, price = _parse_instance(parts[1], spec)
+    labels: Dict[str, str] = {}
+    if len(parts) > 2 and parts[2]:
+        for pair in parts[2].split(","):
+            k, sep, v = pair.partition("=")
+            if not k or not sep:
+                raise ValueError(f"Invalid node pool label '{pair}' in '{spec}'; use key=value")
+            labels[k] = v
+    taints: Tuple[Taint, ...] = ()
+    if len(parts) > 3 and parts[3]:
+        taints = tuple(_parse_taint(t) for t in parts[3].split(","))
+    return NodePool(
+        name=parts[0],
+        instance_type=instance,
+        labels=labels,
+        taints=taints,
+        node_cpu_vcpu=cpu,
+        node_mem_gb=mem,
+        hourly_price=price,
+    )
+
+
+def node_labels(pool: NodePool) -> Dict[str, str]:
+    """Labels on a pool's nodes: the well-known kubelet labels plus the pool's own."""
+    return {
+        LABEL_OS: "linux",
+        LABEL_ARCH: "arm64" if _GRAVITON.match(pool.instance_type) else "amd64",
+        LABEL_INSTANCE_TYPE: pool.instance_type,
+        **pool.labels,
+    }
+
+
+def _tolerates(tolerations: Optional[List[Dict[str, str]]], taint: Taint) -> bool:
+    for tol in tolerations or ():
+        if tol.get("effect") and taint.effect and tol["effect"] != taint.effect:
+            continue
+        if tol.get("operator") == "Exists":
+            if not tol.get("key") or tol["key"] == taint.key:
+                return True
+        # A missing operator means Equal; a missing value equals an empty one
+        elif tol.get("key") == taint.key and (tol.get("value") or "") == (taint.value or ""):
+            return True
+    return False
+
+
+def pool_for(workload: WorkloadItem, pools: Sequence[NodePool]) -> Optional[NodePool]:
+    """First pool whose node labels satisfy the nodeSelector and whose taints are tolerated."""
+    selector = workload.node_selector or {}
+    for pool in pools:
+        labels = node_labels(pool) if selector else pool.labels
+        if any(labels.get(k) != v for k, v in selector.items()):
+            continue
+        if all(_tolerates(workload.tolerations, t) for t in pool.taints):
+            return pool
+    return None
+
+
+def partition_workloads(
+    workloads: List[WorkloadItem], pools: Sequence[NodePool]
+) -> Tuple[Dict[str, List[WorkloadItem]], List[WorkloadItem]]:
+    """Split workloads by node pool; returns (pool name -> workloads, unschedulable)."""
+    parts: Dict[str, List[WorkloadItem]] = {p.name: [] for p in pools}
+    unmatched: List[WorkloadItem] = []
+    for w in workloads:
+        pool = pool_for(w, pools)
+        if pool is None:
+            unmatched.append(w)
+        else:
+            parts[pool.name].append(w)
+    return parts, unmatched
+
+
+def _pack_partition(
+    args: Tuple[NodePool, List[WorkloadItem], float, float]
+) -> BinPackingResult:
+    pool, workloads, overhead_cpu, overhead_mem = args
+    res = simulate_binpack(
+        workloads,
+        instance_type=pool.instance_type,
+        node_cpu_vcpu=float(pool.node_cpu_vcpu or 0.0),
+        node_mem_gb=float(pool.node_mem_gb or 0.0),
+        overhead_cpu_vcpu=overhead_cpu,
+        overhead_mem_gb=overhead_mem,
+    )
+    res.pool = pool.name
+    for n in res.nodes:
+        n.pool = pool.name
+    return res
+
+
+def simulate_binpack_pools(
+    workloads: List[WorkloadItem],
+    pools: Sequence[NodePool],
+    *,
+    overhead_cpu_vcpu: float = 0.2,
+    overhead_mem_gb: float = 0.5,
+    workers: Optional[int] = None,
+) -> Tuple[BinPackingResult, List[WorkloadItem]]:
+    """Pack each node pool independently and merge the results.
+
+    Pools must have ``node_cpu_vcpu``/``node_mem_gb`` resolved. Partitions are packed in
+    worker processes when there is enough work to amortize them. Returns the merged
+    result (with per-pool results in ``pools``) and the workloads no pool can host.
+    """
+    parts, unmatched = partition_workloads(workloads, pools)
+    jobs = [
+        (pool, parts[pool.name], float(overhead_cpu_vcpu), float(overhead_mem_gb))
+        for pool in pools
+        if parts[pool.name]
+    ]
+    total_replicas = sum(w.replicas for w in workloads)
+    if len(jobs) > 1 and workers != 1 and total_replicas >= PARALLEL_MIN_REPLICAS:
+        with ProcessPoolExecutor(max_workers=workers or min(len(jobs), 8)) as ex:
+            results = list(ex.map(_pack_partition, jobs))
+    else:
+        results = [_pack_partition(job) for job in jobs]
+    return merge_pool_results(results, overhead_cpu_vcpu, overhead_mem_gb), unmatched
+
+
+def merge_pool_results(
+    results: List[BinPackingResult], overhead_cpu_vcpu: float, overhead_mem_gb: float
+) -> BinPackingResult:
+    nodes: List[NodeBin] = []
+    cpu_used = mem_used = cpu_cap = mem_cap = 0.0
+    for res in results:
+        for n in res.nodes:
+            nodes.append(replace(n, index=len(nodes) + 1))
+            cpu_used += n.cpu_used
+            mem_used += n.mem_used_gb
+        cpu_cap += res.cpu_capacity_per_node * res.node_count
+        mem_cap += res.mem_capacity_gb_per_node * res.node_count
+    count = len(nodes)
+    instance_types = sorted({r.instance_type for r in results})
     return BinPackingResult(
-        instance_type=instance_type,
-        node_count=len(nodes),
-        cpu_capacity_per_node=cpu_cap,
-        mem_capacity_gb_per_node=mem_cap,
+        instance_type=",".join(instance_types),
+        node_count=count,
+        # Mixed pools: capacities are per-node averages
+        cpu_capacity_per_node=cpu_cap / count if count else 0.0,
+        mem_capacity_gb_per_node=mem_cap / count if count else 0.0,
         overhead_cpu_vcpu=float(overhead_cpu_vcpu),
         overhead_mem_gb=float(overhead_mem_gb),
-        cpu_utilization=(total_cpu_used / total_cpu_cap) if total_cpu_cap > 0 else 0.0,
-        mem_utilization=(total_mem_used / total_mem_cap) if total_mem_cap > 0 else 0.0,
+        cpu_utilization=cpu_used / cpu_cap if cpu_cap > 0 else 0.0,
+        mem_utilization=mem_used / mem_cap if mem_cap > 0 else 0.0,
         nodes=nodes,
+        # Per-pool summaries; their nodes are listed once, in the merged result
+        pools=[r.model_copy(update={"nodes": []}) for r in results],
     )
 
+
+def attribute_node_costs(
+    result: BinPackingResult, hourly_prices: Mapping[Optional[str], float]
+) -> None:
+    """Price every node and split its cost over its allocations, in one pass.
+
+    ``hourly_prices`` maps pool names (None for an unpartitioned result) to node prices.
+    Each allocation is charged its dominant share of the node's allocatable capacity,
+    ``max(cpu / cpu capacity, memory / memory capacity)``; the unclaimed remainder is
+    idle. Shares adding up to more than the node (one CPU-heavy and one memory-heavy
+    pod) are scaled down to exactly the node cost. Sets the node, allocated and idle
+    totals on the result and its per-pool summaries.
+    """
+    pools = {p.pool: p for p in result.pools or ()}
+    for summary in [result, *pools.values()]:
+        summary.node_monthly = summary.allocated_monthly = summary.idle_monthly = 0.0
+    for node in result.nodes:
+        price = hourly_prices[node.pool]
+        monthly = price * HOURS_PER_MONTH
+        shares = [
+            max(
+                a.cpu_vcpu / node.cpu_capacity if node.cpu_capacity > 0 else 0.0,
+                a.memory_gb / node.mem_capacity_gb if node.mem_capacity_gb > 0 else 0.0,
+            )
+            for a in node.allocations
+        ]
+        claimed = sum(shares)
+        per_share = monthly / max(1.0, claimed)
+        for a, share in zip(node.allocations, shares):
+            a.monthly_cost = share * per_share
+        node.hourly_price = price
+        node.monthly_cost = monthly
+        node.idle_monthly = monthly * max(0.0, 1.0 - claimed)
+        pool = pools.get(node.pool)
+        for summary in (result,) if pool is None else (result, pool):
+            summary.node_monthly += monthly
+            summary.idle_monthly += node.idle_monthly
+    for summary in [result, *pools.values()]:
+        summary.allocated_monthly = summary.node_monthly - summary.idle_monthly
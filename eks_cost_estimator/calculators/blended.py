@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from eks_cost_estimator.calculators.hpa import (
+    HOURS_PER_MONTH,
+    SimulationError,
+    hourly_replicas,
+    join_hpas,
+)
+from eks_cost_estimator.models.resources import HpaItem, WorkloadItem
+from eks_cost_estimator.models.results import BlendedPricingResult, PricingClassCost, WorkloadCost
+
+
+# Roughly a 1-year, no-upfront Compute Savings Plan
+DEFAULT_COMMITMENT_DISCOUNT = 0.28
+# Node selectors pinning pods to spot capacity (EKS managed node groups, Karpenter)
+CAPACITY_TYPE_LABELS = ("eks.amazonaws.com/capacityType", "karpenter.sh/capacity-type")
+ON_DEMAND, SPOT = "on-demand", "spot"
+CLASSES = (ON_DEMAND, SPOT)
+
+
+def _numpy() -> Any:
+    try:
+        import numpy  # type: ignore
+    except Exception as e:  # noqa: BLE001
+        raise SimulationError(
+            "numpy is required for blended pricing. "
+            "Install with `pip install eks-cost-estimator[sim]`."
+        ) from e
+    return numpy
+
+
+def capacity_class(w: WorkloadItem) -> str:
+    selector = w.node_selector or {}
+    if any(selector.get(label, "").lower() == SPOT for label in CAPACITY_TYPE_LABELS):
+        return SPOT
+    return ON_DEMAND
+
+
+def optimize_commitment(usage: Any, discount: float) -> Tuple[float, float]:
+    """Commitment level minimizing ``sum_h c * (1 - discount) + max(0, usage_h - c)``.
+
+    ``c`` is the on-demand-equivalent spend per hour covered by the commitment. The
+    cost is piecewise linear with kinks at the usage values, so the optimum is one of
+    them (or zero); all are evaluated at once from sorted suffix sums. Returns the level
+    and its total cost over the curve.
+    """
+    np = _numpy()
+    u = np.sort(np.asarray(usage, dtype=np.float64))
+    n = len(u)
+    if n == 0:
+        return 0.0, 0.0
+    levels = np.concatenate(([0.0], u))
+    # Usage at or above levels[k] is u[k - 1:], so overage is its sum minus count * level
+    suffix = np.cumsum(u[::-1])[::-1]
+    above = np.concatenate(([n], np.arange(n, 0, -1)))
+    start = np.concatenate(([0], np.arange(n)))
+    cost = n * levels * (1.0 - discount) + suffix[start] - above * levels
+    best = int(cost.argmin())
+    return float(levels[best]), float(cost[best])
+
+
+def class_usage(
+    workloads: Sequence[WorkloadItem],
+    workload_costs: Sequence[WorkloadCost],
+    hpas: Sequence[HpaItem],
+    profile: Optional[Mapping[str, Tuple[float, ...]]] = None,
+) -> Dict[str, Any]:
+    """Hourly on-demand compute cost over a month for each capacity class.
+
+    Workloads scaled by an HPA follow ``hourly_replicas``; the rest cost the same
+    every hour.
+    """
+    np = _numpy()
+    joined, _ = join_hpas(workloads, hpas)
+    usage = {c: np.zeros(HOURS_PER_MONTH) for c in CLASSES}
+    for i, (w, cost) in enumerate(zip(workloads, workload_costs)):
+        if i not in joined:
+            usage[capacity_class(w)] += cost.hourly
+    if joined:
+        for chunk, replicas in hourly_replicas(workloads, joined, profile):
+            per_replica = np.array(
+                [
+                    workload_costs[i].hourly / workload_costs[i].replicas
+                    if workload_costs[i].replicas
+                    else 0.0
+                    for i in chunk
+                ]
+            )
+            spot = np.array([capacity_class(workloads[i]) == SPOT for i in chunk])
+            cost = replicas * per_replica[:, None]
+            usage[SPOT] += cost[spot].sum(axis=0)
+            usage[ON_DEMAND] += cost[~spot].sum(axis=0)
+    return usage
+
+
+def blended_pricing(
+    workloads: Sequence[WorkloadItem],
+    workload_costs: Sequence[WorkloadCost],
+    hpas: Sequence[HpaItem],
+    *,
+    on_demand_price: float,
+    spot_price: Optional[float] = None,
+    commitment_discount: float = DEFAULT_COMMITMENT_DISCOUNT,
+    profile: Optional[Mapping[str, Tuple[float, ...]]] = None,
+) -> BlendedPricingResult:
+    """Blend on-demand, spot and a commitment discount over the hourly usage curve.
+
+    Spot-pinned workloads cost ``spot_price / on_demand_price`` of on-demand (on-demand
+    without a spot price). The rest are covered by the commitment level that minimizes
+    their monthly cost, paying on-demand for usage above it.
+    """
+    np = _numpy()
+    usage = class_usage(workloads, workload_costs, hpas, profile)
+    od = usage[ON_DEMAND]
+    spot_ratio = spot_price / on_demand_price if spot_price is not None and on_demand_price else 1.0
+
+    level, od_blended = optimize_commitment(od, commitment_discount)
+    covered = float(np.minimum(od, level).sum())
+    od_monthly = float(od.sum())
+    spot_on_demand = float(usage[SPOT].sum())
+    spot_monthly = spot_on_demand * spot_ratio
+    counts = {c: 0 for c in CLASSES}
+    for w in workloads:
+        counts[capacity_class(w)] += 1
+    classes: List[PricingClassCost] = [
+        PricingClassCost(
+            capacity_class=ON_DEMAND,
+            workloads=counts[ON_DEMAND],
+            on_demand_monthly=od_monthly,
+            blended_monthly=od_blended,
+        ),
+        PricingClassCost(
+            capacity_class=SPOT,
+            workloads=counts[SPOT],
+            on_demand_monthly=spot_on_demand,
+            blended_monthly=spot_monthly,
+        ),
+    ]
+    committed = level * HOURS_PER_MONTH
+    return BlendedPricingResult(
+        on_demand_price=on_demand_price,
+        spot_price=spot_price,
+        spot_ratio=spot_ratio,
+        commitment_discount=commitment_discount,
+        commitment_hourly=level,
+        commitment_spend_monthly=committed * (1.0 - commitment_discount),
+        commitment_utilization=covered / committed if committed else 0.0,
+        commitment_coverage=covered / od_monthly if od_monthly else 0.0,
+        on_demand_monthly=od_monthly + spot_on_demand,
+        blended_monthly=od_blended + spot_monthly,
+        classes=classes,
+    )
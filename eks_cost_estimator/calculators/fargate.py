@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from eks_cost_estimator.models.resources import WorkloadItem
+from eks_cost_estimator.models.results import FargatePodSize, FargateResult, WorkloadCost
+
+
+COMPUTE_MODES = ("ec2", "fargate")
+# us-east-1 Linux/x86 on-demand
+DEFAULT_FARGATE_VCPU_HOUR = 0.04048
+DEFAULT_FARGATE_GB_HOUR = 0.004445
+DEFAULT_FARGATE_STORAGE_GB_HOUR = 0.000111
+# Added to every pod's memory for kubelet, kube-proxy and containerd
+FARGATE_POD_OVERHEAD_GIB = 0.25
+FARGATE_INCLUDED_STORAGE_GIB = 20.0
+GB_PER_GIB = 2**30 / 1e9
+UNSUPPORTED_KINDS = frozenset({"DaemonSet"})
+
+# Valid pod sizes: vCPU and the memory (GiB) choices for it
+_TIERS: Tuple[Tuple[float, Tuple[float, ...]], ...] = (
+    (0.25, (0.5, 1.0, 2.0)),
+    (0.5, tuple(float(m) for m in range(1, 5))),
+    (1.0, tuple(float(m) for m in range(2, 9))),
+    (2.0, tuple(float(m) for m in range(4, 17))),
+    (4.0, tuple(float(m) for m in range(8, 31))),
+    (8.0, tuple(float(m) for m in range(16, 61, 4))),
+    (16.0, tuple(float(m) for m in range(32, 121, 8))),
+)
+_TIER_VCPU = [vcpu for vcpu, _ in _TIERS]
+_TIER_MAX_MEM = [mems[-1] for _, mems in _TIERS]  # increasing with vCPU
+# Configurations sorted by (tier, memory), flattened to one sorted key per entry
+_STRIDE = 1000.0
+_KEYS = [t * _STRIDE + m for t, (_, mems) in enumerate(_TIERS) for m in mems]
+_CONFIGS = [(vcpu, m) for vcpu, mems in _TIERS for m in mems]
+_EPS = 1e-9
+
+
+def fargate_size(cpu_vcpu: float, memory_gib: float) -> Optional[Tuple[float, float]]:
+    """Smallest (cheapest) valid (vCPU, memory GiB) configuration covering the request.
+
+    The tier is the first with enough vCPU and a large enough memory range; within it,
+    the first memory choice at or above the request. None when nothing is large enough.
+    """
+    tier = max(
+        bisect_left(_TIER_VCPU, cpu_vcpu - _EPS), bisect_left(_TIER_MAX_MEM, memory_gib - _EPS)
+    )
+    if tier >= len(_TIERS):
+        return None
+    return _CONFIGS[bisect_left(_KEYS, tier * _STRIDE + memory_gib - _EPS)]
+
+
+def fargate_costs(
+    workloads: List[WorkloadItem],
+    *,
+    vcpu_hour: float = DEFAULT_FARGATE_VCPU_HOUR,
+    gb_hour: float = DEFAULT_FARGATE_GB_HOUR,
+    storage_gb_hour: float = DEFAULT_FARGATE_STORAGE_GB_HOUR,
+) -> Tuple[List[WorkloadCost], Dict[str, float], FargateResult, List[WorkloadItem]]:
+    """Price every replica as a Fargate pod, in the shape of ``compute_costs``.
+
+    Each pod's summed requests plus the 256 MiB Fargate overhead are rounded up to a
+    valid configuration; ephemeral storage beyond the included 20 GiB is billed per
+    GiB-hour. Sizes are looked up once per distinct request shape. DaemonSets and
+    pods larger than the biggest configuration cost nothing and are returned as
+    unsupported.
+    """
+    items: List[WorkloadCost] = []
+    sizes: List[FargatePodSize] = []
+    unsupported: List[WorkloadItem] = []
+    shapes: Dict[Tuple[float, float], Optional[Tuple[float, float]]] = {}
+    total_hourly = 0.0
+    requested_vcpu = requested_gib = billed_vcpu = billed_gib = 0.0
+
+    for w in workloads:
+        size = None
+        if w.kind not in UNSUPPORTED_KINDS:
+            shape = (w.cpu_vcpu_per_replica, w.memory_gb_per_replica)
+            if shape not in shapes:
+                shapes[shape] = fargate_size(
+                    shape[0], shape[1] / GB_PER_GIB + FARGATE_POD_OVERHEAD_GIB
+                )
+            size = shapes[shape]
+        hourly = 0.0
+        if size is None:
+            unsupported.append(w)
+        else:
+            vcpu, gib = size
+            storage_gib = max(
+                0.0, w.ephemeral_storage_gb_per_replica / GB_PER_GIB - FARGATE_INCLUDED_STORAGE_GIB
+            )
+            per_pod = vcpu * vcpu_hour + gib * gb_hour + storage_gib * storage_gb_hour
+            hourly = per_pod * w.replicas
+            requested_vcpu += w.cpu_vcpu_per_replica * w.replicas
+            requested_gib += w.memory_gb_per_replica / GB_PER_GIB * w.replicas
+            billed_vcpu += vcpu * w.replicas
+            billed_gib += gib * w.replicas
+            sizes.append(
+                FargatePodSize(
+                    name=w.name,
+                    namespace=w.namespace,
+                    kind=w.kind,
+                    replicas=w.replicas,
+                    vcpu=vcpu,
+                    memory_gib=gib,
+                    billed_storage_gib=storage_gib,
+                    hourly_per_pod=per_pod,
+                )
+            )
+        total_hourly += hourly
+        items.append(
+            WorkloadCost(
+                name=w.name,
+                namespace=w.namespace,
+                kind=w.kind,
+                replicas=w.replicas,
+                cpu_vcpu_per_replica=w.cpu_vcpu_per_replica,
+                memory_gb_per_replica=w.memory_gb_per_replica,
+                hourly=hourly,
+                monthly=hourly * 720.0,
+            )
+        )
+
+    result = FargateResult(
+        vcpu_hour=vcpu_hour,
+        gb_hour=gb_hour,
+        storage_gb_hour=storage_gb_hour,
+        pods=sizes,
+        requested_vcpu=requested_vcpu,
+        requested_memory_gib=requested_gib,
+        billed_vcpu=billed_vcpu,
+        billed_memory_gib=billed_gib,
+        unsupported=len(unsupported),
+    )
+    totals = {"hourly": total_hourly, "monthly": total_hourly * 720.0}
+    return items, totals, result, unsupported
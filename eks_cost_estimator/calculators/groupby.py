@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from eks_cost_estimator.models.resources import ServiceItem, StorageItem, WorkloadItem
+from eks_cost_estimator.models.results import (
+    GroupCost,
+    LoadBalancerCost,
+    StorageCost,
+    WorkloadCost,
+)
+
+
+GROUP_FIELDS = {"namespace", "kind", "name"}
+LABEL_PREFIX = "label:"
+MISSING_VALUE = "(none)"
+
+# Accumulator slots per group
+_COMPUTE_H, _COMPUTE_M, _STORAGE_H, _STORAGE_M, _LB_H, _LB_M = range(6)
+
+
+def parse_group_by(spec: str | Sequence[str]) -> Tuple[str, ...]:
+    """Parse ``namespace,label:team`` into validated group keys."""
+    tokens = spec.split(",") if isinstance(spec, str) else list(spec)
+    keys: List[str] = []
+    for raw in tokens:
+        token = raw.strip()
+        if not token:
+            continue
+        if token.startswith(LABEL_PREFIX):
+            if not token[len(LABEL_PREFIX) :]:
+                raise ValueError(f"Empty label name in group key '{token}'")
+        elif token not in GROUP_FIELDS:
+            raise ValueError(
+                f"Unknown group key '{token}'. Use {', '.join(sorted(GROUP_FIELDS))} or label:<key>"
+            )
+        keys.append(token)
+    return tuple(keys)
+
+
+def label_keys_for(group_by: Iterable[str]) -> Set[str]:
+    return {k[len(LABEL_PREFIX) :] for k in group_by if k.startswith(LABEL_PREFIX)}
+
+
+class GroupAggregator:
+    """Hash aggregation of hourly/monthly costs per group key.
+
+    Runs one pass over the priced rows and keeps one six-slot accumulator per distinct
+    group, with no reference to the rows themselves. Those rows are the per-resource
+    lists ``EstimationResult`` reports anyway, so grouping adds only the accumulators.
+    """
+
+    def __init__(self, group_by: Sequence[str]) -> None:
+        self.group_by = tuple(group_by)
+        self._groups: Dict[Tuple[str, ...], List[float]] = {}
+
+    def _key(
+        self, name: str, namespace: Optional[str], kind: str, labels: Optional[Dict[str, str]]
+    ) -> Tuple[str, ...]:
+        values: List[str] = []
+        for k in self.group_by:
+            if k == "namespace":
+                values.append(namespace or MISSING_VALUE)
+            elif k == "kind":
+                values.append(kind)
+            elif k == "name":
+                values.append(name)
+            else:
+                values.append((labels or {}).get(k[len(LABEL_PREFIX) :], MISSING_VALUE))
+        return tuple(values)
+
+    def _add(self, key: Tuple[str, ...], slot: int, hourly: float, monthly: float) -> None:
+        acc = self._groups.get(key)
+        if acc is None:
+            acc = self._groups[key] = [0.0] * 6
+        acc[slot] += hourly
+        acc[slot + 1] += monthly
+
+    def add_workloads(self, items: Iterable[WorkloadItem], costs: Iterable[WorkloadCost]) -> None:
+        for item, cost in zip(items, costs):
+            key = self._key(item.name, item.namespace, item.kind, item.labels)
+            self._add(key, _COMPUTE_H, cost.hourly, cost.monthly)
+
+    def add_storage(self, items: Iterable[StorageItem], costs: Iterable[StorageCost]) -> None:
+        for item, cost in zip(items, costs):
+            key = self._key(item.name, item.namespace, item.kind, item.labels)
+            self._add(key, _STORAGE_H, cost.hourly, cost.monthly)
+
+    def add_load_balancers(
+        self, services: Iterable[ServiceItem], costs: Iterable[LoadBalancerCost]
+    ) -> None:
+        # elb_costs only prices LoadBalancer services; align on the same filter
+        lbs = (s for s in services if s.service_type.lower() == "loadbalancer")
+        for svc, cost in zip(lbs, costs):
+            key = self._key(svc.name, svc.namespace, svc.kind, svc.labels)
+            self._add(key, _LB_H, cost.hourly, cost.monthly)
+
+    def results(self) -> List[GroupCost]:
+        out: List[GroupCost] = []
+        for key, acc in self._groups.items():
+            out.append(
+                GroupCost(
+                    key=dict(zip(self.group_by, key)),
+                    compute_hourly=acc[_COMPUTE_H],
+                    compute_monthly=acc[_COMPUTE_M],
+                    storage_hourly=acc[_STORAGE_H],
+                    storage_monthly=acc[_STORAGE_M],
+                    lb_hourly=acc[_LB_H],
+                    lb_monthly=acc[_LB_M],
+                    total_hourly=acc[_COMPUTE_H] + acc[_STORAGE_H] + acc[_LB_H],
+                    total_monthly=acc[_COMPUTE_M] + acc[_STORAGE_M] + acc[_LB_M],
+                )
+            )
+        out.sort(key=lambda g: g.total_monthly, reverse=True)
+        return out
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from eks_cost_estimator.core.exceptions import EstimatorError
+from eks_cost_estimator.models.resources import HpaItem, WorkloadItem
+from eks_cost_estimator.models.results import HpaSimulationResult, HpaWorkloadCost
+
+
+HOURS_PER_MONTH = 720
+PROFILE_LENGTHS = (24, 168, HOURS_PER_MONTH)  # daily, weekly or monthly, hour by hour
+DEFAULT_PROFILE_KEY = "default"
+# autoscaling/v1 default targetCPUUtilizationPercentage
+DEFAULT_TARGET_UTILIZATION = 0.8
+# Rows simulated per NumPy pass: bounds the (rows x 720) temporaries to ~50 MB each
+CHUNK_ROWS = 8192
+
+LoadProfile = Dict[str, Tuple[float, ...]]
+
+
+class SimulationError(EstimatorError):
+    """Raised when a simulation cannot run (bad load profile, missing NumPy)."""
+
+
+def _numpy() -> Any:
+    try:
+        import numpy  # type: ignore
+    except Exception as e:  # noqa: BLE001
+        raise SimulationError(
+            "numpy is required for HPA simulation. "
+            "Install with `pip install eks-cost-estimator[sim]`."
+        ) from e
+    return numpy
+
+
+def _check_series(key: str, values: Sequence[object]) -> Tuple[float, ...]:
+    try:
+        series = tuple(float(v) for v in values)  # type: ignore[arg-type]
+    except (TypeError, ValueError) as e:
+        raise SimulationError(f"Load profile '{key}': values must be numbers") from e
+    if len(series) not in PROFILE_LENGTHS:
+        raise SimulationError(
+            f"Load profile '{key}': expected 24, 168 or 720 hourly values, got {len(series)}"
+        )
+    if any(v < 0 for v in series):
+        raise SimulationError(f"Load profile '{key}': values must be >= 0")
+    return series
+
+
+def read_load_profile(path: Path) -> LoadProfile:
+    """Read hourly CPU utilization fractions from JSON or plain text.
+
+    JSON is either a list of values or an object mapping ``namespace/name``, ``name`` or
+    ``default`` to lists. Text files hold values separated by commas or whitespace;
+    ``#`` starts a comment. Series of 24 or 168 values repeat over the month.
+    """
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+    except OSError as e:
+        raise SimulationError(f"Cannot read load profile {path}: {e}") from e
+    if text.lstrip().startswith(("[", "{")):
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise SimulationError(f"Load profile {path}: {e}") from e
+        if isinstance(data, list):
+            return {DEFAULT_PROFILE_KEY: _check_series(DEFAULT_PROFILE_KEY, data)}
+        if not isinstance(data, dict):
+            raise SimulationError(f"Load profile {path}: expected a list or an object")
+        return {
+            str(k): _check_series(str(k), v if isinstance(v, list) else [v])
+            for k, v in data.items()
+        }
+    values = [
+        tok
+        for line in text.splitlines()
+        for tok in re.split(r"[,\s]+", line.split("#", 1)[0])
+        if tok
+    ]
+    return {DEFAULT_PROFILE_KEY: _check_series(DEFAULT_PROFILE_KEY, values)}
+
+
+def join_hpas(
+    workloads: Sequence[WorkloadItem], hpas: Sequence[HpaItem]
+) -> Tuple[Dict[int, HpaItem], List[HpaItem]]:
+    """Map workload indexes to the HPA scaling them; also return HPAs without a target."""
+    index = {(w.kind, w.namespace, w.name): i for i, w in enumerate(workloads)}
+    joined: Dict[int, HpaItem] = {}
+    unmatched: List[HpaItem] = []
+    for hpa in hpas:
+        i = index.get((hpa.target_kind, hpa.namespace, hpa.target_name))
+        if i is None:
+            unmatched.append(hpa)
+        else:
+            joined[i] = hpa
+    return joined, unmatched
+
+
+def _profile_key(profile: Mapping[str, Tuple[float, ...]], w: WorkloadItem) -> Optional[str]:
+    if w.namespace and f"{w.namespace}/{w.name}" in profile:
+        return f"{w.namespace}/{w.name}"
+    if w.name in profile:
+        return w.name
+    return DEFAULT_PROFILE_KEY if DEFAULT_PROFILE_KEY in profile else None
+
+
+def hourly_replicas(
+    workloads: Sequence[WorkloadItem],
+    joined: Mapping[int, HpaItem],
+    profile: Optional[Mapping[str, Tuple[float, ...]]] = None,
+    *,
+    chunk_rows: int = CHUNK_ROWS,
+) -> Iterator[Tuple[List[int], Any]]:
+    """Yield workload indexes and their (rows x 720) replica counts, chunk by chunk.
+
+    Profile values are the CPU utilization (fraction of requests) an autoscaled
+    workload would run at with its manifest ``replicas``; the HPA then runs
+    ``ceil(replicas * utilization / target)`` replicas, clamped to its bounds.
+    Workloads without a profile run at their target (manifest replicas, clamped).
+    """
+    np = _numpy()
+    # Distinct profile series, tiled to a month; row 0 means "run at target"
+    profile = profile or {}
+    series_index: Dict[Optional[str], int] = {None: 0}
+    series = [np.ones(HOURS_PER_MONTH)]
+    order = sorted(joined)
+    rows: List[int] = []
+    for i in order:
+        key = _profile_key(profile, workloads[i])
+        if key not in series_index:
+            values = np.asarray(profile[key], dtype=np.float64)  # type: ignore[index]
+            series_index[key] = len(series)
+            series.append(np.resize(values, HOURS_PER_MONTH))
+        rows.append(series_index[key])
+    matrix = np.stack(series)
+
+    base = np.array([workloads[i].replicas for i in order], dtype=np.float64)
+    mins = np.array([joined[i].min_replicas for i in order], dtype=np.float64)
+    maxs = np.array([joined[i].max_replicas for i in order], dtype=np.float64)
+    target = np.array(
+        [joined[i].target_cpu_utilization or DEFAULT_TARGET_UTILIZATION for i in order],
+        dtype=np.float64,
+    )
+    # Profile-less rows use utilization == target: scale factor 1
+    scale = np.where(np.array(rows) == 0, 1.0, 1.0 / target) if order else np.zeros(0)
+    for lo in range(0, len(order), chunk_rows):
+        hi = min(len(order), lo + chunk_rows)
+        demand = matrix[rows[lo:hi]] * (base[lo:hi] * scale[lo:hi])[:, None]
+        # Tolerance keeps exact multiples (e.g. 3.0000000001) from rounding up
+        yield order[lo:hi], np.clip(np.ceil(demand - 1e-9), mins[lo:hi, None], maxs[lo:hi, None])
+
+
+def simulate_hpa(
+    workloads: Sequence[WorkloadItem],
+    hpas: Sequence[HpaItem],
+    rates: Mapping[str, float],
+    profile: Optional[Mapping[str, Tuple[float, ...]]] = None,
+    *,
+    chunk_rows: int = CHUNK_ROWS,
+) -> Tuple[HpaSimulationResult, List[HpaItem]]:
+    """Hourly compute cost over a month with autoscaled replica counts.
+
+    Replica counts come from ``hourly_replicas``. Workloads without an HPA contribute
+    their static cost to every hour. Returns the result and the HPAs whose scale
+    target was not found.
+    """
+    np = _numpy()
+    per_vcpu_hour = float(rates["per_vcpu_hour"])
+    per_gb_ram_hour = float(rates["per_gb_ram_hour"])
+    joined, unmatched = join_hpas(workloads, hpas)
+
+    static_hourly = sum(
+        (w.cpu_vcpu_per_replica * per_vcpu_hour + w.memory_gb_per_replica * per_gb_ram_hour)
+        * w.replicas
+        for i, w in enumerate(workloads)
+        if i not in joined
+    )
+
+    order = sorted(joined)
+    n = len(order)
+    mins = np.array([joined[i].min_replicas for i in order], dtype=np.float64)
+    maxs = np.array([joined[i].max_replicas for i in order], dtype=np.float64)
+    per_replica = np.array(
+        [
+            workloads[i].cpu_vcpu_per_replica * per_vcpu_hour
+            + workloads[i].memory_gb_per_replica * per_gb_ram_hour
+            for i in order
+        ],
+        dtype=np.float64,
+    )
+
+    hourly_total = np.full(HOURS_PER_MONTH, static_hourly, dtype=np.float64)
+    mean_replicas = np.zeros(n)
+    peak_replicas = np.zeros(n)
+    expected = np.zeros(n)
+    lo = 0
+    for chunk, replicas in hourly_replicas(workloads, joined, profile, chunk_rows=chunk_rows):
+        hi = lo + len(chunk)
+        cost = replicas * per_replica[lo:hi, None]
+        hourly_total += cost.sum(axis=0)
+        expected[lo:hi] = cost.sum(axis=1)
+        mean_replicas[lo:hi] = replicas.mean(axis=1)
+        peak_replicas[lo:hi] = replicas.max(axis=1)
+        lo = hi
+
+    static_monthly = static_hourly * HOURS_PER_MONTH
+    monthly_min = per_replica * mins * HOURS_PER_MONTH
+    monthly_max = per_replica * maxs * HOURS_PER_MONTH
+    items = [
+        HpaWorkloadCost(
+            name=workloads[i].name,
+            namespace=workloads[i].namespace,
+            kind=workloads[i].kind,
+            hpa=joined[i].name,
+            min_replicas=joined[i].min_replicas,
+            max_replicas=joined[i].max_replicas,
+            mean_replicas=float(mean_replicas[k]),
+            peak_replicas=int(peak_replicas[k]),
+            monthly_min=float(monthly_min[k]),
+            monthly_expected=float(expected[k]),
+            monthly_max=float(monthly_max[k]),
+        )
+        for k, i in enumerate(order)
+    ]
+    items.sort(key=lambda r: r.monthly_expected, reverse=True)
+    peak_hour = int(hourly_total.argmax())
+    result = HpaSimulationResult(
+        hours=HOURS_PER_MONTH,
+        hpa_count=n,
+        monthly_min=static_monthly + float(monthly_min.sum()),
+        monthly_expected=float(hourly_total.sum()),
+        monthly_max=static_monthly + float(monthly_max.sum()),
+        peak_hourly=float(hourly_total[peak_hour]),
+        peak_hour=peak_hour,
+        hourly_expected=hourly_total.tolist(),
+        workloads=items,
+    )
+    return result, unmatched
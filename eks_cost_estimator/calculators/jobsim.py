@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterator, List, Sequence, Set, Tuple, Union
+
+from eks_cost_estimator.calculators.packer import IncrementalPacker, WorkloadKey, unique_entries
+from eks_cost_estimator.models.resources import BatchJobItem, WorkloadItem
+from eks_cost_estimator.models.results import JobSimulationResult
+from eks_cost_estimator.utils.cron import CronSchedule
+
+
+BATCH_KINDS = frozenset({"Job", "CronJob"})
+SIM_START = datetime(2024, 1, 1)  # a Monday; schedules are evaluated in UTC
+DEFAULT_HORIZON_MINUTES = 30 * 1440  # one 720-hour month, as in the cost calculators
+DEFAULT_JOB_DURATION_MINUTES = 10.0
+# cluster-autoscaler's default --scale-down-utilization-threshold
+DEFAULT_SCALE_DOWN_UTILIZATION = 0.5
+
+# Same-minute ordering: pods finish before new runs start, so freed capacity is reused
+_FINISH, _FIRE = 0, 1
+
+
+@dataclass(slots=True)
+class _Run:
+    job: int
+    remaining: int  # completions not started yet
+    deadline_at: int
+    active: int = 0
+    cancelled: bool = False
+
+
+def job_duration_minutes(job: BatchJobItem, default_minutes: float) -> int:
+    """Whole minutes one pod of ``job`` runs: annotation, else default, capped by deadline."""
+    minutes = job.duration_minutes if job.duration_minutes is not None else default_minutes
+    if job.deadline_minutes is not None:
+        minutes = min(minutes, job.deadline_minutes)
+    return max(1, math.ceil(minutes))
+
+
+def simulate_jobs(
+    workloads: Sequence[WorkloadItem],
+    jobs: Sequence[BatchJobItem],
+    *,
+    instance_type: str,
+    node_cpu_vcpu: float,
+    node_mem_gb: float,
+    node_hourly_price: float,
+    overhead_cpu_vcpu: float = 0.2,
+    overhead_mem_gb: float = 0.5,
+    horizon_minutes: int = DEFAULT_HORIZON_MINUTES,
+    default_duration_minutes: float = DEFAULT_JOB_DURATION_MINUTES,
+    start: datetime = SIM_START,
+    scale_down_utilization: float = DEFAULT_SCALE_DOWN_UTILIZATION,
+    repack_every: int = 0,
+) -> JobSimulationResult:
+    """Place and remove Job/CronJob pods over time on top of the long-running workloads.
+
+    Long-running workloads are packed once. Each Job runs once from minute 0; each
+    CronJob starts a run at every firing of its schedule, honoring ``concurrencyPolicy``.
+    A run starts ``parallelism`` pods and replaces finished pods until ``completions``
+    pods have run (or ``activeDeadlineSeconds`` passes). Events are kept in a heap, and
+    the packing is updated once per minute in which something changed, so the cost
+    scales with the number of runs rather than with ``horizon_minutes``. Node counts
+    are integrated over time between events. As with the cluster autoscaler, only nodes
+    left under ``scale_down_utilization`` are drained when pods finish.
+    """
+    packer = IncrementalPacker(
+        instance_type=instance_type,
+        node_cpu_vcpu=node_cpu_vcpu,
+        node_mem_gb=node_mem_gb,
+        overhead_cpu_vcpu=overhead_cpu_vcpu,
+        overhead_mem_gb=overhead_mem_gb,
+        repack_every=repack_every,
+        repair_below=scale_down_utilization,
+    )
+    packer.add_many(
+        unique_entries(
+            (
+                (w.name, w.namespace, w.kind),
+                w.cpu_vcpu_per_replica,
+                w.memory_gb_per_replica,
+                w.replicas,
+            )
+            for w in workloads
+            if w.kind not in BATCH_KINDS
+        )
+    )
+    steady = packer.node_count
+
+    jobs = [j for j in jobs if j.cpu_vcpu_per_pod > 0 and j.memory_gb_per_pod > 0]
+    durations = [job_duration_minutes(j, default_duration_minutes) for j in jobs]
+    # Pods with the same requests are interchangeable for packing: track one packed
+    # workload per request shape, so a busy minute costs one update per shape
+    shape_ids: Dict[Tuple[float, float], int] = {}
+    job_shape = [
+        shape_ids.setdefault((j.cpu_vcpu_per_pod, j.memory_gb_per_pod), len(shape_ids))
+        for j in jobs
+    ]
+    shapes = list(shape_ids)
+    keys: List[WorkloadKey] = [(f"batch-{i}", None, "Job") for i in range(len(shapes))]
+    active = [0] * len(shapes)
+    packed = [0] * len(shapes)
+    live_runs: Dict[int, List[_Run]] = {}
+    firings: Dict[int, Iterator[int]] = {}
+
+    # (minute, event, seq, job index for _FIRE or (run, pods) for _FINISH)
+    heap: List[Tuple[int, int, int, Union[int, Tuple[_Run, int]]]] = []
+    seq = 0
+    for i, job in enumerate(jobs):
+        if job.schedule is None:
+            heap.append((0, _FIRE, seq, i))
+        else:
+            firings[i] = CronSchedule.parse(job.schedule).fire_offsets(start, horizon_minutes)
+            first = next(firings[i], None)
+            if first is not None:
+                heap.append((first, _FIRE, seq, i))
+        seq += 1
+    heapq.heapify(heap)
+
+    dirty: Set[int] = set()
+    job_runs = runs_skipped = pod_starts = 0
+
+    def start_pods(run: _Run, n: int, minute: int) -> None:
+        nonlocal seq, pod_starts
+        run.remaining -= n
+        run.active += n
+        active[job_shape[run.job]] += n
+        pod_starts += n
+        dirty.add(job_shape[run.job])
+        end = min(minute + durations[run.job], run.deadline_at)
+        heapq.heappush(heap, (end, _FINISH, seq, (run, n)))
+        seq += 1
+
+    def fire(i: int, minute: int) -> None:
+        nonlocal seq, job_runs, runs_skipped
+        runs = live_runs.setdefault(i, [])
+        job = jobs[i]
+        if runs and job.concurrency_policy == "Forbid":
+            runs_skipped += 1
+        else:
+            if runs and job.concurrency_policy == "Replace":
+                for old in runs:
+                    old.cancelled = True
+                    active[job_shape[i]] -= old.active
+                runs.clear()
+                dirty.add(job_shape[i])
+            deadline_at = (
+                minute + max(1, math.ceil(job.deadline_minutes))
+                if job.deadline_minutes is not None
+                else horizon_minutes
+            )
+            run = _Run(job=i, remaining=job.completions, deadline_at=deadline_at)
+            runs.append(run)
+            job_runs += 1
+            start_pods(run, min(job.parallelism, run.remaining), minute)
+        nxt = next(firings[i], None) if i in firings else None
+        if nxt is not None:
+            heapq.heappush(heap, (nxt, _FIRE, seq, i))
+            seq += 1
+
+    def finish(run: _Run, n: int, minute: int) -> None:
+        if run.cancelled:
+            return
+        run.active -= n
+        active[job_shape[run.job]] -= n
+        dirty.add(job_shape[run.job])
+        if run.remaining > 0 and minute < run.deadline_at:
+            start_pods(run, min(n, run.remaining), minute)
+        if run.active == 0:
+            live_runs[run.job].remove(run)
+
+    node_minutes = 0.0
+    last_minute = 0
+    current = peak = steady
+    peak_minute = 0
+    while heap and heap[0][0] < horizon_minutes:
+        minute = heap[0][0]
+        node_minutes += current * (minute - last_minute)
+        last_minute = minute
+        while heap and heap[0][0] == minute:
+            _, _, _, payload = heapq.heappop(heap)
+            if isinstance(payload, tuple):
+                finish(payload[0], payload[1], minute)
+            else:
+                fire(payload, minute)
+        # Shrink first so growing shapes reuse the freed capacity, then repair once
+        changed = sorted(
+            (i for i in dirty if active[i] != packed[i]), key=lambda i: active[i] > packed[i]
+        )
+        dirty.clear()
+        with packer.batch():
+            for i in changed:
+                n = active[i]
+                if packed[i] == 0:
+                    packer.add(keys[i], shapes[i][0], shapes[i][1], n)
+                else:
+                    packer.resize(keys[i], replicas=n)
+                packed[i] = n
+        current = packer.node_count
+        if current > peak:
+            peak, peak_minute = current, minute
+    node_minutes += current * (horizon_minutes - last_minute)
+
+    average = node_minutes / horizon_minutes if horizon_minutes else 0.0
+    return JobSimulationResult(
+        instance_type=instance_type,
+        horizon_minutes=horizon_minutes,
+        start=start.isoformat(),
+        batch_workloads=len(jobs),
+        job_runs=job_runs,
+        runs_skipped=runs_skipped,
+        pod_starts=pod_starts,
+        steady_node_count=steady,
+        peak_node_count=peak,
+        peak_minute=peak_minute,
+        average_node_count=average,
+        node_hours=node_minutes / 60.0,
+        monthly_node_cost=average * 720.0 * node_hourly_price,
+    )
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
+
+from eks_cost_estimator.calculators.hpa import HOURS_PER_MONTH, SimulationError
+from eks_cost_estimator.models.resources import HpaItem
+from eks_cost_estimator.models.results import MonteCarloResult, WorkloadCost
+
+
+DEFAULT_TRIALS = 10_000
+DEFAULT_SPOT_DISCOUNT = (0.6, 0.8)  # fraction off the on-demand price
+DEFAULT_BINPACK_EFFICIENCY = (0.7, 0.95)  # requested / purchased node capacity
+PERCENTILES = (50.0, 90.0, 99.0)
+# Replica samples drawn per batch: bounds each (trials x autoscaled workloads) array
+BATCH_ELEMENTS = 4_000_000
+
+
+def _numpy() -> Any:
+    try:
+        import numpy  # type: ignore
+    except Exception as e:  # noqa: BLE001
+        raise SimulationError(
+            "numpy is required for Monte Carlo simulation. "
+            "Install with `pip install eks-cost-estimator[sim]`."
+        ) from e
+    return numpy
+
+
+def parse_range(text: str, *, low: float = 0.0, high: float = 1.0) -> Tuple[float, float]:
+    """Parse ``LO:HI`` (or a single value) within ``[low, high]``."""
+    lo_text, sep, hi_text = text.partition(":")
+    try:
+        lo = float(lo_text)
+        hi = float(hi_text) if sep else lo
+    except ValueError as e:
+        raise ValueError(f"Invalid range '{text}': expected LO:HI") from e
+    if not (low <= lo <= hi <= high):
+        raise ValueError(f"Invalid range '{text}': need {low:g} <= LO <= HI <= {high:g}")
+    return lo, hi
+
+
+@dataclass(frozen=True, slots=True)
+class MonteCarloParams:
+    trials: int = DEFAULT_TRIALS
+    seed: int = 0
+    spot_share: float = 0.0  # share of node capacity bought as spot
+    spot_discount: Tuple[float, float] = DEFAULT_SPOT_DISCOUNT
+    binpack_efficiency: Tuple[float, float] = DEFAULT_BINPACK_EFFICIENCY
+    workers: Optional[int] = None
+
+
+@dataclass(frozen=True, slots=True)
+class _Model:
+    static_hourly: float  # workloads without an HPA
+    per_replica: Tuple[float, ...]  # autoscaled workloads
+    min_replicas: Tuple[int, ...]
+    max_replicas: Tuple[int, ...]
+    fixed_monthly: float  # storage and load balancers
+
+
+def _run_batch(args: Tuple[_Model, MonteCarloParams, Any, int]) -> Any:
+    model, params, seed_seq, size = args
+    np = _numpy()
+    rng = np.random.default_rng(seed_seq)
+    hourly = np.full(size, model.static_hourly)
+    if model.per_replica:
+        replicas = rng.integers(
+            np.asarray(model.min_replicas),
+            np.asarray(model.max_replicas) + 1,
+            size=(size, len(model.per_replica)),
+        )
+        hourly += replicas @ np.asarray(model.per_replica)
+    discount = rng.uniform(*params.spot_discount, size=size)
+    efficiency = rng.uniform(*params.binpack_efficiency, size=size)
+    price_factor = 1.0 - params.spot_share * discount
+    return hourly * HOURS_PER_MONTH * price_factor / efficiency + model.fixed_monthly
+
+
+def run_monte_carlo(
+    workload_costs: Sequence[WorkloadCost],
+    hpas: Mapping[int, HpaItem],
+    *,
+    fixed_monthly: float,
+    params: MonteCarloParams,
+    batch_elements: int = BATCH_ELEMENTS,
+) -> MonteCarloResult:
+    """Sample monthly totals over ``params.trials`` trials.
+
+    Each trial draws, independently: a replica count in ``[minReplicas, maxReplicas]``
+    for every workload in ``hpas`` (keyed by index into ``workload_costs``), a spot
+    discount applied to ``spot_share`` of the compute cost, and a bin-packing
+    efficiency the request-based compute cost (``compute_costs``) is divided by.
+    Storage and load balancer costs are fixed. Trials are drawn in batches with seeds
+    spawned from ``params.seed``, so results don't depend on ``params.workers``.
+    """
+    np = _numpy()
+    if params.trials <= 0:
+        raise SimulationError("Monte Carlo needs at least one trial")
+    per_replica: List[float] = []
+    mins: List[int] = []
+    maxs: List[int] = []
+    static_hourly = 0.0
+    for i, w in enumerate(workload_costs):
+        hpa = hpas.get(i)
+        if hpa is None:
+            static_hourly += w.hourly
+            continue
+        per_replica.append(w.hourly / w.replicas if w.replicas else 0.0)
+        mins.append(hpa.min_replicas)
+        maxs.append(hpa.max_replicas)
+    model = _Model(
+        static_hourly=static_hourly,
+        per_replica=tuple(per_replica),
+        min_replicas=tuple(mins),
+        max_replicas=tuple(maxs),
+        fixed_monthly=fixed_monthly,
+    )
+
+    batch = max(1, min(params.trials, batch_elements // max(1, len(per_replica))))
+    sizes = [min(batch, params.trials - lo) for lo in range(0, params.trials, batch)]
+    seeds = np.random.SeedSequence(params.seed).spawn(len(sizes))
+    jobs = [(model, params, s, n) for s, n in zip(seeds, sizes)]
+    if len(jobs) > 1 and params.workers is not None and params.workers > 1:
+        with ProcessPoolExecutor(max_workers=params.workers) as ex:
+            parts = list(ex.map(_run_batch, jobs))
+    else:
+        parts = [_run_batch(job) for job in jobs]
+    totals = np.concatenate(parts)
+
+    p50, p90, p99 = (float(v) for v in np.percentile(totals, PERCENTILES))
+    return MonteCarloResult(
+        trials=params.trials,
+        seed=params.seed,
+        spot_share=params.spot_share,
+        autoscaled_workloads=len(per_replica),
+        fixed_monthly=fixed_monthly,
+        mean_monthly=float(totals.mean()),
+        std_monthly=float(totals.std()),
+        min_monthly=float(totals.min()),
+        p50_monthly=p50,
+        p90_monthly=p90,
+        p99_monthly=p99,
+        max_monthly=float(totals.max()),
+    )
@@ -0,0 +1,433 @@
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from eks_cost_estimator.models.results import BinPackingResult, NodeBin, NodeBinAllocation
+
+
+WorkloadKey = Tuple[str, Optional[str], str]  # (name, namespace, kind)
+
+_EPS = 1e-9
+DEFAULT_REPACK_EVERY = 1000
+
+
+@dataclass(slots=True)
+class _Node:
+    id: int
+    cpu_used: float = 0.0
+    mem_used: float = 0.0
+    allocs: Dict[WorkloadKey, int] = field(default_factory=dict)
+    order_key: Tuple[float, int] = (0.0, 0)
+    cpu_key: Tuple[float, int] = (0.0, 0)
+    mem_key: Tuple[float, int] = (0.0, 0)
+
+
+@dataclass(slots=True)
+class _Spec:
+    cpu: float
+    mem: float
+    replicas: int
+
+
+def unique_entries(
+    entries: Iterable[Tuple[WorkloadKey, float, float, int]]
+) -> List[Tuple[WorkloadKey, float, float, int]]:
+    """Make ``add_many`` entries safe to pack together.
+
+    Entries sharing a key (two manifests without a name, say) are merged when their
+    per-replica requests match; each further request shape is packed under the name
+    suffixed with ``#2``, ``#3``, ...
+    """
+    merged: Dict[WorkloadKey, Tuple[float, float, int]] = {}
+    packed_keys: Dict[Tuple[WorkloadKey, float, float], WorkloadKey] = {}
+    shapes_per_key: Dict[WorkloadKey, int] = {}
+    for key, cpu, mem, replicas in entries:
+        packed = packed_keys.get((key, cpu, mem))
+        if packed is None:
+            n = shapes_per_key[key] = shapes_per_key.get(key, 0) + 1
+            packed = key if n == 1 else (f"{key[0]}#{n}", key[1], key[2])
+            packed_keys[(key, cpu, mem)] = packed
+            merged[packed] = (cpu, mem, replicas)
+        else:
+            merged[packed] = (cpu, mem, merged[packed][2] + replicas)
+    return [(key, cpu, mem, replicas) for key, (cpu, mem, replicas) in merged.items()]
+
+
+class NodeIndex:
+    """Best-fit lookup over nodes kept in lists sorted by leftover capacity.
+
+    Subclasses set ``cpu_cap``/``mem_cap`` and the ``_nodes``, ``_order``, ``_by_cpu`` and
+    ``_by_mem`` containers; nodes carry ``id``, ``cpu_used``, ``mem_used`` and the three
+    sort keys. The best fit for a request is the first node from the bisection point of
+    the leftover CPU + memory list that fits in both dimensions; when one resource is
+    nearly exhausted cluster-wide, the (short) range of nodes with enough of that
+    resource is scanned instead.
+    """
+
+    cpu_cap: float
+    mem_cap: float
+    _nodes: Dict[int, Any]
+    _order: List[Tuple[float, int]]
+    _by_cpu: List[Tuple[float, int]]
+    _by_mem: List[Tuple[float, int]]
+
+    def _index(self, node: Any) -> None:
+        cpu_left = self.cpu_cap - node.cpu_used
+        mem_left = self.mem_cap - node.mem_used
+        node.order_key = (cpu_left + mem_left, node.id)
+        node.cpu_key = (cpu_left, node.id)
+        node.mem_key = (mem_left, node.id)
+        insort(self._order, node.order_key)
+        insort(self._by_cpu, node.cpu_key)
+        insort(self._by_mem, node.mem_key)
+
+    def _unindex(self, node: Any) -> None:
+        del self._order[bisect_left(self._order, node.order_key)]
+        del self._by_cpu[bisect_left(self._by_cpu, node.cpu_key)]
+        del self._by_mem[bisect_left(self._by_mem, node.mem_key)]
+
+    def _best_node(self, cpu: float, mem: float, exclude: int = -1) -> Optional[Any]:
+        cpu_limit = self.cpu_cap + _EPS - cpu
+        mem_limit = self.mem_cap + _EPS - mem
+        if cpu_limit < 0 or mem_limit < 0:
+            return None  # Larger than an empty node: always gets its own
+        nodes = self._nodes
+        # Only nodes from these offsets have enough of each resource on its own
+        cpu_start = bisect_left(self._by_cpu, (cpu - 2 * _EPS, -1))
+        mem_start = bisect_left(self._by_mem, (mem - 2 * _EPS, -1))
+        narrow, start = min(
+            (self._by_cpu, cpu_start), (self._by_mem, mem_start), key=lambda r: len(r[0]) - r[1]
+        )
+        budget = len(narrow) - start
+
+        # Lowest leftover that can still hold cpu + mem is the best fit
+        order = self._order
+        first = bisect_left(order, (cpu + mem - 2 * _EPS, -1))
+        for i in range(first, min(len(order), first + budget)):
+            nid = order[i][1]
+            if nid == exclude:
+                continue
+            node = nodes[nid]
+            if node.cpu_used <= cpu_limit and node.mem_used <= mem_limit:
+                return node
+        if first + budget >= len(order):
+            return None
+
+        # Long walk: scan the nodes that fit the scarcer resource instead
+        best: Optional[Any] = None
+        for i in range(start, len(narrow)):
+            nid = narrow[i][1]
+            if nid == exclude:
+                continue
+            node = nodes[nid]
+            if node.cpu_used <= cpu_limit and node.mem_used <= mem_limit:
+                if best is None or node.order_key < best.order_key:
+                    best = node
+        return best
+
+
+class IncrementalPacker(NodeIndex):
+    """Best-fit bin-packing state that can be updated one workload at a time.
+
+    Replicas go to the best-fit node (see ``NodeIndex``). Each workload remembers which
+    nodes hold its replicas: removing or shrinking it only touches those nodes, which
+    are then drained into the remaining nodes when possible (local repair). Every
+    ``repack_every`` updates the whole state is repacked from scratch to bound drift
+    from a full best-fit-decreasing packing.
+    """
+
+    def __init__(
+        self,
+        *,
+        instance_type: str,
+        node_cpu_vcpu: float,
+        node_mem_gb: float,
+        overhead_cpu_vcpu: float = 0.2,
+        overhead_mem_gb: float = 0.5,
+        repack_every: int = DEFAULT_REPACK_EVERY,
+        repair_below: float = 1.0,
+    ) -> None:
+        self.instance_type = instance_type
+        self.overhead_cpu_vcpu = float(overhead_cpu_vcpu)
+        self.overhead_mem_gb = float(overhead_mem_gb)
+        self.cpu_cap = max(0.0, float(node_cpu_vcpu) - self.overhead_cpu_vcpu)
+        self.mem_cap = max(0.0, float(node_mem_gb) - self.overhead_mem_gb)
+        self.repack_every = repack_every
+        # Only nodes whose busier resource is under this fraction are drained on shrink
+        self.repair_below = float(repair_below)
+        self.updates_since_repack = 0
+        self._specs: Dict[WorkloadKey, _Spec] = {}
+        self._placement: Dict[WorkloadKey, Dict[int, int]] = {}
+        self._nodes: Dict[int, _Node] = {}
+        self._order: List[Tuple[float, int]] = []
+        self._by_cpu: List[Tuple[float, int]] = []
+        self._by_mem: List[Tuple[float, int]] = []
+        self._next_id = 0
+        self._deferred: Optional[Set[int]] = None
+
+    def _new_node(self) -> _Node:
+        node = _Node(id=self._next_id)
+        self._next_id += 1
+        self._nodes[node.id] = node
+        self._index(node)
+        return node
+
+    def _assign(self, node: _Node, key: WorkloadKey, spec: _Spec, n: int) -> None:
+        self._unindex(node)
+        node.cpu_used += spec.cpu * n
+        node.mem_used += spec.mem * n
+        node.allocs[key] = node.allocs.get(key, 0) + n
+        placement = self._placement.setdefault(key, {})
+        placement[node.id] = placement.get(node.id, 0) + n
+        self._index(node)
+
+    def _unassign(self, node: _Node, key: WorkloadKey, spec: _Spec, n: int) -> None:
+        self._unindex(node)
+        left = node.allocs[key] - n
+        if left:
+            node.allocs[key] = left
+            self._placement[key][node.id] = left
+        else:
+            del node.allocs[key]
+            del self._placement[key][node.id]
+        if node.allocs:
+            node.cpu_used -= spec.cpu * n
+            node.mem_used -= spec.mem * n
+            self._index(node)
+        else:
+            del self._nodes[node.id]
+
+    def _fit_count(self, node: _Node, spec: _Spec, limit: int) -> int:
+        """How many more replicas of ``spec`` fit on ``node`` (at least 1, at most limit)."""
+        n = limit
+        if spec.cpu > 0:
+            n = min(n, int((self.cpu_cap + _EPS - node.cpu_used) // spec.cpu))
+        if spec.mem > 0:
+            n = min(n, int((self.mem_cap + _EPS - node.mem_used) // spec.mem))
+        while n > 1 and (
+            node.cpu_used + spec.cpu * n > self.cpu_cap + _EPS
+            or node.mem_used + spec.mem * n > self.mem_cap + _EPS
+        ):
+            n -= 1
+        return max(1, n)
+
+    def _place(self, key: WorkloadKey, spec: _Spec, replicas: int) -> None:
+        # The best-fit node stays the best fit while it has room (its leftover only
+        # shrinks), so it is filled with as many replicas as fit in one step. Once no
+        # node fits, none will until something is removed: the rest go to new nodes.
+        full = False
+        while replicas > 0:
+            node = None if full else self._best_node(spec.cpu, spec.mem)
+            if node is None:
+                full = True
+                node = self._new_node()
+            n = self._fit_count(node, spec, replicas)
+            self._assign(node, key, spec, n)
+            replicas -= n
+
+    def _drain(self, node_id: int) -> bool:
+        """Move every replica off ``node_id`` into other nodes, or change nothing."""
+        node = self._nodes.get(node_id)
+        if node is None:
+            return True
+        moves: List[Tuple[_Node, WorkloadKey]] = []
+        replicas = sorted(
+            ((k, self._specs[k]) for k, n in node.allocs.items() for _ in range(n)),
+            key=lambda ks: ks[1].cpu + ks[1].mem,
+            reverse=True,
+        )
+        for key, spec in replicas:
+            target = self._best_node(spec.cpu, spec.mem, exclude=node_id)
+            if target is None:
+                for moved_to, moved_key in reversed(moves):
+                    self._unassign(moved_to, moved_key, self._specs[moved_key], 1)
+                return False
+            self._assign(target, key, spec, 1)
+            moves.append((target, key))
+        for key, n in list(node.allocs.items()):
+            self._unassign(node, key, self._specs[key], n)
+        return True
+
+    def _repair(self, node_ids: Iterable[int]) -> None:
+        if self._deferred is not None:
+            self._deferred.update(node_ids)
+            return
+        live = [self._nodes[i] for i in set(node_ids) if i in self._nodes and self._underused(i)]
+        for node in sorted(live, key=lambda n: n.cpu_used + n.mem_used):
+            self._drain(node.id)
+
+    def _underused(self, node_id: int) -> bool:
+        if self.repair_below >= 1.0:
+            return True
+        node = self._nodes[node_id]
+        return (
+            node.cpu_used < self.repair_below * self.cpu_cap
+            and node.mem_used < self.repair_below * self.mem_cap
+        )
+
+    def _touch(self) -> None:
+        self.updates_since_repack += 1
+        if self.repack_every and self.updates_since_repack >= self.repack_every:
+            self.repack()
+
+    # -- public API -------------------------------------------------------------------
+
+    def _sort_key(self, spec: _Spec) -> Tuple[float, float]:
+        frac_cpu = spec.cpu / self.cpu_cap if self.cpu_cap > 0 else 1.0
+        frac_mem = spec.mem / self.mem_cap if self.mem_cap > 0 else 1.0
+        return (max(frac_cpu, frac_mem), spec.cpu + spec.mem)
+
+    def add_many(self, workloads: Iterable[Tuple[WorkloadKey, float, float, int]]) -> None:
+        """Bulk-add workloads, largest first (best-fit decreasing)."""
+        batch: List[Tuple[WorkloadKey, _Spec]] = []
+        for key, cpu, mem, replicas in workloads:
+            if cpu <= 0 or mem <= 0 or replicas <= 0:
+                continue
+            if key in self._specs:
+                raise ValueError(f"Workload already packed: {key}")
+            spec = _Spec(cpu=float(cpu), mem=float(mem), replicas=int(replicas))
+            self._specs[key] = spec
+            batch.append((key, spec))
+        batch.sort(key=lambda ks: self._sort_key(ks[1]), reverse=True)
+        for key, spec in batch:
+            self._place(key, spec, spec.replicas)
+
+    def add(self, key: WorkloadKey, cpu: float, mem: float, replicas: int) -> None:
+        self.add_many([(key, cpu, mem, replicas)])
+        self._touch()
+
+    def remove(self, key: WorkloadKey) -> None:
+        spec = self._specs.get(key)
+        if spec is None:
+            return
+        placement = dict(self._placement.get(key, {}))
+        for node_id, n in placement.items():
+            self._unassign(self._nodes[node_id], key, spec, n)
+        del self._placement[key]
+        del self._specs[key]
+        self._repair(placement)
+        self._touch()
+
+    def resize(
+        self,
+        key: WorkloadKey,
+        *,
+        replicas: Optional[int] = None,
+        cpu: Optional[float] = None,
+        mem: Optional[float] = None,
+    ) -> None:
+        """Change a workload's replica count and/or per-replica requests."""
+        spec = self._specs.get(key)
+        if spec is None:
+            raise KeyError(key)
+        new_cpu = spec.cpu if cpu is None else float(cpu)
+        new_mem = spec.mem if mem is None else float(mem)
+        new_replicas = spec.replicas if replicas is None else int(replicas)
+        if (new_cpu, new_mem) != (spec.cpu, spec.mem) or new_replicas <= 0:
+            self.remove(key)
+            if new_replicas > 0:
+                self.add(key, new_cpu, new_mem, new_replicas)
+            return
+        delta = new_replicas - spec.replicas
+        spec.replicas = new_replicas
+        if delta > 0:
+            self._place(key, spec, delta)
+        elif delta < 0:
+            # Shrink on the emptiest hosting nodes first: they are the likeliest to free up
+            placement = self._placement[key]
+            # At most -delta hosts are needed, each holding at least one replica
+            hosts = heapq.nlargest(-delta, placement, key=lambda i: self._nodes[i].order_key)
+            touched: List[int] = []
+            remaining = -delta
+            for node_id in hosts:
+                n = min(remaining, placement[node_id])
+                self._unassign(self._nodes[node_id], key, spec, n)
+                touched.append(node_id)
+                remaining -= n
+                if not remaining:
+                    break
+            self._repair(touched)
+        self._touch()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer local repair to the end of a group of updates.
+
+        Nodes shrunk inside the block are repaired once on exit, after later additions
+        have had a chance to reuse the freed capacity.
+        """
+        if self._deferred is not None:
+            yield
+            return
+        self._deferred = set()
+        try:
+            yield
+        finally:
+            pending, self._deferred = self._deferred, None
+            self._repair(pending)
+
+    def repack(self) -> None:
+        """Rebuild the packing from scratch (best-fit decreasing over all workloads)."""
+        specs = self._specs
+        self._specs = {}
+        self._placement = {}
+        self._nodes = {}
+        self._order = []
+        self._by_cpu = []
+        self._by_mem = []
+        self._next_id = 0
+        self.updates_since_repack = 0
+        if self._deferred is not None:
+            self._deferred.clear()
+        self.add_many((k, s.cpu, s.mem, s.replicas) for k, s in specs.items())
+
+    @property
+    def node_count(self) -> int:
+        return len(self._nodes)
+
+    def result(self) -> BinPackingResult:
+        nodes: List[NodeBin] = []
+        total_cpu_used = 0.0
+        total_mem_used = 0.0
+        for idx, node in enumerate(self._nodes.values()):
+            allocs = [
+                NodeBinAllocation(
+                    workload=name,
+                    namespace=ns,
+                    kind=kind,
+                    replicas=reps,
+                    cpu_vcpu=self._specs[(name, ns, kind)].cpu * reps,
+                    memory_gb=self._specs[(name, ns, kind)].mem * reps,
+                )
+                for (name, ns, kind), reps in node.allocs.items()
+            ]
+            allocs.sort(key=lambda a: (a.workload, a.namespace or ""))
+            total_cpu_used += node.cpu_used
+            total_mem_used += node.mem_used
+            nodes.append(
+                NodeBin(
+                    index=idx + 1,
+                    cpu_capacity=self.cpu_cap,
+                    mem_capacity_gb=self.mem_cap,
+                    cpu_used=node.cpu_used,
+                    mem_used_gb=node.mem_used,
+                    allocations=allocs,
+                )
+            )
+        total_cpu_cap = self.cpu_cap * len(nodes)
+        total_mem_cap = self.mem_cap * len(nodes)
+        return BinPackingResult(
+            instance_type=self.instance_type,
+            node_count=len(nodes),
+            cpu_capacity_per_node=self.cpu_cap,
+            mem_capacity_gb_per_node=self.mem_cap,
+            overhead_cpu_vcpu=self.overhead_cpu_vcpu,
+            overhead_mem_gb=self.overhead_mem_gb,
+            cpu_utilization=(total_cpu_used / total_cpu_cap) if total_cpu_cap > 0 else 0.0,
+            mem_utilization=(total_mem_used / total_mem_cap) if total_mem_cap > 0 else 0.0,
+            nodes=nodes,
+        )
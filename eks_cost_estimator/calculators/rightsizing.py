@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import json
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from eks_cost_estimator.calculators.hpa import SimulationError
+from eks_cost_estimator.models.resources import WorkloadItem
+from eks_cost_estimator.models.results import (
+    RightsizingRecommendation,
+    RightsizingResult,
+    WorkloadCost,
+)
+from eks_cost_estimator.utils.sketch import DEFAULT_RELATIVE_ACCURACY, DDSketch
+from eks_cost_estimator.utils.units import parse_cpu, parse_mem_gb
+
+
+DEFAULT_CPU_QUANTILE = 0.95
+DEFAULT_MEMORY_QUANTILE = 0.99  # memory is not compressible: size for the tail
+DEFAULT_HEADROOM = 0.15
+# Floors for recommended per-replica requests (10m CPU, 16 MiB)
+MIN_CPU_VCPU = 0.01
+MIN_MEMORY_GB = 16 * 2**20 / 1e9
+DEFAULT_NAMESPACE = "default"
+# Pod name -> workload lookups kept between samples; cleared when full
+POD_CACHE_SIZE = 100_000
+
+_CPU, _MEMORY = 0, 1
+
+
+@dataclass(frozen=True, slots=True)
+class RightsizingParams:
+    cpu_quantile: float = DEFAULT_CPU_QUANTILE
+    memory_quantile: float = DEFAULT_MEMORY_QUANTILE
+    headroom: float = DEFAULT_HEADROOM
+    relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY
+
+
+@dataclass(slots=True)
+class WorkloadUsage:
+    """Usage sketches per (workload index, container): (CPU vCPU, memory GB)."""
+
+    sketches: Dict[Tuple[int, str], Tuple[DDSketch, DDSketch]] = field(default_factory=dict)
+    samples: int = 0
+    unmatched_samples: int = 0
+
+
+def _metric_kind(name: str) -> Optional[int]:
+    name = name.lower()
+    if "cpu" in name:
+        return _CPU
+    if "memory" in name:
+        return _MEMORY
+    return None
+
+
+def _usage_value(kind: int, value: Any) -> float:
+    """CPU in cores and memory in bytes (Prometheus units), or Kubernetes quantities."""
+    try:
+        v = float(value)
+    except (TypeError, ValueError):
+        return parse_cpu(value) if kind == _CPU else parse_mem_gb(value)
+    return v if kind == _CPU else v / 1e9
+
+
+def _samples(record: Mapping[str, Any]) -> List[Tuple[int, Any]]:
+    """(metric kind, value) pairs of one long (metric/value) or wide (cpu/memory) record."""
+    if record.get("metric") is not None:
+        kind = _metric_kind(str(record["metric"]))
+        return [] if kind is None else [(kind, record["value"])]
+    return [
+        (kind, value)
+        for key, kind in (("cpu", _CPU), ("memory", _MEMORY))
+        if (value := record.get(key)) not in (None, "")
+    ]
+
+
+def _json_record(line: str) -> Mapping[str, Any]:
+    record: Dict[str, Any] = json.loads(line)
+    labels = record.get("metric")
+    if isinstance(labels, dict):
+        # Prometheus HTTP API vector sample: {"metric": {labels}, "value": [ts, "v"]}
+        value = record["value"]
+        return {
+            **labels,
+            "metric": labels.get("__name__", ""),
+            "value": value[1] if isinstance(value, list) else value,
+        }
+    return record
+
+
+def _records(f: IO[str]) -> Iterator[Mapping[str, Any]]:
+    ndjson = f.read(256).lstrip().startswith("{")
+    f.seek(0)
+    if ndjson:
+        return (_json_record(line) for line in f if line.strip())
+    return csv.DictReader(f)
+
+
+def _open(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+class _PodMatcher:
+    """Map pod names to the workload owning them by stripping generated suffixes.
+
+    ``api-7d9f8-x2x7q`` (Deployment), ``db-0`` (StatefulSet) and ``job-28391-abcde``
+    (CronJob) resolve to the longest workload name that is a ``-``-separated prefix.
+    """
+
+    def __init__(self, workloads: Sequence[WorkloadItem]) -> None:
+        self._index: Dict[Tuple[Optional[str], str], int] = {}
+        for i, w in enumerate(workloads):
+            self._index.setdefault((w.namespace or DEFAULT_NAMESPACE, w.name), i)
+            self._index.setdefault((None, w.name), i)  # samples without a namespace
+        self._cache: Dict[Tuple[str, str], Optional[int]] = {}
+
+    def match(self, namespace: str, pod: str) -> Optional[int]:
+        key = (namespace, pod)
+        if key in self._cache:
+            return self._cache[key]
+        ns = namespace or None
+        name = pod
+        found = self._index.get((ns, name))
+        while found is None:
+            cut = name.rfind("-")
+            if cut <= 0:
+                break
+            name = name[:cut]
+            found = self._index.get((ns, name))
+        if len(self._cache) >= POD_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[key] = found
+        return found
+
+
+def read_usage_metrics(
+    path: Path,
+    workloads: Sequence[WorkloadItem],
+    *,
+    relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+) -> WorkloadUsage:
+    """Stream container usage samples into per-container quantile sketches.
+
+    CSV (with a header) or NDJSON, optionally gzipped, with ``namespace``, ``pod`` and
+    ``container`` labels and either ``cpu``/``memory`` columns or a ``metric`` name and
+    ``value``; NDJSON may also hold Prometheus API vector samples. CPU is a usage rate
+    in cores and memory a byte count, as Prometheus reports them. Memory stays bounded
+    by the number of containers, whatever the file size.
+    """
+    matcher = _PodMatcher(workloads)
+    usage = WorkloadUsage()
+    sketches = usage.sketches
+    try:
+        f = _open(Path(path))
+    except OSError as e:
+        raise SimulationError(f"Cannot read usage metrics {path}: {e}") from e
+    n = 0
+    with f:
+        try:
+            for record in _records(f):
+                samples = _samples(record)
+                i = matcher.match(str(record.get("namespace") or ""), str(record["pod"]))
+                if i is None:
+                    usage.unmatched_samples += len(samples)
+                elif samples:
+                    key = (i, str(record.get("container") or ""))
+                    pair = sketches.get(key)
+                    if pair is None:
+                        pair = sketches[key] = (
+                            DDSketch(relative_accuracy),
+                            DDSketch(relative_accuracy),
+                        )
+                    for kind, value in samples:
+                        pair[kind].add(_usage_value(kind, value))
+                    usage.samples += len(samples)
+                n += 1
+        except (KeyError, TypeError, ValueError, IndexError) as e:
+            raise SimulationError(f"Usage metrics {path}, record {n + 1}: {e}") from e
+        except OSError as e:
+            raise SimulationError(f"Cannot read usage metrics {path}: {e}") from e
+    return usage
+
+
+def recommend_requests(
+    workloads: Sequence[WorkloadItem], usage: WorkloadUsage, params: RightsizingParams
+) -> List[WorkloadItem]:
+    """Workloads with per-replica requests set from observed usage.
+
+    Each container gets its CPU and memory quantile plus headroom; a replica requests
+    their sum. Resources without samples keep their manifest requests.
+    """
+    cpu: Dict[int, float] = {}
+    mem: Dict[int, float] = {}
+    for (i, _), (cpu_sketch, mem_sketch) in usage.sketches.items():
+        if cpu_sketch.count:
+            cpu[i] = cpu.get(i, 0.0) + cpu_sketch.quantile(params.cpu_quantile)
+        if mem_sketch.count:
+            mem[i] = mem.get(i, 0.0) + mem_sketch.quantile(params.memory_quantile)
+    scale = 1.0 + params.headroom
+    out = list(workloads)
+    for i in {*cpu, *mem}:
+        w = workloads[i]
+        out[i] = replace(
+            w,
+            cpu_vcpu_per_replica=max(MIN_CPU_VCPU, cpu[i] * scale)
+            if i in cpu
+            else w.cpu_vcpu_per_replica,
+            memory_gb_per_replica=max(MIN_MEMORY_GB, mem[i] * scale)
+            if i in mem
+            else w.memory_gb_per_replica,
+        )
+    return out
+
+
+def rightsizing_result(
+    workloads: Sequence[WorkloadItem],
+    recommended: Sequence[WorkloadItem],
+    current_costs: Sequence[WorkloadCost],
+    recommended_costs: Sequence[WorkloadCost],
+    usage: WorkloadUsage,
+    params: RightsizingParams,
+) -> RightsizingResult:
+    samples: Dict[int, int] = {}
+    for (i, _), (cpu_sketch, mem_sketch) in usage.sketches.items():
+        samples[i] = samples.get(i, 0) + cpu_sketch.count + mem_sketch.count
+    rows = [
+        RightsizingRecommendation(
+            name=workloads[i].name,
+            namespace=workloads[i].namespace,
+            kind=workloads[i].kind,
+            replicas=workloads[i].replicas,
+            samples=samples[i],
+            cpu_request=workloads[i].cpu_vcpu_per_replica,
+            cpu_recommended=recommended[i].cpu_vcpu_per_replica,
+            memory_request_gb=workloads[i].memory_gb_per_replica,
+            memory_recommended_gb=recommended[i].memory_gb_per_replica,
+            monthly_current=current_costs[i].monthly,
+            monthly_recommended=recommended_costs[i].monthly,
+        )
+        for i in sorted(samples)
+    ]
+    current = sum(c.monthly for c in current_costs)
+    proposed = sum(c.monthly for c in recommended_costs)
+    return RightsizingResult(
+        cpu_quantile=params.cpu_quantile,
+        memory_quantile=params.memory_quantile,
+        headroom=params.headroom,
+        samples=usage.samples,
+        unmatched_samples=usage.unmatched_samples,
+        containers=len(usage.sketches),
+        workloads=rows,
+        current_monthly=current,
+        recommended_monthly=proposed,
+        savings_monthly=current - proposed,
+    )
@@ -7,16 +7,64 @@ from typing import List, Optional
 
 import typer
 
+from eks_cost_estimator.calculators.autoscaler import DEFAULT_SCALE_DOWN_DELAY_MINUTES
+from eks_cost_estimator.calculators.binpack import parse_node_pool
+from eks_cost_estimator.calculators.blended import DEFAULT_COMMITMENT_DISCOUNT
+from eks_cost_estimator.calculators.fargate import (
+    COMPUTE_MODES,
+    DEFAULT_FARGATE_GB_HOUR,
+    DEFAULT_FARGATE_VCPU_HOUR,
+)
+from eks_cost_estimator.calculators.groupby import parse_group_by
+from eks_cost_estimator.calculators.hpa import SimulationError, read_load_profile
+from eks_cost_estimator.calculators.montecarlo import (
+    DEFAULT_BINPACK_EFFICIENCY,
+    DEFAULT_SPOT_DISCOUNT,
+    MonteCarloParams,
+    parse_range,
+)
+from eks_cost_estimator.calculators.rightsizing import (
+    DEFAULT_CPU_QUANTILE,
+    DEFAULT_HEADROOM,
+    DEFAULT_MEMORY_QUANTILE,
+    RightsizingParams,
+)
+from eks_cost_estimator.calculators.jobsim import (
+    DEFAULT_JOB_DURATION_MINUTES,
+    DEFAULT_SCALE_DOWN_UTILIZATION,
+)
 from eks_cost_estimator.core.orchestrator import EstimationConfig, orchestrate
+from eks_cost_estimator.core.result_cache import ResultCache, orchestrate_cached
+from eks_cost_estimator.output.arrow_export import export_result
 from eks_cost_estimator.output.render import render_csv, render_json, render_table
+from eks_cost_estimator.output.sqlite_sink import SinkError, parse_sink_url, write_result
+from eks_cost_estimator.parsers.discovery import iter_discovered, read_path_list
+from eks_cost_estimator.pricing.registry import PricingDataError, compile_baselines
+from eks_cost_estimator.pricing.spot import read_spot_history
+from eks_cost_estimator.utils.timings import NULL_TIMINGS, Timings
 
 
 app = typer.Typer(add_completion=False, help="EKS Cost Estimator CLI")
 
 
+@app.callback()
+def main() -> None:
+    """EKS Cost Estimator CLI."""
+
+
 @app.command("estimate")
 def estimate(
-    files: List[Path] = typer.Argument(..., help="Kubernetes YAML manifest files"),
+    files: Optional[List[str]] = typer.Argument(
+        None, help="Kubernetes YAML manifest files, directories or glob patterns"
+    ),
+    files_from: Optional[Path] = typer.Option(
+        None,
+        "--files-from",
+        help="Read additional inputs (files, directories, globs) one per line; '-' for stdin",
+    ),
+    discovery_workers: int = typer.Option(
+        8, "--discovery-workers", help="Threads used to scan directories concurrently"
+    ),
     region: str = typer.Option("eu-west-3", "--region", help="AWS region"),
     baseline_instance: str = typer.Option(
         "m6i.large", "--baseline-instance", help="Baseline EC2 instance type"
@@ -34,6 +82,42 @@ def estimate(
         case_sensitive=False,
         help="Output format: table|json|csv",
     ),
+    export_dir: Optional[Path] = typer.Option(
+        None,
+        "--export-dir",
+        help="Also write workloads/storage/LBs/bin-packing allocations as columnar files here",
+    ),
+    export_format: str = typer.Option(
+        "parquet",
+        "--export-format",
+        case_sensitive=False,
+        help="Columnar export format: parquet|arrow (requires pyarrow)",
+    ),
+    sink: Optional[str] = typer.Option(
+        None,
+        "--sink",
+        help="Append the run to a results database, e.g. sqlite:///costs.db",
+    ),
+    run_label: Optional[str] = typer.Option(
+        None, "--run-label", help="Label stored with the run in --sink (e.g. branch or commit)"
+    ),
+    top: Optional[int] = typer.Option(
+        None,
+        "--top",
+        min=1,
+        help="Table output: show the N most expensive rows per section, fold the rest",
+    ),
+    page: Optional[int] = typer.Option(
+        None,
+        "--page",
+        min=1,
+        help="Table output: show page K of the cost ranking (page size --top, default 50)",
+    ),
+    group_by: Optional[str] = typer.Option(
+        None,
+        "--group-by",
+        help="Aggregate costs by comma-separated keys: namespace, kind, name, label:<key>",
+    ),
     detailed: bool = typer.Option(
         False, "--detailed/--no-detailed", help="Include detailed output where applicable"
     ),
@@ -42,6 +126,69 @@ def estimate(
         "--elb-hourly-price",
         help="Per LoadBalancer hourly price (USD). LCUs excluded (MVP)",
     ),
+    compute_mode: str = typer.Option(
+        "ec2",
+        "--compute-mode",
+        case_sensitive=False,
+        help="Price compute as EC2 node capacity (ec2) or as Fargate pods (fargate)",
+    ),
+    fargate_vcpu_hour: float = typer.Option(
+        DEFAULT_FARGATE_VCPU_HOUR,
+        "--fargate-vcpu-hour",
+        min=0.0,
+        help="With --compute-mode fargate, price per vCPU-hour (USD)",
+    ),
+    fargate_gb_hour: float = typer.Option(
+        DEFAULT_FARGATE_GB_HOUR,
+        "--fargate-gb-hour",
+        min=0.0,
+        help="With --compute-mode fargate, price per GB-hour of memory (USD)",
+    ),
+    blended_pricing: bool = typer.Option(
+        False,
+        "--blended-pricing/--no-blended-pricing",
+        help="Blend on-demand, spot (capacityType SPOT node selectors) and the commitment "
+        "level that minimizes monthly cost over the hourly usage curve",
+    ),
+    spot_history: Optional[Path] = typer.Option(
+        None,
+        "--spot-history",
+        help="Spot price history for the baseline instance (describe-spot-price-history "
+        "JSON or CSV); implies --blended-pricing",
+    ),
+    commitment_discount: float = typer.Option(
+        DEFAULT_COMMITMENT_DISCOUNT,
+        "--commitment-discount",
+        min=0.0,
+        max=1.0,
+        help="With --blended-pricing, Savings Plan/Reserved Instance discount off on-demand",
+    ),
+    usage_metrics: Optional[Path] = typer.Option(
+        None,
+        "--usage-metrics",
+        help="Recorded container usage (CSV or NDJSON, optionally .gz, with namespace, pod, "
+        "container and cpu/memory samples) to recommend requests from and re-price",
+    ),
+    cpu_quantile: float = typer.Option(
+        DEFAULT_CPU_QUANTILE,
+        "--cpu-quantile",
+        min=0.0,
+        max=1.0,
+        help="With --usage-metrics, CPU usage quantile recommended per container",
+    ),
+    memory_quantile: float = typer.Option(
+        DEFAULT_MEMORY_QUANTILE,
+        "--memory-quantile",
+        min=0.0,
+        max=1.0,
+        help="With --usage-metrics, memory usage quantile recommended per container",
+    ),
+    headroom: float = typer.Option(
+        DEFAULT_HEADROOM,
+        "--headroom",
+        min=0.0,
+        help="With --usage-metrics, fraction added on top of the usage quantiles",
+    ),
     binpack: bool = typer.Option(
         False,
         "--binpack/--no-binpack",
@@ -57,6 +204,96 @@ def estimate(
         "--node-overhead-mem-gb",
         help="Reserved memory (GB) per node for system/kube",
     ),
+    node_pool: Optional[List[str]] = typer.Option(
+        None,
+        "--node-pool",
+        help="With --binpack, pack into a node pool "
+        "NAME:INSTANCE[/VCPU/MEM_GB[/PRICE]][:LABEL=VALUE,...][:TAINT,...] matched by "
+        "nodeSelector/tolerations (repeatable; unmatched workloads use the baseline)",
+    ),
+    binpack_workers: Optional[int] = typer.Option(
+        None, "--binpack-workers", min=1, help="Processes used to pack node pools in parallel"
+    ),
+    simulate_jobs: bool = typer.Option(
+        False,
+        "--simulate-jobs/--no-simulate-jobs",
+        help="Simulate Job/CronJob runs over a 30-day month and report peak and average nodes",
+    ),
+    job_duration: float = typer.Option(
+        DEFAULT_JOB_DURATION_MINUTES,
+        "--job-duration",
+        min=0.0,
+        help="With --simulate-jobs, minutes a Job pod runs unless annotated "
+        "eks-cost-estimator/duration",
+    ),
+    simulate_hpa: bool = typer.Option(
+        False,
+        "--simulate-hpa/--no-simulate-hpa",
+        help="Simulate HPA-scaled replicas hour by hour over a month (min/expected/max cost)",
+    ),
+    load_profile: Optional[Path] = typer.Option(
+        None,
+        "--load-profile",
+        help="Hourly CPU utilization profile for --simulate-hpa (JSON or text; 24, 168 or 720 "
+        "values); implies --simulate-hpa",
+    ),
+    simulate_autoscaler: bool = typer.Option(
+        False,
+        "--simulate-autoscaler/--no-simulate-autoscaler",
+        help="Replay pods (static replicas plus HPA scaling) against cluster-autoscaler "
+        "scale-up/scale-down rules and report node-hours and hourly node cost",
+    ),
+    pod_trace: Optional[Path] = typer.Option(
+        None,
+        "--pod-trace",
+        help="Recorded pod events (CSV or NDJSON: minute,event,pod,cpu,memory) to replay "
+        "instead of the manifests; implies --simulate-autoscaler",
+    ),
+    scale_down_utilization: float = typer.Option(
+        DEFAULT_SCALE_DOWN_UTILIZATION,
+        "--scale-down-utilization",
+        min=0.0,
+        max=1.0,
+        help="Nodes with CPU and memory requests under this fraction of allocatable are "
+        "scaled down (autoscaler and job simulations)",
+    ),
+    scale_down_delay: float = typer.Option(
+        DEFAULT_SCALE_DOWN_DELAY_MINUTES,
+        "--scale-down-delay",
+        min=0.0,
+        help="With --simulate-autoscaler, minutes a node must stay under the threshold",
+    ),
+    max_nodes: Optional[int] = typer.Option(
+        None, "--max-nodes", min=1, help="With --simulate-autoscaler, node group maximum size"
+    ),
+    monte_carlo: int = typer.Option(
+        0,
+        "--monte-carlo",
+        min=0,
+        help="Sample N trials of HPA replicas, spot prices and bin-packing efficiency and "
+        "report P50/P90/P99 monthly totals (0 disables)",
+    ),
+    seed: int = typer.Option(0, "--seed", help="Random seed for --monte-carlo"),
+    spot_share: float = typer.Option(
+        0.0,
+        "--spot-share",
+        min=0.0,
+        max=1.0,
+        help="With --monte-carlo, fraction of compute bought as spot",
+    ),
+    spot_discount: str = typer.Option(
+        "{}:{}".format(*DEFAULT_SPOT_DISCOUNT),
+        "--spot-discount",
+        help="With --monte-carlo, LO:HI range the spot discount is sampled from",
+    ),
+    binpack_efficiency: str = typer.Option(
+        "{}:{}".format(*DEFAULT_BINPACK_EFFICIENCY),
+        "--binpack-efficiency",
+        help="With --monte-carlo, LO:HI range of requested/node capacity sampled per trial",
+    ),
+    mc_workers: Optional[int] = typer.Option(
+        None, "--mc-workers", min=1, help="Processes used to run --monte-carlo batches"
+    ),
     live_pricing: bool = typer.Option(
         False,
         "--live-pricing/--no-live-pricing",
@@ -67,8 +304,103 @@ def estimate(
         "--aws-profile",
         help="AWS named profile to use for live pricing (optional)",
     ),
+    pricing_file: Optional[Path] = typer.Option(
+        None,
+        "--pricing-file",
+        help="Baselines catalog (JSON or compiled .bin); default: $EKS_COST_PRICING_PATH, "
+        "./pricing_cache/baselines.json, then the packaged copy",
+    ),
+    cache_dir: Optional[Path] = typer.Option(
+        None,
+        "--cache-dir",
+        help="Memoize results on disk keyed by input contents, options and pricing data",
+    ),
+    cache_max_mb: int = typer.Option(
+        256, "--cache-max-mb", help="Evict least recently used cache entries beyond this size"
+    ),
+    cache_max_entries: int = typer.Option(
+        1000, "--cache-max-entries", help="Evict least recently used entries beyond this count"
+    ),
+    timings_path: Optional[str] = typer.Option(
+        None,
+        "--timings",
+        help="Write per-stage timings/allocation counts as JSON to PATH ('-' for stderr)",
+    ),
+    trace_alloc: bool = typer.Option(
+        False,
+        "--trace-alloc/--no-trace-alloc",
+        help="With --timings, also record per-stage tracemalloc peaks (slower)",
+    ),
 ):
     """Estimate EKS compute and storage costs from manifests before deployment."""
+    inputs: List[str] = list(files or [])
+    if files_from is not None:
+        try:
+            inputs.extend(read_path_list(files_from))
+        except OSError as exc:
+            typer.echo(f"Fatal error: cannot read --files-from: {exc}", err=True)
+            raise typer.Exit(code=1)
+    if not inputs:
+        typer.echo("No input files given. Pass paths or use --files-from.", err=True)
+        raise typer.Exit(code=2)
+
+    mode = compute_mode.lower()
+    if mode not in COMPUTE_MODES:
+        typer.echo(f"Unknown compute mode '{compute_mode}'. Use ec2|fargate.", err=True)
+        raise typer.Exit(code=2)
+
+    try:
+        group_keys = parse_group_by(group_by) if group_by else ()
+    except ValueError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=2)
+
+    try:
+        pools = tuple(parse_node_pool(spec) for spec in node_pool or ())
+    except ValueError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=2)
+
+    try:
+        profile = read_load_profile(load_profile) if load_profile is not None else None
+    except SimulationError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=2)
+
+    try:
+        spot_price = (
+            read_spot_history(spot_history, baseline_instance) if spot_history is not None else None
+        )
+    except PricingDataError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=2)
+
+    mc_params = None
+    if monte_carlo:
+        try:
+            mc_params = MonteCarloParams(
+                trials=monte_carlo,
+                seed=seed,
+                spot_share=spot_share,
+                spot_discount=parse_range(spot_discount),
+                binpack_efficiency=parse_range(binpack_efficiency, low=0.01),
+                workers=mc_workers,
+            )
+        except ValueError as exc:
+            typer.echo(str(exc), err=True)
+            raise typer.Exit(code=2)
+
+    try:
+        sink_path = parse_sink_url(sink) if sink else None
+    except SinkError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=2)
+
+    timings: Optional[Timings] = None
+    if timings_path is not None:
+        timings = Timings(trace_memory=trace_alloc)
+        timings.start()
+
     try:
         cfg = EstimationConfig(
             region=region,
@@ -83,25 +415,100 @@ def estimate(
             node_overhead_mem_gb=node_overhead_mem_gb,
             live_pricing=live_pricing,
             aws_profile=aws_profile,
+            pricing_path=str(pricing_file) if pricing_file is not None else None,
+            group_by=group_keys,
+            node_pools=pools,
+            binpack_workers=binpack_workers,
+            simulate_jobs=simulate_jobs,
+            job_duration_minutes=job_duration,
+            simulate_hpa=simulate_hpa or profile is not None,
+            load_profile=profile,
+            monte_carlo=mc_params,
+            simulate_autoscaler=simulate_autoscaler or pod_trace is not None,
+            pod_trace=str(pod_trace) if pod_trace is not None else None,
+            scale_down_utilization=scale_down_utilization,
+            scale_down_delay_minutes=scale_down_delay,
+            max_nodes=max_nodes,
+            compute_mode=mode,
+            fargate_vcpu_hour=fargate_vcpu_hour,
+            fargate_gb_hour=fargate_gb_hour,
+            blended_pricing=blended_pricing or spot_price is not None,
+            spot_price=spot_price,
+            commitment_discount=commitment_discount,
+            usage_metrics=str(usage_metrics) if usage_metrics is not None else None,
+            rightsizing=RightsizingParams(
+                cpu_quantile=cpu_quantile, memory_quantile=memory_quantile, headroom=headroom
+            ),
         )
-        result = orchestrate([str(p) for p in files], cfg)
+        discovered = iter_discovered(inputs, workers=discovery_workers)
+        if cache_dir is not None:
+            cache = ResultCache(
+                cache_dir,
+                max_bytes=cache_max_mb * 1024 * 1024,
+                max_entries=cache_max_entries,
+            )
+            result = orchestrate_cached(discovered, cfg, cache, timings=timings)
+        else:
+            result = orchestrate(discovered, cfg, timings=timings)
     except Exception as exc:  # noqa: BLE001
         typer.echo(f"Fatal error: {exc}", err=True)
         raise typer.Exit(code=1)
 
     fmt = output.lower()
-    if fmt == "table":
-        render_table(result)
-    elif fmt == "json":
-        typer.echo(render_json(result))
-    elif fmt == "csv":
-        typer.echo(render_csv(result))
-    else:
-        typer.echo("Unknown output format. Use table|json|csv.", err=True)
-        raise typer.Exit(code=2)
+    with (timings or NULL_TIMINGS).stage("render"):
+        if fmt == "table":
+            render_table(result, top=top, page=page)
+        elif fmt == "json":
+            typer.echo(render_json(result))
+        elif fmt == "csv":
+            typer.echo(render_csv(result))
+        else:
+            typer.echo("Unknown output format. Use table|json|csv.", err=True)
+            raise typer.Exit(code=2)
+
+    if export_dir is not None:
+        try:
+            with (timings or NULL_TIMINGS).stage("export"):
+                export_result(result, export_dir, fmt=export_format)
+        except Exception as exc:  # noqa: BLE001
+            typer.echo(f"Fatal error: {exc}", err=True)
+            raise typer.Exit(code=1)
+
+    if sink_path is not None:
+        try:
+            with (timings or NULL_TIMINGS).stage("sink"):
+                write_result(sink_path, result, label=run_label)
+        except Exception as exc:  # noqa: BLE001
+            typer.echo(f"Fatal error: {exc}", err=True)
+            raise typer.Exit(code=1)
+
+    if timings is not None:
+        timings.stop()
+        _write_timings(timings, timings_path or "-")
 
     raise typer.Exit(code=0)
 
 
+@app.command("compile-pricing")
+def compile_pricing(
+    src: Path = typer.Argument(..., help="Baselines JSON catalog"),
+    dst: Path = typer.Argument(..., help="Output path for the compiled catalog (.bin)"),
+) -> None:
+    """Compile a baselines JSON catalog into the compact memory-mapped form."""
+    try:
+        count = compile_baselines(src, dst)
+    except (OSError, ValueError) as exc:
+        typer.echo(f"Fatal error: {exc}", err=True)
+        raise typer.Exit(code=1)
+    typer.echo(f"Compiled {count} baselines into {dst}")
+
+
+def _write_timings(timings: Timings, dest: str) -> None:
+    if dest == "-":
+        typer.echo(timings.to_json(), err=True)
+    else:
+        Path(dest).write_text(timings.to_json() + "\n", encoding="utf-8")
+
+
 if __name__ == "__main__":  # pragma: no cover
     app()
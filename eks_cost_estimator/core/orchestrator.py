@@ -1,22 +1,68 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from eks_cost_estimator.calculators.autoscaler import (
+    DEFAULT_SCALE_DOWN_DELAY_MINUTES,
+    events_from_workloads,
+    read_pod_trace,
+    simulate_autoscaler,
+)
+from eks_cost_estimator.calculators.blended import DEFAULT_COMMITMENT_DISCOUNT, blended_pricing
 from eks_cost_estimator.calculators.compute import compute_costs
+from eks_cost_estimator.calculators.fargate import (
+    DEFAULT_FARGATE_GB_HOUR,
+    DEFAULT_FARGATE_VCPU_HOUR,
+    UNSUPPORTED_KINDS,
+    fargate_costs,
+)
 from eks_cost_estimator.calculators.storage import storage_costs
 from eks_cost_estimator.calculators.elb import elb_costs, DEFAULT_ELB_HOURLY
-from eks_cost_estimator.calculators.binpack import simulate_binpack
+from eks_cost_estimator.calculators.binpack import (
+    DEFAULT_POOL,
+    NodePool,
+    attribute_node_costs,
+    simulate_binpack,
+    simulate_binpack_pools,
+)
+from eks_cost_estimator.calculators.groupby import GroupAggregator, label_keys_for
+from eks_cost_estimator.calculators.hpa import (
+    HOURS_PER_MONTH,
+    LoadProfile,
+    join_hpas,
+    simulate_hpa,
+)
+from eks_cost_estimator.calculators.jobsim import (
+    DEFAULT_JOB_DURATION_MINUTES,
+    DEFAULT_SCALE_DOWN_UTILIZATION,
+    simulate_jobs,
+)
+from eks_cost_estimator.calculators.montecarlo import MonteCarloParams, run_monte_carlo
+from eks_cost_estimator.calculators.rightsizing import (
+    RightsizingParams,
+    read_usage_metrics,
+    recommend_requests,
+    rightsizing_result,
+)
 from eks_cost_estimator.models.resources import StorageItem, WorkloadItem
 from eks_cost_estimator.models.results import (
     BaselineInfo,
+    BinPackingResult,
     DerivedRates,
     EstimationResult,
+    FargateResult,
     Totals,
+    WorkloadCost,
 )
 from eks_cost_estimator.parsers.yaml_parser import ParseOutput, parse_files
 from eks_cost_estimator.pricing.rates import derive_rates, get_baseline
 from eks_cost_estimator.pricing.aws_pricing import get_live_baseline, LivePricingError
+from eks_cost_estimator.pricing.registry import get_registry
+from eks_cost_estimator.utils.timings import NULL_TIMINGS, Timings
 
 
 @dataclass(slots=True)
@@ -33,11 +79,31 @@ class EstimationConfig:
     node_overhead_mem_gb: float = 0.5
     live_pricing: bool = False
     aws_profile: str | None = None
+    pricing_path: str | None = None
+    group_by: Tuple[str, ...] = ()
+    node_pools: Tuple[NodePool, ...] = ()
+    binpack_workers: Optional[int] = None
+    simulate_jobs: bool = False
+    job_duration_minutes: float = DEFAULT_JOB_DURATION_MINUTES
+    simulate_hpa: bool = False
+    load_profile: Optional[LoadProfile] = None  # contents, so cached results key on them
+    monte_carlo: Optional[MonteCarloParams] = None
+    simulate_autoscaler: bool = False
+    pod_trace: Optional[str] = None  # path; ResultCache hashes its contents
+    scale_down_utilization: float = DEFAULT_SCALE_DOWN_UTILIZATION
+    scale_down_delay_minutes: float = DEFAULT_SCALE_DOWN_DELAY_MINUTES
+    max_nodes: Optional[int] = None
+    compute_mode: str = "ec2"  # or "fargate"
+    fargate_vcpu_hour: float = DEFAULT_FARGATE_VCPU_HOUR
+    fargate_gb_hour: float = DEFAULT_FARGATE_GB_HOUR
+    blended_pricing: bool = False
+    spot_price: Optional[float] = None  # mean from a spot price history file
+    commitment_discount: float = DEFAULT_COMMITMENT_DISCOUNT
+    usage_metrics: Optional[str] = None  # path; ResultCache hashes its contents
+    rightsizing: RightsizingParams = RightsizingParams()
 
 
-def orchestrate(paths: List[str], cfg: EstimationConfig) -> EstimationResult:
-    parsed: ParseOutput = parse_files(paths)
-
+def _resolve_baseline(cfg: EstimationConfig) -> Dict[str, float]:
     if cfg.live_pricing:
         try:
             baseline = get_live_baseline(
@@ -45,31 +111,163 @@ def orchestrate(paths: List[str], cfg: EstimationConfig) -> EstimationResult:
             )
             if cfg.baseline_price_override is not None:
                 baseline["price"] = float(cfg.baseline_price_override)
-        except LivePricingError as e:
-            # Fallback to static cache if live pricing fails
-            baseline = get_baseline(
-                region=cfg.region,
-                instance=cfg.baseline_instance,
-                override_price=cfg.baseline_price_override,
+            return baseline
+        except LivePricingError:
+            pass  # Fallback to static cache if live pricing fails
+    return get_baseline(
+        region=cfg.region,
+        instance=cfg.baseline_instance,
+        override_price=cfg.baseline_price_override,
+        pricing_path=cfg.pricing_path,
+    )
+
+
+def _resolve_pools(
+    cfg: EstimationConfig, baseline: Dict[str, float], rates: Dict[str, float]
+) -> List[NodePool]:
+    """Fill in node sizes and prices from the pricing catalog; the baseline pool catches the rest.
+
+    Pools whose instance is not in the catalog but has explicit sizes are priced at the
+    baseline's per-vCPU and per-GB rates.
+    """
+    registry = get_registry(cfg.pricing_path)
+    pools: List[NodePool] = []
+    for pool in cfg.node_pools:
+        if pool.node_cpu_vcpu is None or pool.node_mem_gb is None or pool.hourly_price is None:
+            spec = registry.lookup(cfg.region, pool.instance_type)
+            if spec is not None:
+                cpu = pool.node_cpu_vcpu if pool.node_cpu_vcpu is not None else spec.vcpu
+                mem = pool.node_mem_gb if pool.node_mem_gb is not None else spec.memory_gb
+                catalog_price = spec.price
+            elif pool.node_cpu_vcpu is not None and pool.node_mem_gb is not None:
+                cpu, mem = pool.node_cpu_vcpu, pool.node_mem_gb
+                catalog_price = cpu * rates["per_vcpu_hour"] + mem * rates["per_gb_ram_hour"]
+            else:
+                raise ValueError(
+                    f"Node pool {pool.name}: no pricing for {pool.instance_type} in {cfg.region}"
+                )
+            price = pool.hourly_price if pool.hourly_price is not None else catalog_price
+            pool = replace(pool, node_cpu_vcpu=cpu, node_mem_gb=mem, hourly_price=price)
+        pools.append(pool)
+    if all(p.name != DEFAULT_POOL for p in pools):
+        pools.append(
+            NodePool(
+                name=DEFAULT_POOL,
+                instance_type=cfg.baseline_instance,
+                node_cpu_vcpu=baseline["vcpu"],
+                node_mem_gb=baseline["memory_gb"],
+                hourly_price=baseline["price"],
             )
-    else:
-        baseline = get_baseline(
-            region=cfg.region,
-            instance=cfg.baseline_instance,
-            override_price=cfg.baseline_price_override,
         )
-    rates = derive_rates(
-        price=baseline["price"],
-        vcpu=baseline["vcpu"],
-        memory_gb=baseline["memory_gb"],
-        cpu_weight=cfg.cpu_weight,
-        mem_weight=cfg.mem_weight,
+    return pools
+
+
+def _start_baseline_lookup(cfg: EstimationConfig) -> Future[Dict[str, float]]:
+    """Resolve the baseline in a background thread so network I/O overlaps parsing."""
+    future: Future[Dict[str, float]] = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(_resolve_baseline(cfg))
+        except BaseException as e:  # noqa: BLE001 - re-raised by future.result()
+            future.set_exception(e)
+
+    # A daemon thread, unlike executor workers, is not joined at interpreter exit: a
+    # parse failure doesn't wait for a slow pricing call
+    threading.Thread(target=run, name="baseline-lookup", daemon=True).start()
+    return future
+
+
+def _price_compute(
+    cfg: EstimationConfig, workloads: List[WorkloadItem], rates: Dict[str, float]
+) -> Tuple[List[WorkloadCost], Dict[str, float], Optional[FargateResult], List[WorkloadItem]]:
+    """Compute costs in the configured mode, with the workloads it cannot price."""
+    if cfg.compute_mode == "fargate":
+        return fargate_costs(
+            workloads, vcpu_hour=cfg.fargate_vcpu_hour, gb_hour=cfg.fargate_gb_hour
+        )
+    if cfg.compute_mode == "ec2":
+        costs, totals = compute_costs(workloads, rates)
+        return costs, totals, None, []
+    raise ValueError(f"Unknown compute mode: {cfg.compute_mode}")
+
+
+def _binpack(
+    cfg: EstimationConfig,
+    workloads: List[WorkloadItem],
+    baseline: Dict[str, float],
+    rates: Dict[str, float],
+) -> Tuple[BinPackingResult, List[WorkloadItem]]:
+    """Bin-pack and attribute node costs; also returns the workloads no pool can host."""
+    if cfg.node_pools:
+        pools = _resolve_pools(cfg, baseline, rates)
+        result, unschedulable = simulate_binpack_pools(
+            workloads,
+            pools,
+            overhead_cpu_vcpu=cfg.node_overhead_cpu,
+            overhead_mem_gb=cfg.node_overhead_mem_gb,
+            workers=cfg.binpack_workers,
+        )
+        attribute_node_costs(result, {p.name: float(p.hourly_price or 0.0) for p in pools})
+        return result, unschedulable
+    result = simulate_binpack(
+        workloads,
+        instance_type=cfg.baseline_instance,
+        node_cpu_vcpu=baseline["vcpu"],
+        node_mem_gb=baseline["memory_gb"],
+        overhead_cpu_vcpu=cfg.node_overhead_cpu,
+        overhead_mem_gb=cfg.node_overhead_mem_gb,
     )
+    attribute_node_costs(result, {None: baseline["price"]})
+    return result, []
+
+
+def orchestrate(
+    paths: Iterable[str], cfg: EstimationConfig, *, timings: Optional[Timings] = None
+) -> EstimationResult:
+    t = timings or NULL_TIMINGS
+    # Live pricing is network-bound: start it before parsing and join afterwards, so
+    # wall time is roughly max(parse, fetch) instead of their sum
+    baseline_future = _start_baseline_lookup(cfg) if cfg.live_pricing else None
+    with t.stage("parse"):
+        parsed: ParseOutput = parse_files(
+            paths, timings=t, label_keys=label_keys_for(cfg.group_by) or None
+        )
+
+    with t.stage("pricing_lookup"):
+        if baseline_future is not None:
+            baseline = baseline_future.result()
+        else:
+            baseline = _resolve_baseline(cfg)
+    with t.stage("derive_rates"):
+        rates = derive_rates(
+            price=baseline["price"],
+            vcpu=baseline["vcpu"],
+            memory_gb=baseline["memory_gb"],
+            cpu_weight=cfg.cpu_weight,
+            mem_weight=cfg.mem_weight,
+        )
 
-    workload_costs, compute_totals = compute_costs(parsed.workloads, rates)
+    with t.stage("compute_costs"):
+        workload_costs, compute_totals, fargate, unsupported = _price_compute(
+            cfg, parsed.workloads, rates
+        )
+    for w in unsupported:
+        parsed.warnings.add(
+            "fargate_unsupported",
+            w.kind,
+            w.name,
+            "DaemonSets are not supported"
+            if w.kind in UNSUPPORTED_KINDS
+            else "larger than 16 vCPU / 120 GiB",
+        )
     storage_items = parsed.storage
-    storage_cost_items, storage_totals = storage_costs(storage_items)
-    lb_cost_items, lb_totals = elb_costs(parsed.services, cfg.elb_hourly_price)
+    with t.stage("storage_costs"):
+        storage_cost_items, storage_totals = storage_costs(storage_items)
+    with t.stage("elb_costs"):
+        lb_cost_items, lb_totals = elb_costs(parsed.services, cfg.elb_hourly_price)
 
     totals = Totals(
         compute_hourly=compute_totals["hourly"],
@@ -95,22 +293,172 @@ def orchestrate(paths: List[str], cfg: EstimationConfig) -> EstimationResult:
         storage_gb_month=storage_cost_items[0].rate_gb_month if storage_cost_items else 0.08,
     )
 
+    groups = None
+    if cfg.group_by:
+        with t.stage("group_by"):
+            agg = GroupAggregator(cfg.group_by)
+            agg.add_workloads(parsed.workloads, workload_costs)
+            agg.add_storage(storage_items, storage_cost_items)
+            agg.add_load_balancers(parsed.services, lb_cost_items)
+            groups = agg.results()
+
     assumptions = sorted({*parsed.assumptions})
-    warnings = sorted({*parsed.warnings})
+    if fargate is not None:
+        assumptions.append(
+            "Fargate: each pod's requests plus 256 MiB are rounded up to the smallest valid "
+            "vCPU/memory configuration; ephemeral storage beyond 20 GiB is billed"
+        )
 
     binpacking = None
     if cfg.binpack:
-        binpacking = simulate_binpack(
-            parsed.workloads,
-            instance_type=cfg.baseline_instance,
-            node_cpu_vcpu=baseline["vcpu"],
-            node_mem_gb=baseline["memory_gb"],
-            overhead_cpu_vcpu=cfg.node_overhead_cpu,
-            overhead_mem_gb=cfg.node_overhead_mem_gb,
-        )
+        with t.stage("simulate_binpack"):
+            binpacking, unschedulable = _binpack(cfg, parsed.workloads, baseline, rates)
+        for w in unschedulable:
+            parsed.warnings.add("unschedulable", w.kind, w.name)
+        totals.node_hourly = binpacking.node_monthly / HOURS_PER_MONTH
+        totals.node_monthly = binpacking.node_monthly
+        totals.idle_hourly = binpacking.idle_monthly / HOURS_PER_MONTH
+        totals.idle_monthly = binpacking.idle_monthly
         assumptions.append(
             f"Bin-packing: reserved {cfg.node_overhead_cpu} vCPU and {cfg.node_overhead_mem_gb} GB per node for system/kube"
         )
+        assumptions.append(
+            "Node cost attribution: each node's cost is split over its pods by their dominant "
+            "share of allocatable CPU/memory; the unclaimed rest is idle"
+        )
+
+    hpa_simulation = None
+    if cfg.simulate_hpa:
+        with t.stage("simulate_hpa"):
+            hpa_simulation, unmatched_hpas = simulate_hpa(
+                parsed.workloads, parsed.hpas, rates, cfg.load_profile
+            )
+        for hpa in unmatched_hpas:
+            parsed.warnings.add(
+                "hpa_target_missing",
+                "HorizontalPodAutoscaler",
+                hpa.name,
+                f"{hpa.target_kind}/{hpa.target_name}",
+            )
+
+    job_simulation = None
+    if cfg.simulate_jobs:
+        with t.stage("simulate_jobs"):
+            job_simulation = simulate_jobs(
+                parsed.workloads,
+                parsed.batch_jobs,
+                instance_type=cfg.baseline_instance,
+                node_cpu_vcpu=baseline["vcpu"],
+                node_mem_gb=baseline["memory_gb"],
+                node_hourly_price=baseline["price"],
+                overhead_cpu_vcpu=cfg.node_overhead_cpu,
+                overhead_mem_gb=cfg.node_overhead_mem_gb,
+                default_duration_minutes=cfg.job_duration_minutes,
+                scale_down_utilization=cfg.scale_down_utilization,
+            )
+        assumptions.append(
+            "Job simulation: pods without a duration annotation run "
+            f"{cfg.job_duration_minutes:g} min"
+        )
+
+    blended = None
+    if cfg.blended_pricing:
+        with t.stage("blended_pricing"):
+            blended = blended_pricing(
+                parsed.workloads,
+                workload_costs,
+                parsed.hpas,
+                on_demand_price=baseline["price"],
+                spot_price=cfg.spot_price,
+                commitment_discount=cfg.commitment_discount,
+                profile=cfg.load_profile,
+            )
+        assumptions.append(
+            f"Blended pricing: commitment discount {cfg.commitment_discount:.0%}; "
+            + (
+                f"spot at {blended.spot_ratio:.0%} of on-demand from price history"
+                if cfg.spot_price is not None
+                else "spot-pinned workloads priced on-demand (no spot price history)"
+            )
+        )
+
+    autoscaler = None
+    if cfg.simulate_autoscaler or cfg.pod_trace is not None:
+        with t.stage("simulate_autoscaler"):
+            if cfg.pod_trace is not None:
+                events = read_pod_trace(Path(cfg.pod_trace))
+            else:
+                events, unmatched_hpas = events_from_workloads(
+                    parsed.workloads, parsed.hpas, cfg.load_profile
+                )
+                if not cfg.simulate_hpa:  # already reported by the HPA simulation
+                    for hpa in unmatched_hpas:
+                        parsed.warnings.add(
+                            "hpa_target_missing",
+                            "HorizontalPodAutoscaler",
+                            hpa.name,
+                            f"{hpa.target_kind}/{hpa.target_name}",
+                        )
+            autoscaler = simulate_autoscaler(
+                events,
+                instance_type=cfg.baseline_instance,
+                node_cpu_vcpu=baseline["vcpu"],
+                node_mem_gb=baseline["memory_gb"],
+                node_hourly_price=baseline["price"],
+                overhead_cpu_vcpu=cfg.node_overhead_cpu,
+                overhead_mem_gb=cfg.node_overhead_mem_gb,
+                scale_down_utilization=cfg.scale_down_utilization,
+                scale_down_delay_minutes=cfg.scale_down_delay_minutes,
+                max_nodes=cfg.max_nodes,
+            )
+
+    rightsizing = None
+    if cfg.usage_metrics is not None:
+        rs = cfg.rightsizing
+        with t.stage("rightsizing"):
+            usage = read_usage_metrics(
+                Path(cfg.usage_metrics),
+                parsed.workloads,
+                relative_accuracy=rs.relative_accuracy,
+            )
+            recommended = recommend_requests(parsed.workloads, usage, rs)
+            recommended_costs = _price_compute(cfg, recommended, rates)[0]
+            rightsizing = rightsizing_result(
+                parsed.workloads, recommended, workload_costs, recommended_costs, usage, rs
+            )
+            if binpacking is not None:
+                repacked, _ = _binpack(cfg, recommended, baseline, rates)
+                rightsizing.current_node_count = binpacking.node_count
+                rightsizing.recommended_node_count = repacked.node_count
+        assumptions.append(
+            f"Rightsizing: requests set to p{rs.cpu_quantile * 100:g} CPU and "
+            f"p{rs.memory_quantile * 100:g} memory usage per container plus "
+            f"{rs.headroom:.0%} headroom"
+        )
+
+    monte_carlo = None
+    if cfg.monte_carlo is not None:
+        mc = cfg.monte_carlo
+        if cfg.compute_mode == "fargate":
+            # Fargate bills pods, not nodes: there is no packing inefficiency to sample
+            mc = replace(mc, binpack_efficiency=(1.0, 1.0))
+        with t.stage("monte_carlo"):
+            monte_carlo = run_monte_carlo(
+                workload_costs,
+                join_hpas(parsed.workloads, parsed.hpas)[0],
+                fixed_monthly=totals.storage_monthly + totals.lb_monthly,
+                params=mc,
+            )
+        efficiency = (
+            "not applied (Fargate)"
+            if cfg.compute_mode == "fargate"
+            else f"{mc.binpack_efficiency[0]:.0%}-{mc.binpack_efficiency[1]:.0%}"
+        )
+        assumptions.append(
+            f"Monte Carlo: {mc.trials} trials (seed {mc.seed}); {mc.spot_share:.0%} of compute on "
+            f"spot at {mc.spot_discount[0]:.0%}-{mc.spot_discount[1]:.0%} off; bin-packing "
+            f"efficiency {efficiency}"
+        )
 
     return EstimationResult(
         baseline=base_info,
@@ -120,6 +468,15 @@ def orchestrate(paths: List[str], cfg: EstimationConfig) -> EstimationResult:
         load_balancers=lb_cost_items,
         totals=totals,
         assumptions=assumptions,
-        warnings=warnings,
+        warnings=parsed.warnings.messages(),
+        warning_counts=dict(parsed.warnings.counts),
         binpacking=binpacking,
+        groups=groups,
+        job_simulation=job_simulation,
+        hpa_simulation=hpa_simulation,
+        monte_carlo=monte_carlo,
+        autoscaler=autoscaler,
+        fargate=fargate,
+        blended_pricing=blended,
+        rightsizing=rightsizing,
     )
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from eks_cost_estimator.core.exceptions import ParseError
+from eks_cost_estimator.core.orchestrator import EstimationConfig, orchestrate
+from eks_cost_estimator.models.results import EstimationResult
+from eks_cost_estimator.pricing.registry import get_registry
+from eks_cost_estimator.utils.timings import NULL_TIMINGS, Timings
+
+
+# Bump when the estimation semantics change; changes to the shape of EstimationResult
+# are also caught by the schema hash in every key
+CACHE_FORMAT_VERSION = 3
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_CACHE_MAX_ENTRIES = 1000
+
+_READ_CHUNK = 1024 * 1024
+
+
+def _package_version() -> str:
+    try:
+        return metadata.version("eks-cost-estimator")
+    except metadata.PackageNotFoundError:  # pragma: no cover - running from a checkout
+        return "unknown"
+
+
+@lru_cache(maxsize=1)
+def _result_schema_hash() -> str:
+    schema = EstimationResult.model_json_schema()
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """On-disk cache of serialized ``EstimationResult``s with LRU eviction.
+
+    Entries are keyed by a hash of the input file paths and contents (in order), the full
+    ``EstimationConfig``, the pricing catalog fingerprint, the package version and the
+    JSON schema of ``EstimationResult``.
+    Recency is tracked through file mtimes, bumped on every hit.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+    def key(self, paths: List[str], cfg: EstimationConfig) -> str:
+        h = hashlib.sha256()
+        header = {
+            "format": CACHE_FORMAT_VERSION,
+            "version": _package_version(),
+            "schema": _result_schema_hash(),
+            "config": dataclasses.asdict(cfg),
+            "pricing": get_registry(cfg.pricing_path).fingerprint(),
+        }
+        h.update(json.dumps(header, sort_keys=True, default=str).encode("utf-8"))
+        # Pod traces and usage metrics are read by path: key on their contents like the inputs.
+        # Paths are keyed too: cached warnings name the files they came from.
+        extra = [p for p in (cfg.pod_trace, cfg.usage_metrics) if p]
+        for p in [*paths, *extra]:
+            h.update(str(Path(p).resolve()).encode("utf-8") + b"\0")
+            file_hash = hashlib.sha256()
+            try:
+                with open(p, "rb") as f:
+                    while chunk := f.read(_READ_CHUNK):
+                        file_hash.update(chunk)
+            except FileNotFoundError as e:
+                raise ParseError(f"File not found: {p}") from e
+            h.update(file_hash.digest())
+        return h.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[EstimationResult]:
+        path = self._entry_path(key)
+        try:
+            payload = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        try:
+            result = EstimationResult.model_validate_json(payload)
+        except ValueError:
+            # Corrupt or stale entry: drop it and recompute
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key: str, result: EstimationResult) -> None:
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(result.model_dump_json(), encoding="utf-8")
+        os.replace(tmp, path)
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove least recently used entries beyond the size/count limits."""
+        entries = []
+        total = 0
+        if not self.directory.exists():
+            return 0
+        for sub in os.scandir(self.directory):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if not entry.name.endswith(".json"):
+                    continue
+                st = entry.stat()
+                entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                total += st.st_size
+        entries.sort()
+        removed = 0
+        count = len(entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes and count <= self.max_entries:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            count -= 1
+            removed += 1
+        return removed
+
+
+def orchestrate_cached(
+    paths: Iterable[str],
+    cfg: EstimationConfig,
+    cache: ResultCache,
+    *,
+    timings: Optional[Timings] = None,
+) -> EstimationResult:
+    """``orchestrate`` memoized through ``cache``.
+
+    Live-pricing runs bypass the cache since fetched prices are not versioned.
+    """
+    if cfg.live_pricing:
+        return orchestrate(paths, cfg, timings=timings)
+    t = timings or NULL_TIMINGS
+    path_list = list(paths)
+    with t.stage("cache_lookup"):
+        key = cache.key(path_list, cfg)
+        cached = cache.get(key)
+    if cached is not None:
+        t.count("cache_hits")
+        return cached
+    t.count("cache_misses")
+    result = orchestrate(path_list, cfg, timings=timings)
+    with t.stage("cache_store"):
+        try:
+            cache.put(key, result)
+        except OSError:
+            pass  # An unwritable cache must not fail the estimate
+    return result
@@ -1,20 +1,29 @@
 from __future__ import annotations
 
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
 
+# Parsed resources are plain slotted records: the parser creates one per manifest object,
+# so they skip pydantic validation and per-instance __dict__ overhead.
 
-class WorkloadItem(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class WorkloadItem:
     name: str
     namespace: Optional[str] = None
     kind: str
     replicas: int
-    cpu_vcpu_per_replica: float = Field(ge=0)
-    memory_gb_per_replica: float = Field(ge=0)
+    cpu_vcpu_per_replica: float  # >= 0
+    memory_gb_per_replica: float  # >= 0
+    ephemeral_storage_gb_per_replica: float = 0.0
+    labels: Optional[Dict[str, str]] = None  # only the keys requested for group-by
+    node_selector: Optional[Dict[str, str]] = None
+    tolerations: Optional[List[Dict[str, str]]] = None
 
 
-class StorageItem(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class StorageItem:
     name: str
     namespace: Optional[str] = None
     kind: str  # PersistentVolumeClaim or StatefulSetVolumeClaimTemplate
@@ -24,11 +33,53 @@ class StorageItem(BaseModel):
     storage_class_name: Optional[str] = None
     volume_type: Optional[str] = None  # e.g., gp3, gp2, io1, io2, st1, sc1, standard
     note: Optional[str] = None
+    labels: Optional[Dict[str, str]] = None
 
 
-class ServiceItem(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ServiceItem:
     name: str
     namespace: Optional[str] = None
     kind: str  # Service
     service_type: str  # ClusterIP | NodePort | LoadBalancer
     annotations: dict[str, str] | None = None
+    labels: Optional[Dict[str, str]] = None
+
+
+@dataclass(slots=True, kw_only=True)
+class BatchJobItem:
+    """Run-to-completion parameters of a Job or CronJob, for time-stepped simulation."""
+
+    name: str
+    namespace: Optional[str] = None
+    kind: str  # Job or CronJob
+    cpu_vcpu_per_pod: float
+    memory_gb_per_pod: float
+    completions: int = 1
+    parallelism: int = 1
+    schedule: Optional[str] = None  # CronJob only
+    concurrency_policy: str = "Allow"  # Allow | Forbid | Replace
+    duration_minutes: Optional[float] = None  # from the duration annotation
+    deadline_minutes: Optional[float] = None  # from activeDeadlineSeconds
+
+
+@dataclass(slots=True, kw_only=True)
+class HpaItem:
+    name: str
+    namespace: Optional[str] = None
+    target_kind: str
+    target_name: str
+    min_replicas: int = 1
+    max_replicas: int
+    target_cpu_utilization: Optional[float] = None  # fraction of requests, e.g. 0.7
+
+
+@dataclass(slots=True)
+class PodEvent:
+    """A pod arriving (with its requests) or departing at ``minute`` of a simulation."""
+
+    minute: float
+    pod: str
+    arrive: bool = True
+    cpu_vcpu: float = 0.0
+    memory_gb: float = 0.0
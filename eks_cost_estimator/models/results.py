@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
 
-class WorkloadCost(BaseModel):
+# Per-resource rows are slotted dataclasses built by the calculators in bulk; pydantic
+# models wrap them only at the API/render boundary (EstimationResult and friends),
+# where instances of these rows are accepted as-is and serialized by model_dump.
+
+
+@dataclass(slots=True, kw_only=True)
+class WorkloadCost:
     name: str
     namespace: Optional[str] = None
     kind: str
@@ -16,7 +23,8 @@ class WorkloadCost(BaseModel):
     monthly: float
 
 
-class StorageCost(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class StorageCost:
     name: str
     namespace: Optional[str] = None
     kind: str
@@ -30,7 +38,8 @@ class StorageCost(BaseModel):
     note: Optional[str] = None
 
 
-class LoadBalancerCost(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class LoadBalancerCost:
     name: str
     namespace: Optional[str] = None
     kind: str
@@ -40,6 +49,69 @@ class LoadBalancerCost(BaseModel):
     rate_hour: float
 
 
+@dataclass(slots=True, kw_only=True)
+class GroupCost:
+    key: Dict[str, str]
+    compute_hourly: float
+    compute_monthly: float
+    storage_hourly: float
+    storage_monthly: float
+    lb_hourly: float
+    lb_monthly: float
+    total_hourly: float
+    total_monthly: float
+
+
+@dataclass(slots=True, kw_only=True)
+class HpaWorkloadCost:
+    name: str
+    namespace: Optional[str] = None
+    kind: str
+    hpa: str
+    min_replicas: int
+    max_replicas: int
+    mean_replicas: float
+    peak_replicas: int
+    monthly_min: float
+    monthly_expected: float
+    monthly_max: float
+
+
+@dataclass(slots=True, kw_only=True)
+class FargatePodSize:
+    name: str
+    namespace: Optional[str] = None
+    kind: str
+    replicas: int
+    vcpu: float  # rounded-up Fargate configuration
+    memory_gib: float
+    billed_storage_gib: float  # ephemeral storage beyond the included 20 GiB
+    hourly_per_pod: float
+
+
+@dataclass(slots=True, kw_only=True)
+class PricingClassCost:
+    capacity_class: str  # on-demand or spot
+    workloads: int
+    on_demand_monthly: float
+    blended_monthly: float
+
+
+@dataclass(slots=True, kw_only=True)
+class RightsizingRecommendation:
+    name: str
+    namespace: Optional[str] = None
+    kind: str
+    replicas: int
+    samples: int  # usage samples across its containers
+    cpu_request: float  # per replica, from the manifests
+    cpu_recommended: float
+    memory_request_gb: float
+    memory_recommended_gb: float
+    monthly_current: float
+    monthly_recommended: float
+
+
 class BaselineInfo(BaseModel):
     region: str
     instance_type: str
@@ -63,6 +135,12 @@ class Totals(BaseModel):
     storage_monthly: float
     lb_hourly: float = 0.0
     lb_monthly: float = 0.0
+    # Purchased bin-packed nodes and their unallocated share (with --binpack); part of
+    # compute, not added to the grand totals
+    node_hourly: Optional[float] = None
+    node_monthly: Optional[float] = None
+    idle_hourly: Optional[float] = None
+    idle_monthly: Optional[float] = None
 
     @property
     def grand_hourly(self) -> float:  # pragma: no cover - convenience
@@ -82,25 +160,41 @@ class EstimationResult(BaseModel):
     totals: Totals
     assumptions: List[str]
     warnings: List[str]
+    warning_counts: Dict[str, int] = {}
     binpacking: Optional["BinPackingResult"] = None
+    groups: Optional[List[GroupCost]] = None
+    job_simulation: Optional["JobSimulationResult"] = None
+    hpa_simulation: Optional["HpaSimulationResult"] = None
+    monte_carlo: Optional["MonteCarloResult"] = None
+    autoscaler: Optional["AutoscalerSimulationResult"] = None
+    fargate: Optional["FargateResult"] = None  # compute priced as Fargate pods
+    blended_pricing: Optional["BlendedPricingResult"] = None
+    rightsizing: Optional["RightsizingResult"] = None
 
 
-class NodeBinAllocation(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class NodeBinAllocation:
     workload: str
     namespace: Optional[str] = None
     kind: str
     replicas: int
     cpu_vcpu: float
     memory_gb: float
+    monthly_cost: float = 0.0  # share of the node cost by dominant resource
 
 
-class NodeBin(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class NodeBin:
     index: int
     cpu_capacity: float
     mem_capacity_gb: float
     cpu_used: float
     mem_used_gb: float
     allocations: List[NodeBinAllocation]
+    pool: Optional[str] = None
+    hourly_price: float = 0.0
+    monthly_cost: float = 0.0
+    idle_monthly: float = 0.0  # node cost no allocation accounts for
 
 
 class BinPackingResult(BaseModel):
@@ -113,3 +207,126 @@ class BinPackingResult(BaseModel):
     cpu_utilization: float  # total used / total capacity
     mem_utilization: float
     nodes: List[NodeBin]
+    pool: Optional[str] = None
+    pools: Optional[List["BinPackingResult"]] = None  # per node pool, when partitioned
+    node_monthly: float = 0.0  # set by attribute_node_costs
+    allocated_monthly: float = 0.0
+    idle_monthly: float = 0.0
+
+
+class JobSimulationResult(BaseModel):
+    """Node usage over a simulated month with Jobs/CronJobs started and finished in time."""
+
+    instance_type: str
+    horizon_minutes: int
+    start: str  # ISO timestamp of minute 0
+    batch_workloads: int
+    job_runs: int
+    runs_skipped: int  # CronJob firings dropped by concurrencyPolicy: Forbid
+    pod_starts: int
+    steady_node_count: int  # nodes for the long-running workloads alone
+    peak_node_count: int
+    peak_minute: int
+    average_node_count: float  # time-weighted
+    node_hours: float
+    monthly_node_cost: float
+
+
+class HpaSimulationResult(BaseModel):
+    """Compute cost over a month of hourly HPA replica counts, all workloads included."""
+
+    hours: int
+    hpa_count: int
+    monthly_min: float  # every autoscaled workload at minReplicas
+    monthly_expected: float  # replicas following the load profile
+    monthly_max: float  # every autoscaled workload at maxReplicas
+    peak_hourly: float
+    peak_hour: int
+    hourly_expected: List[float]
+    workloads: List[HpaWorkloadCost]
+
+
+class MonteCarloResult(BaseModel):
+    """Distribution of monthly totals over sampled replicas, spot prices and packing."""
+
+    trials: int
+    seed: int
+    spot_share: float
+    autoscaled_workloads: int
+    fixed_monthly: float  # storage and load balancers, identical in every trial
+    mean_monthly: float
+    std_monthly: float
+    min_monthly: float
+    p50_monthly: float
+    p90_monthly: float
+    p99_monthly: float
+    max_monthly: float
+
+
+class AutoscalerSimulationResult(BaseModel):
+    """Node time over a replay of pod events under cluster-autoscaler rules."""
+
+    instance_type: str
+    horizon_minutes: int
+    scale_down_utilization: float
+    scale_down_delay_minutes: float
+    max_nodes: Optional[int] = None
+    events: int
+    scale_ups: int
+    scale_downs: int
+    pods_unschedulable: int  # larger than an empty node
+    peak_pending_pods: int  # waiting for capacity at max_nodes
+    pending_pod_hours: float
+    peak_node_count: int
+    peak_minute: float
+    average_node_count: float  # time-weighted
+    node_hours: float
+    monthly_node_cost: float
+    hourly_cost: List[float]  # node cost in each hour of the horizon
+
+
+class FargateResult(BaseModel):
+    """Fargate pod sizes behind the compute rows, and the cost of rounding up."""
+
+    vcpu_hour: float
+    gb_hour: float
+    storage_gb_hour: float
+    pods: List[FargatePodSize]
+    requested_vcpu: float  # all replicas of supported workloads
+    requested_memory_gib: float
+    billed_vcpu: float
+    billed_memory_gib: float  # includes the per-pod overhead
+    unsupported: int  # DaemonSets and pods larger than any configuration
+
+
+class BlendedPricingResult(BaseModel):
+    """Monthly compute cost mixing on-demand, spot and an optimized commitment."""
+
+    on_demand_price: float
+    spot_price: Optional[float] = None  # mean from the price history
+    spot_ratio: float  # spot / on-demand
+    commitment_discount: float
+    commitment_hourly: float  # on-demand-equivalent spend covered per hour
+    commitment_spend_monthly: float
+    commitment_utilization: float  # share of the commitment used
+    commitment_coverage: float  # share of on-demand-class usage covered
+    on_demand_monthly: float  # everything at on-demand prices
+    blended_monthly: float
+    classes: List[PricingClassCost]
+
+
+class RightsizingResult(BaseModel):
+    """Requests recommended from recorded usage quantiles, re-priced."""
+
+    cpu_quantile: float
+    memory_quantile: float
+    headroom: float  # added on top of the observed quantile
+    samples: int
+    unmatched_samples: int  # pods no parsed workload owns
+    containers: int
+    workloads: List[RightsizingRecommendation]  # those with usage samples
+    current_monthly: float  # compute, all workloads
+    recommended_monthly: float
+    savings_monthly: float
+    current_node_count: Optional[int] = None  # with --binpack
+    recommended_node_count: Optional[int] = None
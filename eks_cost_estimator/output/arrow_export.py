@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from operator import attrgetter, itemgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from eks_cost_estimator.core.exceptions import EstimatorError
+from eks_cost_estimator.models.results import EstimationResult
+
+
+EXPORT_FORMATS = ("parquet", "arrow")
+DEFAULT_BATCH_ROWS = 65_536
+
+# (column, arrow type name) per table; type names resolve against pyarrow lazily
+_STR, _INT, _FLOAT = "string", "int64", "float64"
+
+_WORKLOAD_COLUMNS: List[Tuple[str, str]] = [
+    ("name", _STR),
+    ("namespace", _STR),
+    ("kind", _STR),
+    ("replicas", _INT),
+    ("cpu_vcpu_per_replica", _FLOAT),
+    ("memory_gb_per_replica", _FLOAT),
+    ("hourly", _FLOAT),
+    ("monthly", _FLOAT),
+]
+_STORAGE_COLUMNS: List[Tuple[str, str]] = [
+    ("name", _STR),
+    ("namespace", _STR),
+    ("kind", _STR),
+    ("size_gb", _FLOAT),
+    ("replicas", _INT),
+    ("multiply_by_replicas", _INT),
+    ("monthly", _FLOAT),
+    ("hourly", _FLOAT),
+    ("rate_gb_month", _FLOAT),
+    ("volume_type", _STR),
+    ("note", _STR),
+]
+_LB_COLUMNS: List[Tuple[str, str]] = [
+    ("name", _STR),
+    ("namespace", _STR),
+    ("kind", _STR),
+    ("service_type", _STR),
+    ("hourly", _FLOAT),
+    ("monthly", _FLOAT),
+    ("rate_hour", _FLOAT),
+]
+_ALLOCATION_COLUMNS: List[Tuple[str, str]] = [
+    ("node", _INT),
+    ("workload", _STR),
+    ("namespace", _STR),
+    ("kind", _STR),
+    ("replicas", _INT),
+    ("cpu_vcpu", _FLOAT),
+    ("memory_gb", _FLOAT),
+    ("monthly_cost", _FLOAT),
+]
+
+
+class ArrowExportError(EstimatorError):
+    """Raised when columnar export is unavailable or fails."""
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow  # type: ignore
+        import pyarrow.ipc  # type: ignore  # noqa: F401
+        import pyarrow.parquet  # type: ignore  # noqa: F401
+    except Exception as e:  # noqa: BLE001
+        raise ArrowExportError(
+            "pyarrow is required for Arrow/Parquet export. "
+            "Install with `pip install eks-cost-estimator[arrow]`."
+        ) from e
+    return pyarrow
+
+
+def _schema(pa: Any, columns: Sequence[Tuple[str, str]]) -> Any:
+    return pa.schema([pa.field(name, getattr(pa, type_name)()) for name, type_name in columns])
+
+
+def _batches(
+    pa: Any,
+    schema: Any,
+    rows: Iterable[Any],
+    getters: Sequence[Callable[[Any], Any]],
+    batch_rows: int,
+) -> Iterator[Any]:
+    """Transpose rows into column buffers, flushing a RecordBatch every ``batch_rows``."""
+    buffers: List[List[Any]] = [[] for _ in getters]
+    filled = 0
+    for row in rows:
+        for buf, get in zip(buffers, getters):
+            buf.append(get(row))
+        filled += 1
+        if filled == batch_rows:
+            yield pa.RecordBatch.from_arrays(
+                [pa.array(b, type=f.type) for b, f in zip(buffers, schema)], schema=schema
+            )
+            buffers = [[] for _ in getters]
+            filled = 0
+    if filled:
+        yield pa.RecordBatch.from_arrays(
+            [pa.array(b, type=f.type) for b, f in zip(buffers, schema)], schema=schema
+        )
+
+
+def _write_table(
+    pa: Any,
+    path: Path,
+    fmt: str,
+    columns: Sequence[Tuple[str, str]],
+    rows: Iterable[Any],
+    getters: Sequence[Callable[[Any], Any]],
+    batch_rows: int,
+) -> int:
+    schema = _schema(pa, columns)
+    written = 0
+    if fmt == "parquet":
+        writer = pa.parquet.ParquetWriter(str(path), schema)
+    else:
+        writer = pa.ipc.new_file(str(path), schema)
+    try:
+        for batch in _batches(pa, schema, rows, getters, batch_rows):
+            writer.write_batch(batch)
+            written += batch.num_rows
+    finally:
+        writer.close()
+    return written
+
+
+def _attr_getters(columns: Sequence[Tuple[str, str]]) -> List[Callable[[Any], Any]]:
+    return [attrgetter(name) for name, _ in columns]
+
+
+def _allocation_rows(result: EstimationResult) -> Iterator[Tuple[Any, ...]]:
+    if result.binpacking is None:
+        return
+    for node in result.binpacking.nodes:
+        for a in node.allocations:
+            yield (
+                node.index,
+                a.workload,
+                a.namespace,
+                a.kind,
+                a.replicas,
+                a.cpu_vcpu,
+                a.memory_gb,
+                a.monthly_cost,
+            )
+
+
+def export_result(
+    result: EstimationResult,
+    directory: Path,
+    *,
+    fmt: str = "parquet",
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+) -> Dict[str, int]:
+    """Write workloads, storage, load balancers and bin-packing allocations as columnar files.
+
+    One file per table (``<table>.parquet`` or ``<table>.arrow``) is written under
+    ``directory`` in record batches of at most ``batch_rows`` rows. Only the column
+    buffers of one batch are held on top of ``result``, which is already fully in
+    memory. Returns the number of rows written per table.
+    """
+    fmt = fmt.lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ArrowExportError(f"Unknown export format '{fmt}'. Use {'|'.join(EXPORT_FORMATS)}")
+    pa = _pyarrow()
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    alloc_getters = [itemgetter(i) for i in range(len(_ALLOCATION_COLUMNS))]
+    tables: List[
+        Tuple[str, List[Tuple[str, str]], Iterable[Any], Sequence[Callable[[Any], Any]]]
+    ] = [
+        ("workloads", _WORKLOAD_COLUMNS, result.workloads, _attr_getters(_WORKLOAD_COLUMNS)),
+        ("storage", _STORAGE_COLUMNS, result.storage, _attr_getters(_STORAGE_COLUMNS)),
+        ("load_balancers", _LB_COLUMNS, result.load_balancers, _attr_getters(_LB_COLUMNS)),
+        ("binpack_allocations", _ALLOCATION_COLUMNS, _allocation_rows(result), alloc_getters),
+    ]
+    counts: Dict[str, int] = {}
+    for name, columns, rows, getters in tables:
+        path = directory / f"{name}.{fmt}"
+        try:
+            counts[name] = _write_table(pa, path, fmt, columns, rows, getters, batch_rows)
+        except (OSError, pa.ArrowException) as e:
+            raise ArrowExportError(f"Failed to write {path}: {e}") from e
+    return counts
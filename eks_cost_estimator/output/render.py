@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import csv
+import heapq
 import io
 import json
-from typing import Any
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
 
 from rich.console import Console
 from rich.table import Table
@@ -11,10 +12,67 @@ from rich.table import Table
 from eks_cost_estimator.models.results import EstimationResult
 
 
-def render_table(result: EstimationResult) -> None:
-    console = Console()
+DEFAULT_PAGE_SIZE = 50
 
-    table = Table(title="Compute Cost Estimates")
+T = TypeVar("T")
+
+
+def _select_rows(
+    rows: Sequence[T],
+    key: Callable[[T], float],
+    *,
+    top: Optional[int],
+    page: Optional[int],
+) -> Tuple[List[T], str]:
+    """Pick the rows to display and a title suffix describing the selection.
+
+    Without ``top``/``page`` every row is shown in its original order. Otherwise rows
+    are ranked by ``key`` descending and only the requested slice is extracted with a
+    bounded heap (``heapq.nlargest``). Pages reaching past half the section sort it
+    instead, where the heap would be no cheaper.
+    """
+    if top is None and page is None:
+        return list(rows), ""
+    size = max(1, top or DEFAULT_PAGE_SIZE)
+    if page is None:
+        selected = heapq.nlargest(size, rows, key=key)
+        return selected, f" (top {len(selected)} of {len(rows)})"
+    pages = max(1, -(-len(rows) // size))
+    first = (max(1, page) - 1) * size
+    if first + size > len(rows) // 2:
+        ranked = sorted(rows, key=key, reverse=True)
+    else:
+        ranked = heapq.nlargest(first + size, rows, key=key)
+    selected = ranked[first : first + size]
+    return selected, f" (page {page}/{pages}, {len(rows)} rows)"
+
+
+def _other_label(hidden: int) -> str:
+    return f"other ({hidden} rows)"
+
+
+def _hidden_sums(rows: Sequence[Any], shown: Sequence[Any], *fields: str) -> List[float]:
+    """Totals of ``fields`` over the rows ``_select_rows`` left out of ``shown``."""
+    return [sum(getattr(r, f) for r in rows) - sum(getattr(r, f) for r in shown) for f in fields]
+
+
+def render_table(
+    result: EstimationResult,
+    *,
+    top: Optional[int] = None,
+    page: Optional[int] = None,
+    console: Optional[Console] = None,
+) -> None:
+    """Render the estimate as rich tables.
+
+    With ``top`` each section shows its N most expensive rows (bin-packing nodes: the
+    most utilized) and folds the rest into one "other" row; ``page`` shows the K-th
+    slice of that ranking instead.
+    """
+    console = console or Console()
+
+    workloads, suffix = _select_rows(result.workloads, lambda w: w.monthly, top=top, page=page)
+    table = Table(title="Compute Cost Estimates" + suffix)
     table.add_column("Resource")
     table.add_column("Kind")
     table.add_column("Namespace")
@@ -24,7 +82,7 @@ def render_table(result: EstimationResult) -> None:
     table.add_column("Hourly ($)", justify="right")
     table.add_column("Monthly ($)", justify="right")
 
-    for w in result.workloads:
+    for w in workloads:
         table.add_row(
             w.name,
             w.kind,
@@ -35,10 +93,47 @@ def render_table(result: EstimationResult) -> None:
             f"{w.hourly:.4f}",
             f"{w.monthly:.2f}",
         )
+    hidden = len(result.workloads) - len(workloads)
+    if hidden:
+        hourly, monthly = _hidden_sums(result.workloads, workloads, "hourly", "monthly")
+        table.add_row(_other_label(hidden), *([""] * 5), f"{hourly:.4f}", f"{monthly:.2f}")
 
     console.print(table)
 
-    st_table = Table(title="Storage Cost Estimates")
+    if result.fargate is not None:
+        fg = result.fargate
+        pods, suffix = _select_rows(
+            fg.pods, lambda p: p.hourly_per_pod * p.replicas, top=top, page=page
+        )
+        fg_table = Table(
+            title="Fargate Pod Sizes" + suffix,
+            caption=f"Requested {fg.requested_vcpu:.2f} vCPU / {fg.requested_memory_gib:.2f} GiB, "
+            f"billed {fg.billed_vcpu:.2f} vCPU / {fg.billed_memory_gib:.2f} GiB",
+        )
+        fg_table.add_column("Resource")
+        fg_table.add_column("Namespace")
+        fg_table.add_column("Replicas", justify="right")
+        fg_table.add_column("vCPU", justify="right")
+        fg_table.add_column("Memory (GiB)", justify="right")
+        fg_table.add_column("Extra storage (GiB)", justify="right")
+        fg_table.add_column("$/pod-hour", justify="right")
+        for p in pods:
+            fg_table.add_row(
+                p.name,
+                p.namespace or "",
+                str(p.replicas),
+                f"{p.vcpu:g}",
+                f"{p.memory_gib:g}",
+                f"{p.billed_storage_gib:.1f}",
+                f"{p.hourly_per_pod:.5f}",
+            )
+        hidden = len(fg.pods) - len(pods)
+        if hidden:
+            fg_table.add_row(_other_label(hidden), *([""] * 6))
+        console.print(fg_table)
+
+    storage, suffix = _select_rows(result.storage, lambda s: s.monthly, top=top, page=page)
+    st_table = Table(title="Storage Cost Estimates" + suffix)
     st_table.add_column("Resource")
     st_table.add_column("Kind")
     st_table.add_column("Namespace")
@@ -50,7 +145,7 @@ def render_table(result: EstimationResult) -> None:
     st_table.add_column("Hourly ($)", justify="right")
     st_table.add_column("Monthly ($)", justify="right")
 
-    for s in result.storage:
+    for s in storage:
         st_table.add_row(
             s.name,
             s.kind,
@@ -63,17 +158,22 @@ def render_table(result: EstimationResult) -> None:
             f"{s.hourly:.4f}",
             f"{s.monthly:.2f}",
         )
+    hidden = len(result.storage) - len(storage)
+    if hidden:
+        hourly, monthly = _hidden_sums(result.storage, storage, "hourly", "monthly")
+        st_table.add_row(_other_label(hidden), *([""] * 7), f"{hourly:.4f}", f"{monthly:.2f}")
 
     console.print(st_table)
 
     if result.load_balancers:
-        lb_table = Table(title="Load Balancer Cost Estimates")
+        lbs, suffix = _select_rows(result.load_balancers, lambda lb: lb.monthly, top=top, page=page)
+        lb_table = Table(title="Load Balancer Cost Estimates" + suffix)
         lb_table.add_column("Service")
         lb_table.add_column("Namespace")
         lb_table.add_column("Type")
         lb_table.add_column("Hourly ($)", justify="right")
         lb_table.add_column("Monthly ($)", justify="right")
-        for lb in result.load_balancers:
+        for lb in lbs:
             lb_table.add_row(
                 lb.name,
                 lb.namespace or "",
@@ -81,6 +181,10 @@ def render_table(result: EstimationResult) -> None:
                 f"{lb.hourly:.4f}",
                 f"{lb.monthly:.2f}",
             )
+        hidden = len(result.load_balancers) - len(lbs)
+        if hidden:
+            hourly, monthly = _hidden_sums(result.load_balancers, lbs, "hourly", "monthly")
+            lb_table.add_row(_other_label(hidden), "", "", f"{hourly:.4f}", f"{monthly:.2f}")
         console.print(lb_table)
 
     total_table = Table(title="Totals")
@@ -100,46 +204,306 @@ def render_table(result: EstimationResult) -> None:
         "Grand Monthly",
         f"{(result.totals.compute_monthly + result.totals.storage_monthly + result.totals.lb_monthly):.2f}",
     )
+    if result.totals.node_monthly is not None:
+        total_table.add_row("Bin-packed Nodes Monthly", f"{result.totals.node_monthly:.2f}")
+        total_table.add_row("Idle Capacity Monthly", f"{result.totals.idle_monthly or 0.0:.2f}")
     console.print(total_table)
 
+    if result.blended_pricing is not None:
+        blend = result.blended_pricing
+        blend_table = Table(
+            title="Blended Pricing",
+            caption=f"Commitment: ${blend.commitment_hourly:.4f}/h on-demand equivalent "
+            f"at {blend.commitment_discount:.0%} off, "
+            f"{blend.commitment_utilization:.0%} used, "
+            f"covering {blend.commitment_coverage:.0%} of on-demand usage",
+        )
+        blend_table.add_column("Capacity")
+        blend_table.add_column("Workloads", justify="right")
+        blend_table.add_column("On-demand Monthly ($)", justify="right")
+        blend_table.add_column("Blended Monthly ($)", justify="right")
+        for c in blend.classes:
+            blend_table.add_row(
+                c.capacity_class,
+                str(c.workloads),
+                f"{c.on_demand_monthly:.2f}",
+                f"{c.blended_monthly:.2f}",
+            )
+        blend_table.add_row(
+            "All compute",
+            "",
+            f"{blend.on_demand_monthly:.2f}",
+            f"{blend.blended_monthly:.2f}",
+        )
+        console.print(blend_table)
+
+    if result.rightsizing is not None:
+        rs = result.rightsizing
+        rows, suffix = _select_rows(
+            rs.workloads,
+            lambda rec: rec.monthly_current - rec.monthly_recommended,
+            top=top,
+            page=page,
+        )
+        caption = (
+            f"p{rs.cpu_quantile * 100:g} CPU / p{rs.memory_quantile * 100:g} memory "
+            f"+ {rs.headroom:.0%} headroom; {rs.samples} samples, "
+            f"{rs.unmatched_samples} unmatched"
+        )
+        if rs.current_node_count is not None:
+            caption += f"; nodes {rs.current_node_count} -> {rs.recommended_node_count}"
+        rs_table = Table(title="Rightsizing" + suffix, caption=caption)
+        rs_table.add_column("Workload")
+        rs_table.add_column("Namespace")
+        rs_table.add_column("CPU (vCPU)", justify="right")
+        rs_table.add_column("Memory (GB)", justify="right")
+        rs_table.add_column("Monthly ($)", justify="right")
+        rs_table.add_column("Savings ($)", justify="right")
+        for rec in rows:
+            rs_table.add_row(
+                rec.name,
+                rec.namespace or "",
+                f"{rec.cpu_request:.3f} -> {rec.cpu_recommended:.3f}",
+                f"{rec.memory_request_gb:.3f} -> {rec.memory_recommended_gb:.3f}",
+                f"{rec.monthly_current:.2f} -> {rec.monthly_recommended:.2f}",
+                f"{rec.monthly_current - rec.monthly_recommended:.2f}",
+            )
+        rs_table.add_row(
+            "All compute",
+            "",
+            "",
+            "",
+            f"{rs.current_monthly:.2f} -> {rs.recommended_monthly:.2f}",
+            f"{rs.savings_monthly:.2f}",
+        )
+        console.print(rs_table)
+
+    if result.groups:
+        groups, suffix = _select_rows(result.groups, lambda g: g.total_monthly, top=top, page=page)
+        key_names = list(result.groups[0].key)
+        g_table = Table(title="Cost by Group" + suffix)
+        for name in key_names:
+            g_table.add_column(name)
+        g_table.add_column("Compute Monthly ($)", justify="right")
+        g_table.add_column("Storage Monthly ($)", justify="right")
+        g_table.add_column("LB Monthly ($)", justify="right")
+        g_table.add_column("Hourly ($)", justify="right")
+        g_table.add_column("Monthly ($)", justify="right")
+        for g in groups:
+            g_table.add_row(
+                *(g.key[name] for name in key_names),
+                f"{g.compute_monthly:.2f}",
+                f"{g.storage_monthly:.2f}",
+                f"{g.lb_monthly:.2f}",
+                f"{g.total_hourly:.4f}",
+                f"{g.total_monthly:.2f}",
+            )
+        hidden = len(result.groups) - len(groups)
+        if hidden:
+            compute_m, storage_m, lb_m, total_h, total_m = _hidden_sums(
+                result.groups,
+                groups,
+                "compute_monthly",
+                "storage_monthly",
+                "lb_monthly",
+                "total_hourly",
+                "total_monthly",
+            )
+            g_table.add_row(
+                _other_label(hidden),
+                *([""] * (len(key_names) - 1)),
+                f"{compute_m:.2f}",
+                f"{storage_m:.2f}",
+                f"{lb_m:.2f}",
+                f"{total_h:.4f}",
+                f"{total_m:.2f}",
+            )
+        console.print(g_table)
+
     # Bin-packing simulation (if present)
     if result.binpacking is not None:
         bp = result.binpacking
         bp_summary = Table(title="Bin-Packing Simulation Summary")
+        if bp.pools:
+            bp_summary.add_column("Pool")
         bp_summary.add_column("Instance")
         bp_summary.add_column("Nodes", justify="right")
         bp_summary.add_column("CPU cap/node", justify="right")
         bp_summary.add_column("Mem cap/node (GB)", justify="right")
         bp_summary.add_column("CPU util", justify="right")
         bp_summary.add_column("Mem util", justify="right")
-        bp_summary.add_row(
-            bp.instance_type,
-            str(bp.node_count),
-            f"{bp.cpu_capacity_per_node:.2f}",
-            f"{bp.mem_capacity_gb_per_node:.2f}",
-            f"{bp.cpu_utilization*100:.1f}%",
-            f"{bp.mem_utilization*100:.1f}%",
-        )
+        bp_summary.add_column("Node Monthly ($)", justify="right")
+        bp_summary.add_column("Idle Monthly ($)", justify="right")
+        for row in bp.pools or [bp]:
+            bp_summary.add_row(
+                *([row.pool or ""] if bp.pools else []),
+                row.instance_type,
+                str(row.node_count),
+                f"{row.cpu_capacity_per_node:.2f}",
+                f"{row.mem_capacity_gb_per_node:.2f}",
+                f"{row.cpu_utilization*100:.1f}%",
+                f"{row.mem_utilization*100:.1f}%",
+                f"{row.node_monthly:.2f}",
+                f"{row.idle_monthly:.2f}",
+            )
+        if bp.pools and len(bp.pools) > 1:
+            bp_summary.add_row(
+                "all",
+                "",
+                str(bp.node_count),
+                "",
+                "",
+                f"{bp.cpu_utilization*100:.1f}%",
+                f"{bp.mem_utilization*100:.1f}%",
+                f"{bp.node_monthly:.2f}",
+                f"{bp.idle_monthly:.2f}",
+            )
         console.print(bp_summary)
 
-        bp_nodes = Table(title="Bin-Packing: Node Allocation Details")
+        nodes, suffix = _select_rows(
+            bp.nodes,
+            lambda n: max(
+                n.cpu_used / n.cpu_capacity if n.cpu_capacity > 0 else 0.0,
+                n.mem_used_gb / n.mem_capacity_gb if n.mem_capacity_gb > 0 else 0.0,
+            ),
+            top=top,
+            page=page,
+        )
+        bp_nodes = Table(title="Bin-Packing: Node Allocation Details" + suffix)
         bp_nodes.add_column("Node")
         bp_nodes.add_column("CPU used / cap", justify="right")
         bp_nodes.add_column("Mem used / cap (GB)", justify="right")
+        bp_nodes.add_column("Monthly / idle ($)", justify="right")
         bp_nodes.add_column("Allocations")
-        for n in bp.nodes:
+        for n in nodes:
             allocs = ", ".join(
                 f"{a.workload} x{a.replicas}" if a.namespace is None else f"{a.workload} ({a.namespace}) x{a.replicas}"
                 for a in n.allocations
             )
             bp_nodes.add_row(
-                f"node-{n.index}",
+                f"{n.pool}/node-{n.index}" if n.pool else f"node-{n.index}",
                 f"{n.cpu_used:.2f} / {n.cpu_capacity:.2f}",
                 f"{n.mem_used_gb:.2f} / {n.mem_capacity_gb:.2f}",
+                f"{n.monthly_cost:.2f} / {n.idle_monthly:.2f}",
                 allocs,
             )
+        hidden = len(bp.nodes) - len(nodes)
+        if hidden:
+            cpu, mem, node_m, idle_m = _hidden_sums(
+                bp.nodes, nodes, "cpu_used", "mem_used_gb", "monthly_cost", "idle_monthly"
+            )
+            bp_nodes.add_row(
+                _other_label(hidden), f"{cpu:.2f}", f"{mem:.2f}", f"{node_m:.2f} / {idle_m:.2f}", ""
+            )
         console.print(bp_nodes)
 
+    if result.hpa_simulation is not None:
+        hs = result.hpa_simulation
+        hpa_rows, suffix = _select_rows(
+            hs.workloads, lambda hr: hr.monthly_expected, top=top, page=page
+        )
+        hpa_table = Table(
+            title=f"HPA Simulation ({hs.hours} h)" + suffix,
+            caption=f"Peak hourly compute: ${hs.peak_hourly:.4f} at hour {hs.peak_hour}",
+        )
+        hpa_table.add_column("Workload")
+        hpa_table.add_column("Namespace")
+        hpa_table.add_column("HPA")
+        hpa_table.add_column("Replicas min/mean/peak/max", justify="right")
+        hpa_table.add_column("Monthly min ($)", justify="right")
+        hpa_table.add_column("Monthly expected ($)", justify="right")
+        hpa_table.add_column("Monthly max ($)", justify="right")
+        for hr in hpa_rows:
+            hpa_table.add_row(
+                hr.name,
+                hr.namespace or "",
+                hr.hpa,
+                f"{hr.min_replicas}/{hr.mean_replicas:.1f}/{hr.peak_replicas}/{hr.max_replicas}",
+                f"{hr.monthly_min:.2f}",
+                f"{hr.monthly_expected:.2f}",
+                f"{hr.monthly_max:.2f}",
+            )
+        hidden = len(hs.workloads) - len(hpa_rows)
+        if hidden:
+            sums = _hidden_sums(
+                hs.workloads, hpa_rows, "monthly_min", "monthly_expected", "monthly_max"
+            )
+            hpa_table.add_row(_other_label(hidden), "", "", "", *(f"{v:.2f}" for v in sums))
+        hpa_table.add_row(
+            "All compute",
+            "",
+            "",
+            "",
+            f"{hs.monthly_min:.2f}",
+            f"{hs.monthly_expected:.2f}",
+            f"{hs.monthly_max:.2f}",
+        )
+        console.print(hpa_table)
+
+    if result.job_simulation is not None:
+        js = result.job_simulation
+        js_table = Table(title=f"Job Simulation ({js.horizon_minutes / 1440:g} days)")
+        js_table.add_column("Metric")
+        js_table.add_column("Value", justify="right")
+        js_table.add_row("Instance", js.instance_type)
+        js_table.add_row("Jobs/CronJobs simulated", str(js.batch_workloads))
+        js_table.add_row("Job runs (skipped)", f"{js.job_runs} ({js.runs_skipped})")
+        js_table.add_row("Pod starts", str(js.pod_starts))
+        js_table.add_row("Nodes without jobs", str(js.steady_node_count))
+        js_table.add_row("Peak nodes", f"{js.peak_node_count} (minute {js.peak_minute})")
+        js_table.add_row("Time-averaged nodes", f"{js.average_node_count:.2f}")
+        js_table.add_row("Node-hours", f"{js.node_hours:.1f}")
+        js_table.add_row("Monthly node cost ($)", f"{js.monthly_node_cost:.2f}")
+        console.print(js_table)
+
+    if result.autoscaler is not None:
+        ca = result.autoscaler
+        peak_hour = max(range(len(ca.hourly_cost)), key=ca.hourly_cost.__getitem__, default=0)
+        ca_table = Table(title=f"Autoscaler Simulation ({ca.horizon_minutes / 1440:g} days)")
+        ca_table.add_column("Metric")
+        ca_table.add_column("Value", justify="right")
+        ca_table.add_row("Instance", ca.instance_type)
+        ca_table.add_row(
+            "Scale-down rule",
+            f"< {ca.scale_down_utilization:.0%} for {ca.scale_down_delay_minutes:g} min",
+        )
+        ca_table.add_row("Max nodes", str(ca.max_nodes) if ca.max_nodes is not None else "-")
+        ca_table.add_row("Pod events", str(ca.events))
+        ca_table.add_row("Scale-ups / scale-downs", f"{ca.scale_ups} / {ca.scale_downs}")
+        ca_table.add_row("Peak nodes", f"{ca.peak_node_count} (minute {ca.peak_minute:g})")
+        ca_table.add_row("Time-averaged nodes", f"{ca.average_node_count:.2f}")
+        ca_table.add_row("Node-hours", f"{ca.node_hours:.1f}")
+        if ca.hourly_cost:
+            ca_table.add_row(
+                "Peak hourly node cost ($)", f"{ca.hourly_cost[peak_hour]:.4f} (hour {peak_hour})"
+            )
+        if ca.pods_unschedulable or ca.peak_pending_pods:
+            ca_table.add_row("Pods larger than a node", str(ca.pods_unschedulable))
+            ca_table.add_row(
+                "Peak pending pods (pod-hours)",
+                f"{ca.peak_pending_pods} ({ca.pending_pod_hours:.1f})",
+            )
+        ca_table.add_row("Monthly node cost ($)", f"{ca.monthly_node_cost:.2f}")
+        console.print(ca_table)
+
+    if result.monte_carlo is not None:
+        mc = result.monte_carlo
+        mc_table = Table(title=f"Monte Carlo ({mc.trials} trials, seed {mc.seed})")
+        mc_table.add_column("Statistic")
+        mc_table.add_column("Monthly total ($)", justify="right")
+        for label, value in (
+            ("Min", mc.min_monthly),
+            ("P50", mc.p50_monthly),
+            ("Mean", mc.mean_monthly),
+            ("P90", mc.p90_monthly),
+            ("P99", mc.p99_monthly),
+            ("Max", mc.max_monthly),
+        ):
+            mc_table.add_row(label, f"{value:.2f}")
+        mc_table.add_row("Std dev", f"{mc.std_monthly:.2f}")
+        mc_table.add_row("Storage + LB (fixed)", f"{mc.fixed_monthly:.2f}")
+        console.print(mc_table)
+
 
 def render_json(result: EstimationResult) -> str:
     data = result.model_dump()
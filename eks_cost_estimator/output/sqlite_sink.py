@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from eks_cost_estimator.core.exceptions import EstimatorError
+from eks_cost_estimator.models.results import EstimationResult
+
+
+SQLITE_SCHEME = "sqlite:///"
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    label TEXT,
+    region TEXT NOT NULL,
+    instance_type TEXT NOT NULL,
+    baseline_price REAL NOT NULL,
+    baseline_vcpu REAL NOT NULL,
+    baseline_memory_gb REAL NOT NULL,
+    cpu_weight REAL NOT NULL,
+    mem_weight REAL NOT NULL,
+    per_vcpu_hour REAL NOT NULL,
+    per_gb_ram_hour REAL NOT NULL,
+    compute_hourly REAL NOT NULL,
+    compute_monthly REAL NOT NULL,
+    storage_hourly REAL NOT NULL,
+    storage_monthly REAL NOT NULL,
+    lb_hourly REAL NOT NULL,
+    lb_monthly REAL NOT NULL,
+    node_count INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs (created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_label ON runs (label, created_at);
+
+CREATE TABLE IF NOT EXISTS workloads (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    namespace TEXT,
+    kind TEXT NOT NULL,
+    replicas INTEGER NOT NULL,
+    cpu_vcpu_per_replica REAL NOT NULL,
+    memory_gb_per_replica REAL NOT NULL,
+    hourly REAL NOT NULL,
+    monthly REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_workloads_run ON workloads (run_id);
+CREATE INDEX IF NOT EXISTS idx_workloads_identity ON workloads (namespace, kind, name);
+
+CREATE TABLE IF NOT EXISTS storage (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    namespace TEXT,
+    kind TEXT NOT NULL,
+    size_gb REAL NOT NULL,
+    replicas INTEGER NOT NULL,
+    multiply_by_replicas INTEGER NOT NULL,
+    volume_type TEXT,
+    rate_gb_month REAL NOT NULL,
+    hourly REAL NOT NULL,
+    monthly REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_storage_run ON storage (run_id);
+CREATE INDEX IF NOT EXISTS idx_storage_identity ON storage (namespace, kind, name);
+
+CREATE TABLE IF NOT EXISTS load_balancers (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    namespace TEXT,
+    service_type TEXT NOT NULL,
+    rate_hour REAL NOT NULL,
+    hourly REAL NOT NULL,
+    monthly REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_load_balancers_run ON load_balancers (run_id);
+
+CREATE TABLE IF NOT EXISTS messages (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    level TEXT NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_messages_run ON messages (run_id);
+"""
+
+
+class SinkError(EstimatorError):
+    """Raised when a results sink URL is invalid or the write fails."""
+
+
+def parse_sink_url(url: str) -> Path:
+    """Resolve ``sqlite:///relative.db`` / ``sqlite:////abs/path.db`` to a database path."""
+    if not url.startswith(SQLITE_SCHEME) or len(url) == len(SQLITE_SCHEME):
+        raise SinkError(f"Unsupported sink '{url}'. Use sqlite:///path/to/costs.db")
+    return Path(url[len(SQLITE_SCHEME) :])
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA foreign_keys = ON")
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version not in (0, SCHEMA_VERSION):
+        conn.close()
+        raise SinkError(f"{path}: unsupported schema version {version}")
+    conn.executescript(_SCHEMA)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+def write_result(
+    path: Path,
+    result: EstimationResult,
+    *,
+    label: Optional[str] = None,
+    created_at: Optional[datetime] = None,
+) -> int:
+    """Append one run to the SQLite database at ``path``; returns the new run id.
+
+    All rows of the run are inserted with ``executemany`` inside a single transaction,
+    so a run is either fully recorded or not at all.
+    """
+    created = (created_at or datetime.now(timezone.utc)).isoformat(timespec="seconds")
+    try:
+        conn = _connect(path)
+    except (sqlite3.Error, OSError) as e:
+        raise SinkError(f"Cannot open sink database {path}: {e}") from e
+    b, rates, totals = result.baseline, result.derived_rates, result.totals
+    try:
+        with conn:
+            cur = conn.execute(
+                "INSERT INTO runs (created_at, label, region, instance_type, baseline_price,"
+                " baseline_vcpu, baseline_memory_gb, cpu_weight, mem_weight, per_vcpu_hour,"
+                " per_gb_ram_hour, compute_hourly, compute_monthly, storage_hourly,"
+                " storage_monthly, lb_hourly, lb_monthly, node_count)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    created,
+                    label,
+                    b.region,
+                    b.instance_type,
+                    b.price,
+                    b.vcpu,
+                    b.memory_gb,
+                    b.cpu_weight,
+                    b.mem_weight,
+                    rates.per_vcpu_hour,
+                    rates.per_gb_ram_hour,
+                    totals.compute_hourly,
+                    totals.compute_monthly,
+                    totals.storage_hourly,
+                    totals.storage_monthly,
+                    totals.lb_hourly,
+                    totals.lb_monthly,
+                    result.binpacking.node_count if result.binpacking is not None else None,
+                ),
+            )
+            if cur.lastrowid is None:
+                raise SinkError(f"Failed to write run to {path}: no run id assigned")
+            run_id = cur.lastrowid
+            conn.executemany(
+                "INSERT INTO workloads VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        run_id,
+                        w.name,
+                        w.namespace,
+                        w.kind,
+                        w.replicas,
+                        w.cpu_vcpu_per_replica,
+                        w.memory_gb_per_replica,
+                        w.hourly,
+                        w.monthly,
+                    )
+                    for w in result.workloads
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO storage VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        run_id,
+                        s.name,
+                        s.namespace,
+                        s.kind,
+                        s.size_gb,
+                        s.replicas,
+                        s.multiply_by_replicas,
+                        s.volume_type,
+                        s.rate_gb_month,
+                        s.hourly,
+                        s.monthly,
+                    )
+                    for s in result.storage
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO load_balancers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        run_id,
+                        lb.name,
+                        lb.namespace,
+                        lb.service_type,
+                        lb.rate_hour,
+                        lb.hourly,
+                        lb.monthly,
+                    )
+                    for lb in result.load_balancers
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO messages VALUES (?, ?, ?)",
+                [(run_id, "assumption", m) for m in result.assumptions]
+                + [(run_id, "warning", m) for m in result.warnings],
+            )
+    except sqlite3.Error as e:
+        raise SinkError(f"Failed to write run to {path}: {e}") from e
+    finally:
+        conn.close()
+    return run_id
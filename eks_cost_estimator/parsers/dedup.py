@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Dict, Optional, Set, Tuple
+
+from eks_cost_estimator.utils.timings import NULL_TIMINGS, Timings
+
+
+ObjectKey = Tuple[str, Optional[str], str]
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def canonical_hash(doc: dict) -> bytes:
+    """Hash of a decoded object independent of formatting, key order and comments."""
+    return _digest(
+        json.dumps(doc, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    )
+
+
+class Deduplicator:
+    """Keeps one copy per object identity across all input files.
+
+    Byte-identical YAML documents are recognized by a hash of their raw text before they
+    are deserialized. Remaining objects are keyed by ``(kind, namespace, name)``; the
+    first definition wins and later ones with a different canonical content are
+    reported as conflicts.
+    """
+
+    def __init__(self, timings: Timings = NULL_TIMINGS) -> None:
+        self._timings = timings
+        self._chunks: Set[bytes] = set()
+        self._objects: Dict[ObjectKey, Tuple[bytes, str]] = {}
+
+    def seen_chunk(self, chunk: str) -> bool:
+        """Record a raw document; True if an identical one was already seen."""
+        digest = _digest(chunk.strip().encode("utf-8"))
+        if digest in self._chunks:
+            self._timings.count("documents_duplicate")
+            return True
+        self._chunks.add(digest)
+        return False
+
+    def admit(self, doc: dict, source: str) -> Tuple[bool, Optional[str]]:
+        """Decide whether ``doc`` should be costed.
+
+        Returns ``(keep, first_source)``; ``first_source`` is set when ``doc`` conflicts
+        with an earlier definition from that file.
+        """
+        meta = doc.get("metadata") or {}
+        name = meta.get("name")
+        if not name:
+            return True, None
+        key: ObjectKey = (str(doc.get("kind")), meta.get("namespace"), str(name))
+        digest = canonical_hash(doc)
+        first = self._objects.get(key)
+        if first is None:
+            self._objects[key] = (digest, source)
+            return True, None
+        self._timings.count("documents_duplicate")
+        if first[0] == digest:
+            return False, None
+        self._timings.count("objects_conflicting")
+        return False, first[1]
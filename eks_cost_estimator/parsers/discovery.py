@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import fnmatch
+import glob
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple
+
+from eks_cost_estimator.core.exceptions import ParseError
+
+YAML_SUFFIXES = (".yaml", ".yml")
+IGNORE_FILENAMES = (".gitignore", ".eksignore")
+ALWAYS_SKIPPED_DIRS = {".git", ".hg", ".svn", "__pycache__", "node_modules"}
+
+_GLOB_CHARS = set("*?[")
+_DONE = object()
+
+
+@dataclass(frozen=True, slots=True)
+class _IgnoreRule:
+    base: str
+    pattern: str
+    negate: bool
+    dir_only: bool
+    anchored: bool
+
+    def matches(self, path: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        rel = os.path.relpath(path, self.base).replace(os.sep, "/")
+        if rel.startswith("../"):
+            return False
+        if self.anchored:
+            return fnmatch.fnmatchcase(rel, self.pattern)
+        return fnmatch.fnmatchcase(os.path.basename(path), self.pattern)
+
+
+def _read_ignore_file(directory: str, filename: str) -> List[_IgnoreRule]:
+    rules: List[_IgnoreRule] = []
+    try:
+        with open(os.path.join(directory, filename), "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return rules
+    for raw in lines:
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        anchored = "/" in line
+        rules.append(
+            _IgnoreRule(
+                base=directory,
+                pattern=line.lstrip("/"),
+                negate=negate,
+                dir_only=dir_only,
+                anchored=anchored,
+            )
+        )
+    return rules
+
+
+def _is_ignored(path: str, is_dir: bool, rules: Tuple[_IgnoreRule, ...]) -> bool:
+    # Last matching rule wins, as with .gitignore
+    ignored = False
+    for rule in rules:
+        if rule.matches(path, is_dir):
+            ignored = not rule.negate
+    return ignored
+
+
+def _scan_dir(
+    directory: str, rules: Tuple[_IgnoreRule, ...]
+) -> Tuple[List[str], List[Tuple[str, Tuple[_IgnoreRule, ...]]]]:
+    local_rules: List[_IgnoreRule] = []
+    for fname in IGNORE_FILENAMES:
+        local_rules.extend(_read_ignore_file(directory, fname))
+    all_rules = rules + tuple(local_rules)
+
+    files: List[str] = []
+    subdirs: List[Tuple[str, Tuple[_IgnoreRule, ...]]] = []
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return files, subdirs
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name in ALWAYS_SKIPPED_DIRS or _is_ignored(entry.path, True, all_rules):
+                continue
+            subdirs.append((entry.path, all_rules))
+        elif entry.name.lower().endswith(YAML_SUFFIXES):
+            if not _is_ignored(entry.path, False, all_rules):
+                files.append(entry.path)
+    return files, subdirs
+
+
+def walk_yaml_files(root: str, *, workers: int = 8) -> Iterator[str]:
+    """Yield YAML files under ``root`` honoring .gitignore/.eksignore files.
+
+    Directories are scanned level by level; each level's listings are fetched
+    concurrently with ``os.scandir`` while results are yielded in a stable order.
+    """
+    frontier: List[Tuple[str, Tuple[_IgnoreRule, ...]]] = [(root, ())]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while frontier:
+            scanned = pool.map(lambda d: _scan_dir(d[0], d[1]), frontier)
+            next_frontier: List[Tuple[str, Tuple[_IgnoreRule, ...]]] = []
+            for files, subdirs in scanned:
+                yield from files
+                next_frontier.extend(subdirs)
+            frontier = next_frontier
+
+
+def discover_files(inputs: Iterable[str], *, workers: int = 8) -> Iterator[str]:
+    """Expand files, directories and glob patterns into manifest paths.
+
+    Explicit file paths are passed through unchanged (missing files are reported by
+    the parser). Directories are walked recursively for ``*.yaml``/``*.yml`` files.
+    Raises ``ParseError`` when a glob pattern or directory yields no manifest.
+    """
+    seen: set[str] = set()
+    for raw in inputs:
+        if _GLOB_CHARS.intersection(raw) and not os.path.exists(raw):
+            candidates = sorted(glob.iglob(raw, recursive=True))
+        else:
+            candidates = [raw]
+        matched = False
+        for cand in candidates:
+            if os.path.isdir(cand):
+                paths: Iterable[str] = walk_yaml_files(cand, workers=workers)
+            else:
+                paths = (cand,)
+            for p in paths:
+                matched = True
+                key = os.path.normpath(p)
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield p
+        if not matched:
+            raise ParseError(f"File not found: no manifests match '{raw}'")
+
+
+def iter_discovered(
+    inputs: Iterable[str], *, workers: int = 8, prefetch: int = 1024
+) -> Iterator[str]:
+    """Run :func:`discover_files` in a background thread and stream its results.
+
+    Lets the parser start on the first files while the tree is still being walked.
+    """
+    q: queue.Queue[object] = queue.Queue(maxsize=max(1, prefetch))
+    stop = threading.Event()
+
+    def _put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _producer() -> None:
+        try:
+            for p in discover_files(inputs, workers=workers):
+                if not _put(p):
+                    return
+        except BaseException as exc:  # noqa: BLE001 - re-raised in consumer
+            _put(exc)
+            return
+        _put(_DONE)
+
+    thread = threading.Thread(target=_producer, name="manifest-discovery", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = q.get()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield str(item)
+    finally:
+        stop.set()
+        thread.join()
+
+
+def read_path_list(source: Path | str) -> List[str]:
+    """Read newline-separated inputs from a file, or stdin when ``source`` is '-'."""
+    if str(source) == "-":
+        text = sys.stdin.read()
+    else:
+        text = Path(source).read_text(encoding="utf-8")
+    return [line.strip() for line in text.splitlines() if line.strip()]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from typing import AbstractSet, Any, Callable, Iterator
+
+from eks_cost_estimator.utils.timings import NULL_TIMINGS, Timings
+
+
+_JSON_START = (ord("{"), ord("["))
+_WHITESPACE = b" \t\r\n\xef\xbb\xbf"  # BOM bytes included
+# Controllers whose children are costed through the owner itself
+_COSTED_OWNER_KINDS = frozenset(
+    {"ReplicaSet", "Deployment", "StatefulSet", "DaemonSet", "Job", "CronJob"}
+)
+
+
+def _decoder() -> Callable[[bytes], Any]:
+    try:
+        import orjson  # type: ignore
+    except Exception:  # noqa: BLE001 - optional speedup
+        return json.loads
+    return orjson.loads
+
+
+def looks_like_json(raw: bytes) -> bool:
+    """True when the first significant byte opens a JSON object or array."""
+    head = raw[:64].lstrip(_WHITESPACE)
+    return bool(head) and head[0] in _JSON_START
+
+
+def load_snapshot(raw: bytes) -> Any:
+    """Decode a JSON dump with orjson when installed, else the stdlib decoder.
+
+    Raises ``ValueError`` on malformed input.
+    """
+    return _decoder()(raw)
+
+
+def _is_controlled(obj: dict) -> bool:
+    refs = (obj.get("metadata") or {}).get("ownerReferences") or ()
+    return any(
+        isinstance(r, dict) and r.get("controller") and r.get("kind") in _COSTED_OWNER_KINDS
+        for r in refs
+    )
+
+
+def iter_snapshot_objects(
+    data: Any, kinds: AbstractSet[str], timings: Timings = NULL_TIMINGS
+) -> Iterator[dict]:
+    """Yield the relevant objects of a decoded ``kubectl get -o json`` dump.
+
+    Accepts a ``List`` (``{"kind": "List", "items": [...]}``), a bare array or a single
+    object. Items are popped off the list as they are consumed so each raw object can
+    be freed once handled. Objects of other kinds, and objects managed by a controller
+    the tool costs (Pods of a ReplicaSet/StatefulSet/DaemonSet, Jobs of a CronJob) are
+    skipped: their owner is costed instead. Children of other controllers (operators,
+    custom resources) are kept.
+    """
+    if isinstance(data, dict) and isinstance(data.get("items"), list):
+        items = data["items"]
+    elif isinstance(data, list):
+        items = data
+    else:
+        items = [data]
+    del data
+    items.reverse()
+    skipped = owned = 0
+    while items:
+        obj = items.pop()
+        if not isinstance(obj, dict) or obj.get("kind") not in kinds:
+            skipped += 1
+            continue
+        if _is_controlled(obj):
+            owned += 1
+            continue
+        yield obj
+    timings.count("documents_skipped", skipped)
+    timings.count("documents_owned", owned)
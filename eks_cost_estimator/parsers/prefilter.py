@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import re
+from typing import AbstractSet, Iterator, Optional
+
+
+# A document starts at a column-0 '---' marker (optionally followed by content/comment)
+_DOC_START = re.compile(r"^---(?=[ \t]|$)", re.MULTILINE)
+# Top-level keys are the only mapping keys allowed at column 0 in block style
+_KIND_LINE = re.compile(
+    r"^kind:[ \t]*(?P<q>['\"]?)(?P<kind>[A-Za-z][A-Za-z0-9]*)(?P=q)[ \t]*(?:#.*)?\r?$",
+    re.MULTILINE,
+)
+
+
+def split_documents(text: str) -> Iterator[str]:
+    """Split a multi-document YAML stream at '---' markers without parsing it.
+
+    Each chunk keeps its own start marker so it remains a valid single-document stream.
+    """
+    start = 0
+    for m in _DOC_START.finditer(text):
+        if m.start() > start:
+            yield text[start : m.start()]
+        start = m.start()
+    if start < len(text):
+        yield text[start:]
+
+
+def peek_kind(chunk: str) -> Optional[str]:
+    """Return the top-level ``kind`` of a block-style YAML document, if visible.
+
+    ``None`` means the kind could not be determined cheaply (flow style, anchors,
+    quoted keys...) and the document must be fully loaded.
+    """
+    m = _KIND_LINE.search(chunk)
+    return m.group("kind") if m else None
+
+
+def can_prefilter(text: str) -> bool:
+    # Directives ('%YAML', '%TAG') apply across the '---' boundary; load those streams whole
+    return not (text.startswith("%") or "\n%" in text)
+
+
+def iter_candidate_documents(text: str, kinds: AbstractSet[str]) -> Iterator[str]:
+    """Yield document chunks whose kind is in ``kinds`` or cannot be determined."""
+    for chunk in split_documents(text):
+        kind = peek_kind(chunk)
+        if kind is not None and kind not in kinds:
+            continue
+        yield chunk
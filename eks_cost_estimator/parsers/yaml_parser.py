@@ -1,13 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import AbstractSet, Dict, Iterable, List, Optional, Tuple
 
 import yaml
 
 from eks_cost_estimator.core.exceptions import ParseError
-from eks_cost_estimator.models.resources import ServiceItem, StorageItem, WorkloadItem
+from eks_cost_estimator.models.resources import (
+    BatchJobItem,
+    HpaItem,
+    ServiceItem,
+    StorageItem,
+    WorkloadItem,
+)
+from eks_cost_estimator.parsers.dedup import Deduplicator
+from eks_cost_estimator.parsers.json_snapshot import (
+    iter_snapshot_objects,
+    load_snapshot,
+    looks_like_json,
+)
+from eks_cost_estimator.parsers.prefilter import can_prefilter, peek_kind, split_documents
+from eks_cost_estimator.utils.cron import CronSchedule, parse_duration_minutes
+from eks_cost_estimator.utils.diagnostics import WarningLog
+from eks_cost_estimator.utils.timings import NULL_TIMINGS, Timings
 from eks_cost_estimator.utils.units import parse_cpu, parse_mem_gb
 
 
@@ -22,6 +39,21 @@ SUPPORTED_WORKLOAD_KINDS = {
 
 SUPPORTED_SERVICE_KINDS = {"Service"}
 
+SUPPORTED_AUTOSCALER_KINDS = {"HorizontalPodAutoscaler"}
+
+RELEVANT_KINDS = (
+    SUPPORTED_WORKLOAD_KINDS
+    | SUPPORTED_SERVICE_KINDS
+    | SUPPORTED_AUTOSCALER_KINDS
+    | {"PersistentVolumeClaim"}
+)
+
+# Expected run time of a Job/CronJob pod, e.g. "15m"; used by the job simulation
+DURATION_ANNOTATION = "eks-cost-estimator/duration"
+
+# libyaml-backed loader when available; same semantics as yaml.SafeLoader
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass(slots=True)
 class ParseOutput:
@@ -29,7 +61,9 @@ class ParseOutput:
     storage: List[StorageItem]
     services: List[ServiceItem]
     assumptions: List[str]
-    warnings: List[str]
+    warnings: WarningLog
+    batch_jobs: List[BatchJobItem] = field(default_factory=list)
+    hpas: List[HpaItem] = field(default_factory=list)
 
 
 def _ensure_list(x: Optional[Iterable]) -> List:
@@ -38,29 +72,69 @@ def _ensure_list(x: Optional[Iterable]) -> List:
     return list(x)
 
 
-def parse_files(paths: List[str]) -> ParseOutput:
+def parse_files(
+    paths: Iterable[str],
+    *,
+    timings: Optional[Timings] = None,
+    label_keys: Optional[AbstractSet[str]] = None,
+) -> ParseOutput:
+    """Parse manifests into workload, storage and service items.
+
+    ``label_keys`` selects which metadata labels are kept on the items (for group-by);
+    by default labels are dropped.
+    """
+    t = timings or NULL_TIMINGS
     workloads: List[WorkloadItem] = []
     storage: List[StorageItem] = []
     assumptions: List[str] = []
-    warnings: List[str] = []
+    warnings = WarningLog()
     services: List[ServiceItem] = []
+    batch_jobs: List[BatchJobItem] = []
+    hpas: List[HpaItem] = []
 
-    # Collect standalone PVCs: (name, namespace) -> (size_gb, storageClassName)
-    standalone_pvcs: Dict[Tuple[str, Optional[str]], Tuple[float, Optional[str]]] = {}
+    # Collect standalone PVCs: (name, namespace) -> (size_gb, storageClassName, labels)
+    standalone_pvcs: Dict[
+        Tuple[str, Optional[str]], Tuple[float, Optional[str], Optional[Dict[str, str]]]
+    ] = {}
     # Track which PVC names are referenced by Deployments (shared)
     deployment_pvc_refs: set[Tuple[str, Optional[str]]] = set()
 
+    # StatefulSet claims in live snapshots are named <vct>-<statefulset>-<ordinal> and are
+    # already costed through the volumeClaimTemplates: (prefix, namespace)
+    vct_claim_prefixes: set[Tuple[str, Optional[str]]] = set()
+    # Overlapping inputs: cost each (kind, namespace, name) once
+    dedup = Deduplicator(t)
+
     for p in paths:
         path = Path(p)
         if not path.exists():
             raise ParseError(f"File not found: {path}")
-        try:
-            with path.open("r", encoding="utf-8") as f:
-                docs = list(yaml.safe_load_all(f))
-        except yaml.YAMLError as e:  # noqa: BLE001
-            raise ParseError(f"YAML parse error in {path}: {e}") from e
+        file_t0 = time.perf_counter()
+        with t.stage("parse.file_read"):
+            raw = path.read_bytes()
+        docs: Optional[Iterable[object]] = None
+        if looks_like_json(raw):
+            try:
+                with t.stage("parse.json_load"):
+                    data = load_snapshot(raw)
+            except ValueError:
+                pass  # flow-style YAML opens with a brace too: let the YAML loader have it
+            else:
+                del raw
+                docs = iter_snapshot_objects(data, RELEVANT_KINDS, t)
+                del data
+        if docs is None:
+            text = _decode_text(raw)
+            del raw
+            try:
+                with t.stage("parse.yaml_load"):
+                    docs = _load_relevant_documents(text, t, dedup)
+            except yaml.YAMLError as e:  # noqa: BLE001
+                raise ParseError(f"YAML parse error in {path}: {e}") from e
+        n_docs = 0
 
         for doc in docs:
+            n_docs += 1
             if not doc or not isinstance(doc, dict):
                 continue
             kind = doc.get("kind")
@@ -68,29 +142,49 @@ def parse_files(paths: List[str]) -> ParseOutput:
             name = meta.get("name", "unnamed")
             namespace = meta.get("namespace")
 
+            if kind in RELEVANT_KINDS:
+                keep, first_source = dedup.admit(doc, str(path))
+                if first_source is not None:
+                    ident = f"{namespace}/{name}" if namespace else str(name)
+                    warnings.add(
+                        "conflicting_definitions", str(kind), ident, f"{first_source} and {path}"
+                    )
+                if not keep:
+                    continue
+
             if kind == "PersistentVolumeClaim":
                 spec = doc.get("spec", {}) or {}
                 resources = spec.get("resources", {}) or {}
                 requests = resources.get("requests", {}) or {}
                 storage_req = requests.get("storage")
                 if storage_req is None:
-                    warnings.append(
-                        f"PVC {name}: missing storage request; skipping from storage totals"
-                    )
+                    warnings.add("pvc_missing_storage", "PVC", name)
                     continue
-                size_gb = _safe_parse_mem(storage_req, warnings, context=f"PVC {name}")
+                size_gb = _safe_parse_mem(storage_req, warnings, kind="PVC", obj=name)
                 scn = spec.get("storageClassName")
-                standalone_pvcs[(name, namespace)] = (size_gb, scn)
+                standalone_pvcs[(name, namespace)] = (
+                    size_gb,
+                    scn,
+                    _select_labels(meta, label_keys),
+                )
                 continue
 
             if kind in SUPPORTED_WORKLOAD_KINDS:
-                wls, st, assm, warns, dep_refs = _parse_workload(doc)
+                with t.stage("parse.parse_workload"):
+                    wls, st, assm, dep_refs = _parse_workload(doc, warnings, label_keys)
                 workloads.append(wls)
                 storage.extend(st)
                 assumptions.extend(assm)
-                warnings.extend(warns)
                 for ref in dep_refs:
                     deployment_pvc_refs.add((ref, wls.namespace))
+                if kind in ("Job", "CronJob"):
+                    batch = _parse_batch(doc, wls, warnings)
+                    if batch is not None:
+                        batch_jobs.append(batch)
+                if kind == "StatefulSet":
+                    for vct in _ensure_list((doc.get("spec") or {}).get("volumeClaimTemplates")):
+                        vct_name = (vct.get("metadata") or {}).get("name", "vct")
+                        vct_claim_prefixes.add((f"{vct_name}-{name}", namespace))
                 continue
 
             if kind in SUPPORTED_SERVICE_KINDS:
@@ -104,12 +198,30 @@ def parse_files(paths: List[str]) -> ParseOutput:
                             kind=kind,
                             service_type=str(svc_type),
                             annotations=(doc.get("metadata", {}) or {}).get("annotations"),
+                            labels=_select_labels(meta, label_keys),
                         )
                     )
                 continue
 
+            if kind in SUPPORTED_AUTOSCALER_KINDS:
+                hpa = _parse_hpa(doc)
+                if hpa is None:
+                    warnings.add("hpa_invalid", str(kind), name)
+                else:
+                    hpas.append(hpa)
+                continue
+
+        t.count("documents", n_docs)
+        t.record_file(str(path), time.perf_counter() - file_t0, n_docs)
+
     # Convert standalone PVCs to storage items, honoring shared rule for Deployments
-    for (pvc_name, ns), (size_gb, scn) in standalone_pvcs.items():
+    for (pvc_name, ns), (size_gb, scn, pvc_labels) in standalone_pvcs.items():
+        prefix, sep, ordinal = pvc_name.rpartition("-")
+        if sep and ordinal.isdigit() and (prefix, ns) in vct_claim_prefixes:
+            assumptions.append(
+                f"PVC {pvc_name}: created from a StatefulSet volumeClaimTemplate; counted there"
+            )
+            continue
         shared = (pvc_name, ns) in deployment_pvc_refs
         storage.append(
             StorageItem(
@@ -122,6 +234,7 @@ def parse_files(paths: List[str]) -> ParseOutput:
                 storage_class_name=scn,
                 volume_type=_derive_volume_type_from_scn(scn),
                 note="shared-deployment" if shared else None,
+                labels=pvc_labels,
             )
         )
 
@@ -131,19 +244,68 @@ def parse_files(paths: List[str]) -> ParseOutput:
         services=services,
         assumptions=assumptions,
         warnings=warnings,
+        batch_jobs=batch_jobs,
+        hpas=hpas,
     )
 
 
-def _parse_workload(doc: Dict) -> Tuple[
-    WorkloadItem, List[StorageItem], List[str], List[str], List[str]
-]:
+def _decode_text(raw: bytes) -> str:
+    # Same newline handling as Path.read_text, so '---' markers split on CRLF files too
+    text = raw.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _load_relevant_documents(
+    text: str, timings: Timings = NULL_TIMINGS, dedup: Optional[Deduplicator] = None
+) -> List[object]:
+    """Load only documents whose kind matters for costing.
+
+    Documents of other kinds (ConfigMaps, Secrets, CRDs, RBAC...) are skipped by peeking
+    at their top-level ``kind:`` line, so their bodies are never deserialized; neither
+    are exact copies of documents already seen by ``dedup``.
+    """
+    if not can_prefilter(text):
+        return list(yaml.load_all(text, Loader=_YamlLoader))
+    docs: List[object] = []
+    skipped = 0
+    for chunk in split_documents(text):
+        kind = peek_kind(chunk)
+        if kind is not None and kind not in RELEVANT_KINDS:
+            skipped += 1
+            continue
+        if dedup is not None and dedup.seen_chunk(chunk):
+            continue
+        docs.extend(yaml.load_all(chunk, Loader=_YamlLoader))
+    timings.count("documents_skipped", skipped)
+    return docs
+
+
+def _select_labels(
+    meta: Dict, keys: Optional[AbstractSet[str]], fallback: Optional[Dict] = None
+) -> Optional[Dict[str, str]]:
+    """Keep only the requested label keys; template labels fill in missing ones."""
+    if not keys:
+        return None
+    labels = meta.get("labels") or {}
+    selected = {k: str(labels[k]) for k in keys if k in labels}
+    if fallback:
+        for k in keys:
+            if k not in selected and k in fallback:
+                selected[k] = str(fallback[k])
+    return selected
+
+
+def _parse_workload(
+    doc: Dict, warnings: WarningLog, label_keys: Optional[AbstractSet[str]] = None
+) -> Tuple[WorkloadItem, List[StorageItem], List[str], List[str]]:
     kind: str = doc.get("kind", "Unknown")
     meta = doc.get("metadata", {}) or {}
     name: str = meta.get("name", "unnamed")
     namespace: Optional[str] = meta.get("namespace")
     spec = doc.get("spec", {}) or {}
     assumptions: List[str] = []
-    warnings: List[str] = []
     storage_items: List[StorageItem] = []
     dep_pvc_refs: List[str] = []
 
@@ -180,11 +342,15 @@ def _parse_workload(doc: Dict) -> Tuple[
     # Sum requests across all containers and initContainers
     total_cpu_vcpu = 0.0
     total_mem_gb = 0.0
+    total_ephemeral_gb = 0.0
 
     for c in containers + init_containers:
         cres = (c.get("resources", {}) or {}).get("requests", {}) or {}
         cpu = cres.get("cpu")
         mem = cres.get("memory")
+        ephemeral = cres.get("ephemeral-storage")
+        if ephemeral is not None:
+            total_ephemeral_gb += _safe_parse_mem(ephemeral, warnings, kind=kind, obj=name)
         missing_any = False
         if cpu is None:
             cpu = "100m"
@@ -193,22 +359,34 @@ def _parse_workload(doc: Dict) -> Tuple[
             mem = "128Mi"
             missing_any = True
         if missing_any:
-            warnings.append(
-                f"{kind} {name}: container '{c.get('name','unnamed')}' missing requests; defaulted to cpu=100m, memory=128Mi"
-            )
+            warnings.add("missing_requests", kind, name, str(c.get("name", "unnamed")))
         try:
             total_cpu_vcpu += parse_cpu(cpu)
         except ValueError:
-            warnings.append(f"{kind} {name}: unknown CPU unit '{cpu}', defaulted to 0.1")
+            warnings.add("unknown_cpu_unit", kind, name, str(cpu))
             total_cpu_vcpu += 0.1
         try:
             total_mem_gb += parse_mem_gb(mem)
         except ValueError:
-            warnings.append(
-                f"{kind} {name}: unknown memory unit '{mem}', defaulted to 0.128Gi"
-            )
+            warnings.add("unknown_memory_unit", kind, name, str(mem))
             total_mem_gb += parse_mem_gb("128Mi")
 
+    pod_spec = (pod_template.get("spec") or {}) if pod_template else {}
+    raw_selector = pod_spec.get("nodeSelector")
+    node_selector = (
+        {str(k): str(v) for k, v in raw_selector.items()}
+        if isinstance(raw_selector, dict) and raw_selector
+        else None
+    )
+    tolerations = [
+        {k: str(v) for k, v in tol.items() if v is not None}
+        for tol in _ensure_list(pod_spec.get("tolerations"))
+        if isinstance(tol, dict)
+    ] or None
+
+    template_meta = (pod_template.get("metadata") or {}) if pod_template else {}
+    labels = _select_labels(meta, label_keys, fallback=template_meta.get("labels"))
+
     # Volume claim templates in StatefulSet
     if kind == "StatefulSet":
         vcts = _ensure_list(spec.get("volumeClaimTemplates"))
@@ -219,12 +397,10 @@ def _parse_workload(doc: Dict) -> Tuple[
             vct_res = (vct_spec.get("resources", {}) or {}).get("requests", {}) or {}
             vct_storage = vct_res.get("storage")
             if vct_storage is None:
-                warnings.append(
-                    f"StatefulSet {name} volumeClaimTemplates '{vct_name}' missing storage; skipping"
-                )
+                warnings.add("vct_missing_storage", "StatefulSet", name, vct_name)
             else:
                 size_gb = _safe_parse_mem(
-                    vct_storage, warnings, context=f"StatefulSet {name} vct {vct_name}"
+                    vct_storage, warnings, kind="StatefulSet", obj=f"{name} vct {vct_name}"
                 )
                 storage_items.append(
                     StorageItem(
@@ -237,6 +413,7 @@ def _parse_workload(doc: Dict) -> Tuple[
                         storage_class_name=vct_spec.get("storageClassName"),
                         volume_type=_derive_volume_type_from_scn(vct_spec.get("storageClassName")),
                         note="statefulset-vct",
+                        labels=labels,
                     )
                 )
 
@@ -255,16 +432,115 @@ def _parse_workload(doc: Dict) -> Tuple[
         replicas=replicas,
         cpu_vcpu_per_replica=total_cpu_vcpu,
         memory_gb_per_replica=total_mem_gb,
+        ephemeral_storage_gb_per_replica=total_ephemeral_gb,
+        labels=labels,
+        node_selector=node_selector,
+        tolerations=tolerations,
+    )
+
+    return wl, storage_items, assumptions, dep_pvc_refs
+
+
+def _positive_int(value: object, default: int) -> int:
+    try:
+        n = int(value)  # type: ignore[call-overload]
+    except (TypeError, ValueError):
+        return default
+    return n if n > 0 else default
+
+
+def _parse_batch(doc: Dict, wl: WorkloadItem, warnings: WarningLog) -> Optional[BatchJobItem]:
+    """Run parameters of a Job or CronJob; None for suspended or unschedulable CronJobs."""
+    meta = doc.get("metadata") or {}
+    spec = doc.get("spec") or {}
+    schedule: Optional[str] = None
+    policy = "Allow"
+    annotations = dict(meta.get("annotations") or {})
+    if wl.kind == "CronJob":
+        if spec.get("suspend"):
+            return None
+        schedule = str(spec.get("schedule") or "")
+        try:
+            CronSchedule.parse(schedule)
+        except ValueError:
+            warnings.add("invalid_schedule", wl.kind, wl.name, schedule)
+            return None
+        policy = str(spec.get("concurrencyPolicy") or "Allow")
+        job_template = spec.get("jobTemplate") or {}
+        annotations.update((job_template.get("metadata") or {}).get("annotations") or {})
+        spec = job_template.get("spec") or {}
+
+    parallelism = _positive_int(spec.get("parallelism"), 1)
+    # Without completions a Job is a work queue: each parallel pod runs once
+    completions = _positive_int(spec.get("completions"), parallelism)
+    duration: Optional[float] = None
+    raw_duration = annotations.get(DURATION_ANNOTATION)
+    if raw_duration is not None:
+        try:
+            duration = parse_duration_minutes(str(raw_duration))
+        except ValueError:
+            warnings.add("invalid_duration", wl.kind, wl.name, str(raw_duration))
+    deadline_s = _positive_int(spec.get("activeDeadlineSeconds"), 0)
+    return BatchJobItem(
+        name=wl.name,
+        namespace=wl.namespace,
+        kind=wl.kind,
+        cpu_vcpu_per_pod=wl.cpu_vcpu_per_replica,
+        memory_gb_per_pod=wl.memory_gb_per_replica,
+        completions=completions,
+        parallelism=min(parallelism, completions),
+        schedule=schedule,
+        concurrency_policy=policy,
+        duration_minutes=duration,
+        deadline_minutes=deadline_s / 60.0 if deadline_s else None,
     )
 
-    return wl, storage_items, assumptions, warnings, dep_pvc_refs
+
+def _hpa_cpu_target(spec: Dict) -> Optional[float]:
+    # autoscaling/v1
+    percent = spec.get("targetCPUUtilizationPercentage")
+    if percent is not None:
+        return _positive_int(percent, 0) / 100.0 or None
+    # autoscaling/v2 and v2beta2 (target.averageUtilization), v2beta1 (targetAverageUtilization)
+    for metric in _ensure_list(spec.get("metrics")):
+        if not isinstance(metric, dict) or metric.get("type") != "Resource":
+            continue
+        resource = metric.get("resource")
+        if not isinstance(resource, dict) or resource.get("name") != "cpu":
+            continue
+        target = resource.get("target")
+        if not isinstance(target, dict):
+            target = {}
+        percent = target.get("averageUtilization", resource.get("targetAverageUtilization"))
+        if percent is not None:
+            return _positive_int(percent, 0) / 100.0 or None
+    return None
+
+
+def _parse_hpa(doc: Dict) -> Optional[HpaItem]:
+    """HPA bounds and CPU target; None when the scale target or maxReplicas is missing."""
+    meta = doc.get("metadata") or {}
+    spec = doc.get("spec") or {}
+    ref = spec.get("scaleTargetRef") or {}
+    max_replicas = _positive_int(spec.get("maxReplicas"), 0)
+    if not ref.get("kind") or not ref.get("name") or not max_replicas:
+        return None
+    return HpaItem(
+        name=meta.get("name", "unnamed"),
+        namespace=meta.get("namespace"),
+        target_kind=str(ref["kind"]),
+        target_name=str(ref["name"]),
+        min_replicas=min(_positive_int(spec.get("minReplicas"), 1), max_replicas),
+        max_replicas=max_replicas,
+        target_cpu_utilization=_hpa_cpu_target(spec),
+    )
 
 
-def _safe_parse_mem(val: str, warnings: List[str], *, context: str) -> float:
+def _safe_parse_mem(val: str, warnings: WarningLog, *, kind: str, obj: str) -> float:
     try:
         return parse_mem_gb(val)
     except ValueError:
-        warnings.append(f"{context}: unknown memory unit '{val}', skipping")
+        warnings.add("unknown_size_unit", kind, obj, str(val))
         return 0.0
 
 
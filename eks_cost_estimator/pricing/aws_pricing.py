@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Tuple
 
 
@@ -89,7 +90,15 @@ def get_instance_specs(
 def get_live_baseline(
     *, region: str, instance: str, profile: Optional[str] = None
 ) -> Dict[str, float]:
-    price = get_ec2_ondemand_price(region=region, instance_type=instance, profile=profile)
-    vcpu, mem_gb = get_instance_specs(region=region, instance_type=instance, profile=profile)
+    # The Pricing and EC2 calls are independent; issue them concurrently
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="live-pricing") as pool:
+        price_f = pool.submit(
+            get_ec2_ondemand_price, region=region, instance_type=instance, profile=profile
+        )
+        specs_f = pool.submit(
+            get_instance_specs, region=region, instance_type=instance, profile=profile
+        )
+        price = price_f.result()
+        vcpu, mem_gb = specs_f.result()
     return {"price": price, "vcpu": vcpu, "memory_gb": mem_gb}
 
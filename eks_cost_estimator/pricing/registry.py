@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+PRICING_PATH_ENV = "EKS_COST_PRICING_PATH"
+
+# Compact binary catalog: header, fixed-size records sorted by key, then a key string table.
+# Records hold (key offset, key length, price, vcpu, memory_gb); lookups bisect the mmap.
+COMPILED_MAGIC = b"EKSPRC1\0"
+_HEADER = struct.Struct("<8sII")  # magic, record count, string table size
+_RECORD = struct.Struct("<IH2xddd")
+_KEY_SEP = "\x1f"
+
+_BUILTIN_BASELINES: Dict[str, Dict[str, Dict[str, float]]] = {
+    "us-east-1": {"m6i.large": {"price": 0.096, "vcpu": 2, "memory_gb": 8}},
+    "us-west-2": {"m6i.large": {"price": 0.096, "vcpu": 2, "memory_gb": 8}},
+    "eu-west-1": {"m6i.large": {"price": 0.107, "vcpu": 2, "memory_gb": 8}},
+    "eu-west-3": {"m6i.large": {"price": 0.119, "vcpu": 2, "memory_gb": 8}},
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BaselineSpec:
+    price: float
+    vcpu: float
+    memory_gb: float
+
+
+class PricingDataError(ValueError):
+    """Raised when a baselines catalog is malformed."""
+
+
+def _validate(data: Any, source: str) -> Dict[Tuple[str, str], BaselineSpec]:
+    if not isinstance(data, dict):
+        raise PricingDataError(f"{source}: expected an object of regions")
+    entries: Dict[Tuple[str, str], BaselineSpec] = {}
+    for region, instances in data.items():
+        if not isinstance(instances, dict):
+            raise PricingDataError(f"{source}: region '{region}' must map instance types")
+        for instance, item in instances.items():
+            try:
+                spec = BaselineSpec(
+                    price=float(item["price"]),
+                    vcpu=float(item["vcpu"]),
+                    memory_gb=float(item["memory_gb"]),
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                raise PricingDataError(f"{source}: invalid entry {region}/{instance}: {e}") from e
+            entries[(str(region), str(instance))] = spec
+    return entries
+
+
+class _CompiledCatalog:
+    """Read-only view over a compiled catalog file, looked up in place via mmap."""
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, strtab_size = _HEADER.unpack_from(self._mm, 0)
+        self._count: int = count
+        if magic != COMPILED_MAGIC:
+            raise PricingDataError(f"{path}: not a compiled pricing catalog")
+        self._strtab = _HEADER.size + self._count * _RECORD.size
+        if self._strtab + strtab_size > len(self._mm):
+            raise PricingDataError(f"{path}: truncated compiled pricing catalog")
+
+    def _record(self, idx: int) -> Tuple[bytes, float, float, float]:
+        off, length, price, vcpu, mem = _RECORD.unpack_from(
+            self._mm, _HEADER.size + idx * _RECORD.size
+        )
+        start = self._strtab + off
+        return self._mm[start : start + length], price, vcpu, mem
+
+    def get(self, region: str, instance: str) -> Optional[BaselineSpec]:
+        key = f"{region}{_KEY_SEP}{instance}".encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._record(mid)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count:
+            found, price, vcpu, mem = self._record(lo)
+            if found == key:
+                return BaselineSpec(price=price, vcpu=vcpu, memory_gb=mem)
+        return None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def items(self) -> Iterator[Tuple[Tuple[str, str], BaselineSpec]]:
+        for idx in range(self._count):
+            key, price, vcpu, mem = self._record(idx)
+            region, instance = key.decode("utf-8").split(_KEY_SEP, 1)
+            yield (region, instance), BaselineSpec(price=price, vcpu=vcpu, memory_gb=mem)
+
+
+def compile_baselines(src: Path, dst: Path) -> int:
+    """Compile a baselines JSON catalog into the compact binary form. Returns entry count."""
+    with src.open("r", encoding="utf-8") as f:
+        entries = _validate(json.load(f), str(src))
+    keyed = sorted(
+        (f"{region}{_KEY_SEP}{instance}".encode("utf-8"), spec)
+        for (region, instance), spec in entries.items()
+    )
+    strtab = bytearray()
+    records = bytearray()
+    for key, spec in keyed:
+        records += _RECORD.pack(len(strtab), len(key), spec.price, spec.vcpu, spec.memory_gb)
+        strtab += key
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(dst.name + ".tmp")
+    tmp.write_bytes(_HEADER.pack(COMPILED_MAGIC, len(keyed), len(strtab)) + records + strtab)
+    os.replace(tmp, dst)
+    return len(keyed)
+
+
+def default_sources() -> Tuple[Path, ...]:
+    """Candidate catalogs in precedence order: env override, repo-root cache, package copy."""
+    sources = []
+    env = os.environ.get(PRICING_PATH_ENV)
+    if env:
+        sources.append(Path(env))
+    sources.append(Path.cwd() / "pricing_cache" / "baselines.json")
+    sources.append(Path(__file__).with_name("baselines.json"))
+    return tuple(sources)
+
+
+class BaselineRegistry:
+    """Process-wide baselines catalog, loaded and validated once.
+
+    Every lookup re-resolves the source path and compares its (mtime, size) with the
+    loaded copy; the file is only re-read when those change, and only re-validated
+    when its content hash differs. ``.bin`` catalogs produced by
+    :func:`compile_baselines` are memory-mapped instead of decoded.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self._explicit = path
+        self._lock = threading.Lock()
+        self._source: Optional[Path] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._digest = "builtin"
+        self._entries: Dict[Tuple[str, str], BaselineSpec] = {}
+        self._compiled: Optional[_CompiledCatalog] = None
+        self._loaded = False
+
+    def _resolve_source(self) -> Optional[Path]:
+        if self._explicit is not None:
+            return self._explicit
+        for candidate in default_sources():
+            if candidate.exists():
+                return candidate
+        return None
+
+    def _refresh(self) -> None:
+        source = self._resolve_source()
+        stamp: Optional[Tuple[int, int]] = None
+        if source is not None:
+            try:
+                st = source.stat()
+            except OSError as e:
+                raise PricingDataError(f"Pricing catalog not readable: {source}") from e
+            stamp = (st.st_mtime_ns, st.st_size)
+        if self._loaded and source == self._source and stamp == self._stamp:
+            return
+        with self._lock:
+            if self._loaded and source == self._source and stamp == self._stamp:
+                return
+            self._load(source, stamp)
+
+    def _load(self, source: Optional[Path], stamp: Optional[Tuple[int, int]]) -> None:
+        if source is None:
+            entries = _validate(_BUILTIN_BASELINES, "builtin")
+            self._set(None, None, "builtin", entries, None)
+            return
+        raw = source.read_bytes()
+        if raw.startswith(COMPILED_MAGIC):
+            digest = hashlib.sha256(raw).hexdigest()
+            self._set(source, stamp, digest, {}, _CompiledCatalog(source))
+            return
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest == self._digest and self._compiled is None and self._loaded:
+            # Touched but unchanged: keep the validated entries
+            self._source, self._stamp = source, stamp
+            return
+        entries = _validate(json.loads(raw.decode("utf-8")), str(source))
+        self._set(source, stamp, digest, entries, None)
+
+    def _set(
+        self,
+        source: Optional[Path],
+        stamp: Optional[Tuple[int, int]],
+        digest: str,
+        entries: Dict[Tuple[str, str], BaselineSpec],
+        compiled: Optional[_CompiledCatalog],
+    ) -> None:
+        # A replaced catalog is not closed here: lookups may still be reading it. Its map
+        # is released once the last reference to it is dropped.
+        self._source, self._stamp, self._digest = source, stamp, digest
+        self._entries, self._compiled = entries, compiled
+        self._loaded = True
+
+    def lookup(self, region: str, instance: str) -> Optional[BaselineSpec]:
+        self._refresh()
+        with self._lock:
+            compiled, entries = self._compiled, self._entries
+        if compiled is not None:
+            return compiled.get(region, instance)
+        return entries.get((region, instance))
+
+    def fingerprint(self) -> str:
+        """Content hash of the active catalog; changes whenever prices may change."""
+        self._refresh()
+        return self._digest
+
+    @property
+    def source(self) -> Optional[Path]:
+        self._refresh()
+        return self._source
+
+
+_REGISTRIES: Dict[Optional[str], BaselineRegistry] = {}
+_REGISTRIES_LOCK = threading.Lock()
+
+
+def get_registry(path: Optional[str | Path] = None) -> BaselineRegistry:
+    """Return the shared registry for ``path`` (``None``: default source resolution)."""
+    key = str(path) if path is not None else None
+    reg = _REGISTRIES.get(key)
+    if reg is None:
+        with _REGISTRIES_LOCK:
+            reg = _REGISTRIES.get(key)
+            if reg is None:
+                reg = _REGISTRIES[key] = BaselineRegistry(Path(path) if path else None)
+    return reg
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Iterable, List, Mapping
+
+from eks_cost_estimator.pricing.registry import PricingDataError
+
+
+LINUX_PRODUCT = "Linux/UNIX"
+_TYPE_FIELDS = ("InstanceType", "instance_type")
+_PRICE_FIELDS = ("SpotPrice", "spot_price", "price")
+_PRODUCT_FIELDS = ("ProductDescription", "product_description")
+
+
+def _field(record: Mapping[str, Any], names: Iterable[str]) -> Any:
+    for name in names:
+        value = record.get(name)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def read_spot_history(path: Path, instance_type: str) -> float:
+    """Mean Linux spot price of ``instance_type`` from a local price-history file.
+
+    JSON is the output of ``aws ec2 describe-spot-price-history`` (or the list under its
+    ``SpotPriceHistory`` key); CSV needs a header with instance type and price columns
+    (``InstanceType``/``instance_type`` and ``SpotPrice``/``spot_price``/``price``).
+    Records for other products than Linux/UNIX are ignored when a product is given.
+    """
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+    except OSError as e:
+        raise PricingDataError(f"Cannot read spot price history {path}: {e}") from e
+    records: List[Mapping[str, Any]]
+    if text.lstrip().startswith(("[", "{")):
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise PricingDataError(f"Spot price history {path}: {e}") from e
+        records = data.get("SpotPriceHistory", []) if isinstance(data, dict) else data
+    else:
+        records = list(csv.DictReader(text.splitlines()))
+
+    prices: List[float] = []
+    for record in records:
+        if not isinstance(record, dict) or _field(record, _TYPE_FIELDS) != instance_type:
+            continue
+        product = _field(record, _PRODUCT_FIELDS)
+        if product is not None and not str(product).startswith(LINUX_PRODUCT):
+            continue
+        try:
+            prices.append(float(_field(record, _PRICE_FIELDS)))
+        except (TypeError, ValueError) as e:
+            raise PricingDataError(f"Spot price history {path}: invalid price: {e}") from e
+    if not prices:
+        raise PricingDataError(f"Spot price history {path}: no prices for {instance_type}")
+    return sum(prices) / len(prices)
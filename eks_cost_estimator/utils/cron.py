@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, FrozenSet, Iterator, Tuple
+
+
+MACROS: Dict[str, str] = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+_MONTH_NAMES = {
+    name: i + 1
+    for i, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+    )
+}
+_DAY_NAMES = {name: i for i, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+
+# (low, high, names) for minute, hour, day of month, month, day of week
+_FIELDS: Tuple[Tuple[int, int, Dict[str, int]], ...] = (
+    (0, 59, {}),
+    (0, 23, {}),
+    (1, 31, {}),
+    (1, 12, _MONTH_NAMES),
+    (0, 7, _DAY_NAMES),
+)
+
+
+def _value(token: str, names: Dict[str, int]) -> int:
+    lowered = token.lower()
+    if lowered in names:
+        return names[lowered]
+    if not token.isdigit():
+        raise ValueError(f"invalid value '{token}'")
+    return int(token)
+
+
+def _parse_field(text: str, low: int, high: int, names: Dict[str, int]) -> FrozenSet[int]:
+    values: set[int] = set()
+    for part in text.split(","):
+        base, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if step <= 0:
+            raise ValueError(f"invalid step in '{part}'")
+        if base in ("*", "?"):
+            start, end = low, high
+        elif "-" in base:
+            a, _, b = base.partition("-")
+            start, end = _value(a, names), _value(b, names)
+        else:
+            start = _value(base, names)
+            end = high if step_text else start
+        if not (low <= start <= high and low <= end <= high) or start > end:
+            raise ValueError(f"'{part}' out of range {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+def _is_star(field: str) -> bool:
+    """Whether robfig/cron (the parser Kubernetes uses) sets the field's star bit.
+
+    Only ``*`` or ``?`` with no step above 1 does; ``*/2`` restricts the field like any
+    other list of values.
+    """
+    for part in field.split(","):
+        base, _, step = part.partition("/")
+        if base in ("*", "?") and (not step or int(step) <= 1):
+            return True
+    return False
+
+
+@dataclass(frozen=True, slots=True)
+class CronSchedule:
+    """A standard 5-field cron expression, as accepted by Kubernetes CronJobs."""
+
+    minutes: Tuple[int, ...]
+    hours: Tuple[int, ...]
+    days: FrozenSet[int]
+    months: FrozenSet[int]
+    weekdays: FrozenSet[int]  # 0 = Sunday
+    days_restricted: bool
+    weekdays_restricted: bool
+
+    @classmethod
+    def parse(cls, expr: str) -> "CronSchedule":
+        text = expr.strip()
+        if text.startswith(("CRON_TZ=", "TZ=")):
+            text = text.split(None, 1)[1] if " " in text else ""
+        text = MACROS.get(text.lower(), text)
+        fields = text.split()
+        if len(fields) != 5:
+            raise ValueError(f"Invalid cron schedule '{expr}': expected 5 fields")
+        try:
+            parsed = [_parse_field(f, lo, hi, names) for f, (lo, hi, names) in zip(fields, _FIELDS)]
+        except ValueError as e:
+            raise ValueError(f"Invalid cron schedule '{expr}': {e}") from e
+        minutes, hours, days, months, weekdays = parsed
+        return cls(
+            minutes=tuple(sorted(minutes)),
+            hours=tuple(sorted(hours)),
+            days=days,
+            months=months,
+            weekdays=frozenset(d % 7 for d in weekdays),
+            days_restricted=not _is_star(fields[2]),
+            weekdays_restricted=not _is_star(fields[4]),
+        )
+
+    def matches_day(self, day: datetime) -> bool:
+        if day.month not in self.months:
+            return False
+        dom = day.day in self.days
+        dow = (day.weekday() + 1) % 7 in self.weekdays
+        # Cron semantics: when both are restricted, either one matching is enough
+        if self.days_restricted and self.weekdays_restricted:
+            return dom or dow
+        return dom and dow
+
+    def fire_offsets(self, start: datetime, horizon_minutes: int) -> Iterator[int]:
+        """Yield minute offsets from ``start`` at which the schedule fires, in order."""
+        day0 = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        base = int((start - day0).total_seconds() // 60)
+        for d in range((base + horizon_minutes) // 1440 + 1):
+            day = day0 + timedelta(days=d)
+            if not self.matches_day(day):
+                continue
+            for h in self.hours:
+                for m in self.minutes:
+                    offset = d * 1440 + h * 60 + m - base
+                    if offset >= horizon_minutes:
+                        return
+                    if offset >= 0:
+                        yield offset
+
+
+def parse_duration_minutes(text: str) -> float:
+    """Parse ``90s``, ``15m``, ``2h``, ``1h30m`` or a bare number of minutes."""
+    raw = text.strip().lower()
+    if not raw:
+        raise ValueError("empty duration")
+    try:
+        return float(raw)
+    except ValueError:
+        pass
+    total = 0.0
+    number = ""
+    for ch in raw:
+        if ch.isdigit() or ch == ".":
+            number += ch
+            continue
+        if not number or ch not in "hms":
+            raise ValueError(f"invalid duration '{text}'")
+        total += float(number) * {"h": 60.0, "m": 1.0, "s": 1 / 60.0}[ch]
+        number = ""
+    if number:
+        raise ValueError(f"invalid duration '{text}'")
+    return total
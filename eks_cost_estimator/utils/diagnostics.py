@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, List
+
+
+DEFAULT_MAX_SAMPLES = 20
+
+# Message templates per warning code; only sampled records are ever formatted
+WARNING_MESSAGES: Dict[str, str] = {
+    "missing_requests": (
+        "{kind} {obj}: container '{detail}' missing requests; "
+        "defaulted to cpu=100m, memory=128Mi"
+    ),
+    "unknown_cpu_unit": "{kind} {obj}: unknown CPU unit '{detail}', defaulted to 0.1",
+    "unknown_memory_unit": "{kind} {obj}: unknown memory unit '{detail}', defaulted to 0.128Gi",
+    "unknown_size_unit": "{kind} {obj}: unknown memory unit '{detail}', skipping",
+    "pvc_missing_storage": "{kind} {obj}: missing storage request; skipping from storage totals",
+    "vct_missing_storage": "{kind} {obj} volumeClaimTemplates '{detail}' missing storage; skipping",
+    "unschedulable": (
+        "{kind} {obj}: no node pool matches its nodeSelector/tolerations; not bin-packed"
+    ),
+    "conflicting_definitions": (
+        "{kind} {obj}: conflicting definitions in {detail}; keeping the first"
+    ),
+    "invalid_schedule": "{kind} {obj}: invalid schedule '{detail}'; not simulated",
+    "invalid_duration": "{kind} {obj}: invalid duration '{detail}'; using the default",
+    "hpa_invalid": "{kind} {obj}: missing scaleTargetRef or maxReplicas; ignored",
+    "hpa_target_missing": "{kind} {obj}: scale target {detail} not found; ignored",
+    "fargate_unsupported": "{kind} {obj}: cannot run on Fargate ({detail}); not priced",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class WarningRecord:
+    code: str
+    kind: str
+    obj: str
+    detail: str = ""
+
+    def format(self) -> str:
+        template = WARNING_MESSAGES.get(self.code, "{kind} {obj}: {detail}")
+        return template.format(kind=self.kind, obj=self.obj, detail=self.detail)
+
+
+class WarningLog:
+    """Warnings counted per code, keeping at most ``max_samples`` records per code.
+
+    Memory and output stay proportional to the number of distinct codes, however many
+    objects trigger them; messages are formatted only when requested.
+    """
+
+    def __init__(self, max_samples: int = DEFAULT_MAX_SAMPLES) -> None:
+        self.max_samples = max_samples
+        self.counts: Dict[str, int] = {}
+        self._samples: Dict[str, List[WarningRecord]] = {}
+
+    def add(self, code: str, kind: str, obj: str, detail: str = "") -> None:
+        n = self.counts.get(code, 0)
+        self.counts[code] = n + 1
+        if n < self.max_samples:
+            self._samples.setdefault(code, []).append(WarningRecord(code, kind, obj, detail))
+
+    def records(self) -> Iterator[WarningRecord]:
+        for samples in self._samples.values():
+            yield from samples
+
+    def messages(self) -> List[str]:
+        """Sorted unique sample messages, plus one summary line per truncated code."""
+        out = sorted({r.format() for r in self.records()})
+        for code in sorted(self.counts):
+            hidden = self.counts[code] - len(self._samples.get(code, ()))
+            if hidden > 0:
+                out.append(f"{code}: {hidden} more warnings not shown")
+        return out
+
+    def __len__(self) -> int:
+        return sum(self.counts.values())
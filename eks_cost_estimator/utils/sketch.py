@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import math
+from typing import Dict
+
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+# Values at or below this count as zero (idle containers report 0 CPU)
+MIN_INDEXABLE_VALUE = 1e-9
+
+
+class DDSketch:
+    """Quantile sketch of non-negative values with bounded relative error.
+
+    Values fall into logarithmic buckets ``(gamma^(k-1), gamma^k]`` with
+    ``gamma = (1 + a) / (1 - a)``, so every quantile is within relative accuracy ``a``
+    of a value seen. Memory is bounded by ``max_buckets``: past it the lowest buckets
+    are collapsed, keeping the upper quantiles (the ones rightsizing needs) exact to
+    ``a``. Sketches with the same parameters merge losslessly.
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "max_buckets",
+        "_log_gamma",
+        "_bins",
+        "_zeros",
+        "count",
+        "min",
+        "max",
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ) -> None:
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._log_gamma = math.log((1.0 + relative_accuracy) / (1.0 - relative_accuracy))
+        self._bins: Dict[int, int] = {}
+        self._zeros = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        if value < 0.0:
+            raise ValueError(f"DDSketch only accepts non-negative values, got {value}")
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= MIN_INDEXABLE_VALUE:
+            self._zeros += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        bins = self._bins
+        if key in bins:
+            bins[key] += 1
+        else:
+            bins[key] = 1
+            if len(bins) > self.max_buckets:
+                self._collapse()
+
+    def _collapse(self) -> None:
+        keys = sorted(self._bins)
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        for key in keys[:excess]:
+            self._bins[target] += self._bins.pop(key)
+
+    def merge(self, other: "DDSketch") -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, n in other._bins.items():
+            self._bins[key] = self._bins.get(key, 0) + n
+        if len(self._bins) > self.max_buckets:
+            self._collapse()
+        self._zeros += other._zeros
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """Value at quantile ``q`` in [0, 1]; 0.0 for an empty sketch."""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("quantile must be in [0, 1]")
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self._zeros
+        if seen > rank:
+            return max(self.min, 0.0)
+        gamma = math.exp(self._log_gamma)
+        for key in sorted(self._bins):
+            seen += self._bins[key]
+            if seen > rank:
+                # Bucket midpoint in relative terms: within relative_accuracy of any member
+                value = 2.0 * gamma**key / (gamma + 1.0)
+                return min(max(value, self.min), self.max)
+        return self.max
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List
+
+
+@dataclass(slots=True)
+class StageStats:
+    calls: int = 0
+    wall_s: float = 0.0
+    alloc_blocks: int = 0  # net change in allocated memory blocks
+    peak_bytes: int = 0  # peak traced memory above stage start; tracemalloc only
+
+
+@dataclass(slots=True)
+class FileTiming:
+    path: str
+    seconds: float
+    documents: int
+
+
+@dataclass(slots=True)
+class Timings:
+    """Per-stage wall time and allocation counters for one estimation run.
+
+    Stages are flat names (``parse.yaml_load``); nested stages are counted in their
+    parents too. With ``trace_memory`` the tracemalloc peak of each stage is recorded,
+    at a noticeable runtime cost.
+    """
+
+    enabled: bool = True
+    trace_memory: bool = False
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+    files: List[FileTiming] = field(default_factory=list)
+    _started: float = field(default_factory=time.perf_counter)
+    # [traced bytes at stage start, highest peak seen by nested stages]
+    _mem_stack: List[List[int]] = field(default_factory=list)
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self) -> None:
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._mem_stack:
+                self._mem_stack[-1][1] = max(self._mem_stack[-1][1], peak)
+            self._mem_stack.append([current, current])
+            tracemalloc.reset_peak()
+        blocks0 = sys.getallocatedblocks()
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            st = self.stages.get(name)
+            if st is None:
+                st = self.stages[name] = StageStats()
+            st.calls += 1
+            st.wall_s += elapsed
+            st.alloc_blocks += sys.getallocatedblocks() - blocks0
+            if tracing and self._mem_stack:
+                start, nested_peak = self._mem_stack.pop()
+                peak = max(tracemalloc.get_traced_memory()[1], nested_peak)
+                st.peak_bytes = max(st.peak_bytes, peak - start)
+                if self._mem_stack:
+                    self._mem_stack[-1][1] = max(self._mem_stack[-1][1], peak)
+
+    def count(self, name: str, n: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def record_file(self, path: str, seconds: float, documents: int) -> None:
+        if self.enabled:
+            self.files.append(FileTiming(path=path, seconds=seconds, documents=documents))
+
+    def to_dict(self) -> Dict[str, Any]:
+        parse = self.stages.get("parse")
+        docs = self.counters.get("documents", 0)
+        return {
+            "total_wall_s": time.perf_counter() - self._started,
+            "stages": {
+                name: {
+                    "calls": st.calls,
+                    "wall_s": st.wall_s,
+                    "alloc_blocks": st.alloc_blocks,
+                    **({"peak_bytes": st.peak_bytes} if self.trace_memory else {}),
+                }
+                for name, st in self.stages.items()
+            },
+            "counters": dict(self.counters),
+            "documents_per_s": (docs / parse.wall_s) if parse and parse.wall_s > 0 else 0.0,
+            "files": [
+                {"path": f.path, "seconds": f.seconds, "documents": f.documents} for f in self.files
+            ],
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2, sort_keys=True)
+
+
+# Shared no-op instance used when the caller did not ask for timings
+NULL_TIMINGS = Timings(enabled=False)
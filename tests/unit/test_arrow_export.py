@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from eks_cost_estimator.core.orchestrator import EstimationConfig, orchestrate
+from eks_cost_estimator.output.arrow_export import ArrowExportError, export_result
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+def _result():
+    cfg = EstimationConfig(
+        region="eu-west-3",
+        baseline_instance="m6i.large",
+        baseline_price_override=None,
+        cpu_weight=0.6,
+        mem_weight=0.4,
+        binpack=True,
+    )
+    return orchestrate(sorted(str(p) for p in FIXTURES.glob("*.yaml")), cfg)
+
+
+def test_parquet_export_in_batches(tmp_path: Path):
+    result = _result()
+    counts = export_result(result, tmp_path, fmt="parquet", batch_rows=1)
+
+    table = pq.read_table(tmp_path / "workloads.parquet")
+    assert counts["workloads"] == table.num_rows == len(result.workloads)
+    assert table.column("monthly").to_pylist() == [w.monthly for w in result.workloads]
+    # batch_rows=1 yields one row group per row
+    assert pq.ParquetFile(tmp_path / "workloads.parquet").num_row_groups == len(result.workloads)
+    allocs = pq.read_table(tmp_path / "binpack_allocations.parquet")
+    assert allocs.num_rows == sum(len(n.allocations) for n in result.binpacking.nodes)
+
+
+def test_arrow_ipc_export(tmp_path: Path):
+    result = _result()
+    export_result(result, tmp_path, fmt="arrow")
+    with pa.ipc.open_file(tmp_path / "storage.arrow") as reader:
+        table = reader.read_all()
+    assert table.column("name").to_pylist() == [s.name for s in result.storage]
+
+
+def test_unknown_format_rejected(tmp_path: Path):
+    with pytest.raises(ArrowExportError):
+        export_result(_result(), tmp_path, fmt="orc")
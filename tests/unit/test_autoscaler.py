@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from eks_cost_estimator.calculators.autoscaler import (
+    events_from_workloads,
+    read_pod_trace,
+    simulate_autoscaler,
+)
+from eks_cost_estimator.calculators.hpa import SimulationError
+from eks_cost_estimator.models.resources import HpaItem, PodEvent, WorkloadItem
+
+# 1.8 vCPU / 7.5 GB allocatable per node
+SIZING = dict(instance_type="m6i.large", node_cpu_vcpu=2, node_mem_gb=8, node_hourly_price=0.1)
+
+
+def _add(minute, pod, cpu=1.0, mem=1.0):
+    return PodEvent(minute, pod, True, cpu, mem)
+
+
+def _delete(minute, pod):
+    return PodEvent(minute, pod, False)
+
+
+def test_scale_up_and_delayed_scale_down():
+    events = [_add(0, "a"), _add(0, "b"), _delete(60, "b")]
+    r = simulate_autoscaler(events, horizon_minutes=120, **SIZING)
+    assert (r.scale_ups, r.scale_downs, r.peak_node_count) == (2, 1, 2)
+    # Two nodes until b's node has been empty for 10 minutes, then one
+    assert r.node_hours == pytest.approx((2 * 70 + 50) / 60)
+    assert r.hourly_cost == pytest.approx([0.2, 70 / 60 * 0.1])
+    assert r.monthly_node_cost == pytest.approx(190 / 120 * 720 * 0.1)
+
+
+def test_underused_node_is_drained_into_others():
+    events = [_add(0, "a", cpu=1.2), _add(0, "b", cpu=1.2), _add(0, "s", cpu=0.5)]
+    events.append(_delete(10, "a"))
+    r = simulate_autoscaler(events, horizon_minutes=60, **SIZING)
+    # s moves next to b at minute 20, emptying a's node
+    assert r.scale_downs == 1
+    assert r.node_hours == pytest.approx((2 * 20 + 40) / 60)
+    never = simulate_autoscaler(events, horizon_minutes=60, scale_down_utilization=0.2, **SIZING)
+    assert never.scale_downs == 0
+
+
+def test_max_nodes_leaves_pods_pending_and_oversized_pods_unschedulable():
+    events = [_add(0, "a"), _add(0, "b"), _delete(30, "a"), _add(0, "huge", cpu=4.0)]
+    r = simulate_autoscaler(events, horizon_minutes=60, max_nodes=1, **SIZING)
+    assert r.peak_node_count == 1 and r.pods_unschedulable == 1
+    assert r.peak_pending_pods == 1
+    assert r.pending_pod_hours == pytest.approx(0.5)
+    assert r.node_hours == pytest.approx(1.0)
+
+
+def test_read_pod_trace_csv_and_ndjson(tmp_path: Path):
+    csv_path = tmp_path / "trace.csv"
+    csv_path.write_text("minute,event,pod,cpu,memory\n0,add,p1,500m,1Gi\n5,delete,p1,,\n")
+    first, second = read_pod_trace(csv_path)
+    assert (first.cpu_vcpu, first.arrive) == (0.5, True)
+    assert first.memory_gb == pytest.approx(1.073741824)
+    assert (second.minute, second.arrive) == (5.0, False)
+    nd = tmp_path / "trace.ndjson"
+    nd.write_text(json.dumps({"minute": 1, "event": "add", "pod": "x", "cpu": 2, "memory": 4}))
+    (event,) = read_pod_trace(nd)
+    assert (event.cpu_vcpu, event.memory_gb) == (2.0, 4.0)
+    bad = tmp_path / "bad.csv"
+    bad.write_text("minute,event,pod\n0,evict,p1\n")
+    with pytest.raises(SimulationError, match="record 1"):
+        read_pod_trace(bad)
+
+
+def test_events_follow_hpa_profile():
+    pytest.importorskip("numpy")
+    workloads = [
+        WorkloadItem(
+            name="api",
+            kind="Deployment",
+            replicas=2,
+            cpu_vcpu_per_replica=1.0,
+            memory_gb_per_replica=1.0,
+        )
+    ]
+    hpa = HpaItem(
+        name="api",
+        target_kind="Deployment",
+        target_name="api",
+        max_replicas=4,
+        target_cpu_utilization=0.5,
+    )
+    # 2 replicas at 25% -> 1; at 100% -> 4
+    profile = {"default": (0.25,) * 12 + (1.0,) * 12}
+    events, unmatched = events_from_workloads(workloads, [hpa], profile)
+    assert unmatched == []
+    assert sum(e.arrive for e in events if e.minute == 12 * 60) == 3
+    assert sum(not e.arrive for e in events if e.minute == 24 * 60) == 3
+    r = simulate_autoscaler(events, horizon_minutes=2 * 1440, **SIZING)
+    assert r.peak_node_count == 4
+    # Three nodes removed 10 minutes after the first busy half-day; the second ends at
+    # the horizon
+    assert r.scale_downs == 3
+    assert r.node_hours == pytest.approx(2 * (12 + 4 * 12) + 3 * 10 / 60)
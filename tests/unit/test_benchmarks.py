@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from benchmarks.generate import ManifestSpec, generate_manifests
+from benchmarks.run import compare
+from eks_cost_estimator.parsers.yaml_parser import parse_files
+
+
+def test_generator_produces_parseable_manifests(tmp_path):
+    spec = ManifestSpec(workloads=40, pvc_ratio=0.5, lb_ratio=0.5, docs_per_file=7, configmap_kb=1)
+    paths = generate_manifests(tmp_path, spec)
+    assert len(paths) > 1
+    out = parse_files([str(p) for p in paths])
+    assert len(out.workloads) == 40
+    assert any(s.kind == "StatefulSetVolumeClaimTemplate" for s in out.storage)
+    assert any(s.kind == "PersistentVolumeClaim" for s in out.storage)
+    assert out.services
+
+
+def test_compare_flags_throughput_regressions():
+    baselines = {"1k": {"parse": {"items_per_s": 1000.0}, "compute": {"items_per_s": 100.0}}}
+    results = {"1k": {"parse": {"items_per_s": 700.0}, "compute": {"items_per_s": 90.0}}}
+    regressions = compare(results, baselines, threshold=0.25)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("1k/parse")
+
+
+def test_slotted_records_are_smaller_than_pydantic_models():
+    from benchmarks.memory import measure
+
+    report = measure(rows=2_000)
+    assert set(report) >= {"WorkloadItem", "WorkloadCost", "NodeBinAllocation"}
+    for row in report.values():
+        assert row["slotted_bytes_per_row"] < row["pydantic_bytes_per_row"]
@@ -1,8 +1,26 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 from eks_cost_estimator.calculators.binpack import simulate_binpack
+from eks_cost_estimator.core.orchestrator import EstimationConfig, orchestrate
 from eks_cost_estimator.models.resources import WorkloadItem
 
+UNNAMED_DEPLOYMENT = """
+apiVersion: apps/v1
+kind: Deployment
+spec:
+  replicas: {replicas}
+  template:
+    spec:
+      containers:
+        - name: app
+          resources:
+            requests:
+              cpu: "{cpu}"
+              memory: "1Gi"
+"""
+
 
 def test_binpacking_simple_two_nodes():
     # Baseline m6i.large example: 2 vCPU, 8 GB; reserve 0.2 vCPU and 0.5 GB
@@ -37,3 +55,28 @@ def test_binpacking_simple_two_nodes():
     assert res.node_count == 2
     # Ensure one node nearly full and the other has 1 replica
     assert any(abs(n.cpu_used - n.cpu_capacity) < 1e-6 and abs(n.mem_used_gb - n.mem_capacity_gb) < 1e-6 for n in res.nodes)
+
+
+def test_unnamed_deployments_do_not_collide(tmp_path: Path):
+    # Both default to the name "unnamed": equal shapes merge, a different one is suffixed
+    path = tmp_path / "m.yaml"
+    path.write_text(
+        "---".join(
+            UNNAMED_DEPLOYMENT.format(replicas=r, cpu=c)
+            for r, c in ((2, "500m"), (1, "500m"), (1, "250m"))
+        )
+    )
+    cfg = EstimationConfig(
+        region="eu-west-3",
+        baseline_instance="m6i.large",
+        baseline_price_override=0.1,
+        cpu_weight=0.6,
+        mem_weight=0.4,
+        binpack=True,
+    )
+    bp = orchestrate([str(path)], cfg).binpacking
+    placed = {}
+    for n in bp.nodes:
+        for a in n.allocations:
+            placed[a.workload] = placed.get(a.workload, 0) + a.replicas
+    assert placed == {"unnamed": 3, "unnamed#2": 1}
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from eks_cost_estimator.calculators.blended import blended_pricing, optimize_commitment
+from eks_cost_estimator.models.resources import HpaItem, WorkloadItem
+from eks_cost_estimator.models.results import WorkloadCost
+from eks_cost_estimator.pricing.registry import PricingDataError
+from eks_cost_estimator.pricing.spot import read_spot_history
+
+np = pytest.importorskip("numpy")
+
+
+def _pair(name, hourly, replicas=1, selector=None):
+    w = WorkloadItem(
+        name=name,
+        kind="Deployment",
+        replicas=replicas,
+        cpu_vcpu_per_replica=1.0,
+        memory_gb_per_replica=1.0,
+        node_selector=selector,
+    )
+    cost = WorkloadCost(
+        name=name,
+        kind="Deployment",
+        replicas=replicas,
+        cpu_vcpu_per_replica=1.0,
+        memory_gb_per_replica=1.0,
+        hourly=hourly,
+        monthly=hourly * 720,
+    )
+    return w, cost
+
+
+def test_optimizer_matches_grid_search():
+    usage = np.random.default_rng(0).uniform(1.0, 10.0, 720)
+    level, cost = optimize_commitment(usage, 0.3)
+    grid = np.linspace(0.0, 11.0, 1101)
+    brute = grid * 720 * 0.7 + np.maximum(usage[None, :] - grid[:, None], 0.0).sum(axis=1)
+    assert cost == pytest.approx(brute.min(), rel=1e-4)
+    assert cost <= brute.min() + 1e-9
+    # Flat usage: commit to all of it
+    assert optimize_commitment(np.full(720, 2.0), 0.3) == pytest.approx((2.0, 2.0 * 720 * 0.7))
+
+
+def test_blend_classes_and_hpa_curve():
+    web, web_cost = _pair("web", 0.4, replicas=4)
+    batch, batch_cost = _pair("batch", 1.0, selector={"eks.amazonaws.com/capacityType": "SPOT"})
+    hpa = HpaItem(name="web", target_kind="Deployment", target_name="web", max_replicas=8)
+    # Half the day at 4 replicas' worth of load, half at 8
+    profile = {"default": (0.8,) * 12 + (1.6,) * 12}
+    r = blended_pricing(
+        [web, batch],
+        [web_cost, batch_cost],
+        [hpa],
+        on_demand_price=0.1,
+        spot_price=0.03,
+        commitment_discount=0.3,
+        profile=profile,
+    )
+    od, spot = r.classes
+    assert (od.workloads, spot.workloads) == (1, 1)
+    assert od.on_demand_monthly == pytest.approx((0.4 + 0.8) / 2 * 720)
+    assert spot.blended_monthly == pytest.approx(720 * 0.3)
+    # Committing to the base (0.4 * 0.7 + 0.4 half the time) beats the peak (0.8 * 0.7)
+    assert r.commitment_hourly == pytest.approx(0.4)
+    assert od.blended_monthly == pytest.approx((0.4 * 0.7 + 0.4 / 2) * 720)
+    assert r.commitment_utilization == pytest.approx(1.0)
+    assert r.commitment_coverage == pytest.approx(0.4 / 0.6)
+    assert r.blended_monthly == pytest.approx(od.blended_monthly + spot.blended_monthly)
+
+
+def test_read_spot_history_json_and_csv(tmp_path: Path):
+    history = {
+        "SpotPriceHistory": [
+            {"InstanceType": "m6i.large", "ProductDescription": "Linux/UNIX", "SpotPrice": "0.03"},
+            {"InstanceType": "m6i.large", "ProductDescription": "Linux/UNIX", "SpotPrice": "0.05"},
+            {"InstanceType": "m6i.large", "ProductDescription": "Windows", "SpotPrice": "0.50"},
+            {"InstanceType": "c6i.large", "ProductDescription": "Linux/UNIX", "SpotPrice": "0.02"},
+        ]
+    }
+    j = tmp_path / "h.json"
+    j.write_text(json.dumps(history))
+    assert read_spot_history(j, "m6i.large") == pytest.approx(0.04)
+    c = tmp_path / "h.csv"
+    c.write_text("instance_type,price\nm6i.large,0.02\nm6i.large,0.04\n")
+    assert read_spot_history(c, "m6i.large") == pytest.approx(0.03)
+    with pytest.raises(PricingDataError):
+        read_spot_history(c, "r6i.large")
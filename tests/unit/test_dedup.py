@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from eks_cost_estimator.parsers.yaml_parser import parse_files
+from eks_cost_estimator.utils.timings import Timings
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+DEPLOYMENT = """\
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: api
+  namespace: shop
+spec:
+  replicas: {replicas}
+  template:
+    spec:
+      containers:
+        - name: app
+"""
+
+
+def test_identical_documents_counted_once(tmp_path: Path):
+    t = Timings()
+    paths = [str(p) for p in sorted(FIXTURES.glob("*.yaml"))]
+    once = parse_files(paths)
+    twice = parse_files(paths + paths[::-1], timings=t)
+    assert twice.workloads == once.workloads
+    assert twice.storage == once.storage
+    assert twice.services == once.services
+    assert t.counters["documents_duplicate"] > 0
+
+
+def test_conflicting_definitions_keep_first(tmp_path: Path):
+    first = tmp_path / "a.yaml"
+    second = tmp_path / "b.yaml"
+    reformatted = tmp_path / "c.yaml"
+    first.write_text(DEPLOYMENT.format(replicas=2))
+    second.write_text(DEPLOYMENT.format(replicas=5))
+    reformatted.write_text("# same object\n" + DEPLOYMENT.format(replicas=2))
+
+    out = parse_files([str(first), str(second), str(reformatted)])
+    assert [w.replicas for w in out.workloads] == [2]
+    conflicts = [w for w in out.warnings.messages() if "conflicting definitions" in w]
+    assert len(conflicts) == 1
+    assert str(first) in conflicts[0] and str(second) in conflicts[0]
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from eks_cost_estimator.core.orchestrator import EstimationConfig, orchestrate
+from eks_cost_estimator.utils.diagnostics import WarningLog
+
+
+def test_samples_capped_and_counted():
+    log = WarningLog(max_samples=3)
+    for i in range(10):
+        log.add("missing_requests", "Deployment", f"wl-{i}", "app")
+    log.add("unknown_cpu_unit", "Pod", "p", "2x")
+
+    assert log.counts == {"missing_requests": 10, "unknown_cpu_unit": 1}
+    assert len(log) == 11
+    assert len(list(log.records())) == 4
+    messages = log.messages()
+    assert "Pod p: unknown CPU unit '2x', defaulted to 0.1" in messages
+    assert "missing_requests: 7 more warnings not shown" in messages
+
+
+def test_result_carries_warning_counts(tmp_path: Path):
+    docs = "\n---\n".join(
+        f"kind: Deployment\nmetadata:\n  name: wl-{i}\nspec:\n  template:\n    spec:\n"
+        "      containers:\n        - name: app\n"
+        for i in range(50)
+    )
+    path = tmp_path / "m.yaml"
+    path.write_text(docs)
+    cfg = EstimationConfig(
+        region="eu-west-3",
+        baseline_instance="m6i.large",
+        baseline_price_override=None,
+        cpu_weight=0.6,
+        mem_weight=0.4,
+    )
+    result = orchestrate([str(path)], cfg)
+    assert result.warning_counts == {"missing_requests": 50}
+    assert len(result.warnings) < 50
+    assert (
+        "Deployment wl-0: container 'app' missing requests; defaulted to cpu=100m, memory=128Mi"
+        in result.warnings
+    )
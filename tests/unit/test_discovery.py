@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from eks_cost_estimator.core.exceptions import ParseError
+from eks_cost_estimator.parsers.discovery import discover_files, iter_discovered
+
+
+FIXTURES = Path("tests/fixtures")
+
+
+def _touch(path: Path, text: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_directory_walk_honors_ignore_files(tmp_path):
+    _touch(tmp_path / "a.yaml")
+    _touch(tmp_path / "b.yml")
+    _touch(tmp_path / "notes.txt")
+    _touch(tmp_path / "nested" / "deep" / "c.yaml")
+    _touch(tmp_path / "nested" / "skip-me.yaml")
+    _touch(tmp_path / "build" / "d.yaml")
+    _touch(tmp_path / ".gitignore", "build/\n")
+    _touch(tmp_path / "nested" / ".eksignore", "skip-*.yaml\n")
+
+    found = [Path(p).relative_to(tmp_path).as_posix() for p in discover_files([str(tmp_path)])]
+    assert found == ["a.yaml", "b.yml", "nested/deep/c.yaml"]
+
+
+def test_globs_and_explicit_files_are_deduplicated():
+    inputs = [str(FIXTURES / "*.yaml"), str(FIXTURES / "pvc.yaml")]
+    found = list(iter_discovered(inputs))
+    assert len(found) == 4
+    assert sum(1 for p in found if p.endswith("pvc.yaml")) == 1
+
+
+def test_inputs_matching_nothing_fail(tmp_path):
+    _touch(tmp_path / "empty" / "notes.txt")
+    for raw in (str(tmp_path / "*.yml"), str(tmp_path / "empty")):
+        with pytest.raises(ParseError, match="no manifests match"):
+            list(iter_discovered([str(FIXTURES / "pvc.yaml"), raw]))
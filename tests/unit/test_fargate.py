@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from eks_cost_estimator.calculators.fargate import (
+    DEFAULT_FARGATE_GB_HOUR,
+    DEFAULT_FARGATE_STORAGE_GB_HOUR,
+    DEFAULT_FARGATE_VCPU_HOUR,
+    GB_PER_GIB,
+    fargate_costs,
+    fargate_size,
+)
+from eks_cost_estimator.models.resources import WorkloadItem
+from eks_cost_estimator.parsers.yaml_parser import parse_files
+
+DEPLOYMENT = """\
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: api
+spec:
+  replicas: 3
+  template:
+    spec:
+      containers:
+        - name: app
+          resources:
+            requests:
+              cpu: 300m
+              memory: 1Gi
+              ephemeral-storage: 30Gi
+        - name: sidecar
+          resources:
+            requests:
+              cpu: 100m
+              memory: 256Mi
+"""
+
+
+def _wl(name, cpu, mem_gib, kind="Deployment", replicas=1):
+    return WorkloadItem(
+        name=name,
+        kind=kind,
+        replicas=replicas,
+        cpu_vcpu_per_replica=cpu,
+        memory_gb_per_replica=mem_gib * GB_PER_GIB,
+    )
+
+
+@pytest.mark.parametrize(
+    "cpu, mem, expected",
+    [
+        (0.1, 0.2, (0.25, 0.5)),
+        (0.25, 2.0, (0.25, 2.0)),
+        (0.25, 2.1, (0.5, 3.0)),  # memory beyond the 0.25 vCPU range
+        (1.0, 8.5, (2.0, 9.0)),
+        (3.0, 5.0, (4.0, 8.0)),  # minimum memory of the 4 vCPU tier
+        (8.0, 17.0, (8.0, 20.0)),  # 4 GiB steps
+        (16.0, 121.0, None),
+    ],
+)
+def test_fargate_size_rounds_up(cpu, mem, expected):
+    assert fargate_size(cpu, mem) == expected
+
+
+def test_costs_add_overhead_and_flag_unsupported():
+    workloads = [
+        _wl("web", 0.5, 3.75, replicas=2),  # + 0.25 GiB -> exactly 0.5 vCPU / 4 GiB
+        _wl("agent", 0.1, 0.1, kind="DaemonSet"),
+        _wl("huge", 32.0, 64.0),
+    ]
+    items, totals, result, unsupported = fargate_costs(workloads)
+    per_pod = 0.5 * DEFAULT_FARGATE_VCPU_HOUR + 4.0 * DEFAULT_FARGATE_GB_HOUR
+    assert items[0].hourly == pytest.approx(2 * per_pod)
+    assert [i.hourly for i in items[1:]] == [0.0, 0.0]
+    assert [w.name for w in unsupported] == ["agent", "huge"]
+    assert totals["monthly"] == pytest.approx(2 * per_pod * 720)
+    assert (result.billed_vcpu, result.billed_memory_gib, result.unsupported) == (1.0, 8.0, 2)
+
+
+def test_parser_sums_ephemeral_storage_and_it_is_billed(tmp_path: Path):
+    f = tmp_path / "d.yaml"
+    f.write_text(DEPLOYMENT)
+    (wl,) = parse_files([str(f)]).workloads
+    assert wl.ephemeral_storage_gb_per_replica == pytest.approx(30 * GB_PER_GIB)
+    _, _, result, _ = fargate_costs([wl])
+    (pod,) = result.pods
+    # 0.4 vCPU, 1.25 GiB + 0.25 GiB overhead -> 0.5 vCPU / 2 GiB; 10 GiB extra storage
+    assert (pod.vcpu, pod.memory_gib) == (0.5, 2.0)
+    assert pod.billed_storage_gib == pytest.approx(10.0)
+    assert pod.hourly_per_pod == pytest.approx(
+        0.5 * DEFAULT_FARGATE_VCPU_HOUR
+        + 2.0 * DEFAULT_FARGATE_GB_HOUR
+        + 10.0 * DEFAULT_FARGATE_STORAGE_GB_HOUR
+    )
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from eks_cost_estimator.calculators.groupby import parse_group_by
+from eks_cost_estimator.core.orchestrator import EstimationConfig, orchestrate
+
+
+MANIFEST = """
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: api
+  namespace: shop
+  labels:
+    team: payments
+spec:
+  replicas: 2
+  template:
+    spec:
+      containers:
+        - name: app
+          resources:
+            requests:
+              cpu: "500m"
+              memory: "1Gi"
+---
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: worker
+  namespace: shop
+spec:
+  replicas: 1
+  template:
+    metadata:
+      labels:
+        team: search
+    spec:
+      containers:
+        - name: app
+          resources:
+            requests:
+              cpu: "1"
+              memory: "2Gi"
+---
+apiVersion: v1
+kind: Service
+metadata:
+  name: api-lb
+  namespace: shop
+  labels:
+    team: payments
+spec:
+  type: LoadBalancer
+---
+apiVersion: v1
+kind: Service
+metadata:
+  name: internal
+  namespace: shop
+spec:
+  type: ClusterIP
+---
+apiVersion: v1
+kind: PersistentVolumeClaim
+metadata:
+  name: data
+  namespace: ops
+spec:
+  resources:
+    requests:
+      storage: 10Gi
+"""
+
+
+def _cfg(group_by):
+    return EstimationConfig(
+        region="eu-west-3",
+        baseline_instance="m6i.large",
+        baseline_price_override=None,
+        cpu_weight=0.6,
+        mem_weight=0.4,
+        group_by=group_by,
+    )
+
+
+def test_parse_group_by_validates_keys():
+    assert parse_group_by("namespace, label:team") == ("namespace", "label:team")
+    with pytest.raises(ValueError):
+        parse_group_by("owner")
+    with pytest.raises(ValueError):
+        parse_group_by("label:")
+
+
+def test_group_totals_match_overall_totals(tmp_path: Path):
+    path = tmp_path / "m.yaml"
+    path.write_text(MANIFEST)
+    result = orchestrate([str(path)], _cfg(("namespace", "label:team")))
+
+    groups = {tuple(g.key.values()): g for g in result.groups}
+    assert set(groups) == {("shop", "payments"), ("shop", "search"), ("ops", "(none)")}
+    # Template labels are the fallback when metadata has none
+    assert groups[("shop", "search")].compute_monthly > 0
+    assert groups[("shop", "payments")].lb_monthly == pytest.approx(result.totals.lb_monthly)
+    assert groups[("ops", "(none)")].storage_monthly == pytest.approx(result.totals.storage_monthly)
+
+    grand = result.totals.compute_monthly + result.totals.storage_monthly + result.totals.lb_monthly
+    assert sum(g.total_monthly for g in result.groups) == pytest.approx(grand)
+
+
+def test_no_groups_by_default(tmp_path: Path):
+    path = tmp_path / "m.yaml"
+    path.write_text(MANIFEST)
+    result = orchestrate([str(path)], _cfg(()))
+    assert result.groups is None
+    assert result.workloads
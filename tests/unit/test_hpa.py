@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from eks_cost_estimator.calculators.hpa import (
+    SimulationError,
+    join_hpas,
+    read_load_profile,
+    simulate_hpa,
+)
+from eks_cost_estimator.models.resources import HpaItem, WorkloadItem
+from eks_cost_estimator.parsers.yaml_parser import parse_files
+
+MANIFESTS = """\
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: api
+  namespace: shop
+spec:
+  replicas: 4
+  template:
+    spec:
+      containers:
+        - name: app
+          resources:
+            requests:
+              cpu: "1"
+              memory: 2Gi
+---
+apiVersion: autoscaling/v2
+kind: HorizontalPodAutoscaler
+metadata:
+  name: api
+  namespace: shop
+spec:
+  scaleTargetRef:
+    apiVersion: apps/v1
+    kind: Deployment
+    name: api
+  minReplicas: 2
+  maxReplicas: 10
+  metrics:
+    - type: Resource
+      resource:
+        name: cpu
+        target:
+          type: Utilization
+          averageUtilization: 50
+---
+apiVersion: autoscaling/v1
+kind: HorizontalPodAutoscaler
+metadata:
+  name: ghost
+spec:
+  scaleTargetRef:
+    kind: Deployment
+    name: missing
+  maxReplicas: 3
+"""
+
+RATES = {"per_vcpu_hour": 0.01, "per_gb_ram_hour": 0.005}
+
+
+def _wl(name, replicas=4):
+    return WorkloadItem(
+        name=name,
+        kind="Deployment",
+        replicas=replicas,
+        cpu_vcpu_per_replica=1.0,
+        memory_gb_per_replica=2.0,
+    )
+
+
+def test_parser_reads_hpa_v1_and_v2(tmp_path: Path):
+    f = tmp_path / "m.yaml"
+    f.write_text(MANIFESTS)
+    out = parse_files([str(f)])
+    api, ghost = out.hpas
+    assert (api.min_replicas, api.max_replicas, api.target_cpu_utilization) == (2, 10, 0.5)
+    assert (api.target_kind, api.target_name, api.namespace) == ("Deployment", "api", "shop")
+    assert (ghost.min_replicas, ghost.target_cpu_utilization) == (1, None)
+    joined, unmatched = join_hpas(out.workloads, out.hpas)
+    assert list(joined) == [0] and unmatched == [ghost]
+
+
+def test_parser_skips_malformed_hpa_metrics(tmp_path: Path):
+    f = tmp_path / "hpa.yaml"
+    f.write_text(
+        """\
+apiVersion: autoscaling/v2beta1
+kind: HorizontalPodAutoscaler
+metadata:
+  name: api
+spec:
+  scaleTargetRef: {kind: Deployment, name: api}
+  maxReplicas: 5
+  metrics:
+    - null
+    - cpu
+    - {type: Resource, resource: cpu}
+    - {type: Resource, resource: {name: cpu, target: 70}}
+    - {type: Resource, resource: {name: cpu, targetAverageUtilization: 80}}
+"""
+    )
+    (hpa,) = parse_files([str(f)]).hpas
+    assert hpa.target_cpu_utilization == 0.8
+
+
+def test_read_load_profile_formats(tmp_path: Path):
+    text = tmp_path / "p.txt"
+    text.write_text("# hourly\n" + ",".join(["0.4"] * 12) + "\n" + " ".join(["0.8"] * 12))
+    assert read_load_profile(text)["default"] == (0.4,) * 12 + (0.8,) * 12
+    keyed = tmp_path / "p.json"
+    keyed.write_text(json.dumps({"shop/api": [1.0] * 168, "default": [0.5] * 24}))
+    assert set(read_load_profile(keyed)) == {"shop/api", "default"}
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps([0.5] * 25))
+    with pytest.raises(SimulationError):
+        read_load_profile(bad)
+
+
+def test_simulation_bounds_and_profile():
+    pytest.importorskip("numpy")
+    workloads = [_wl("api"), _wl("static", replicas=2)]
+    hpa = HpaItem(
+        name="api",
+        target_kind="Deployment",
+        target_name="api",
+        min_replicas=2,
+        max_replicas=10,
+        target_cpu_utilization=0.5,
+    )
+    # Half the day at 25% (-> 2 replicas), half at 100% (-> 8 replicas)
+    profile = {"default": (0.25,) * 12 + (1.0,) * 12}
+    result, unmatched = simulate_hpa(workloads, [hpa], RATES, profile)
+    per_replica = 1.0 * 0.01 + 2.0 * 0.005
+    static_monthly = 2 * per_replica * 720
+    assert unmatched == []
+    assert result.hpa_count == 1 and len(result.hourly_expected) == 720
+    assert result.monthly_min == pytest.approx(static_monthly + 2 * per_replica * 720)
+    assert result.monthly_max == pytest.approx(static_monthly + 10 * per_replica * 720)
+    assert result.monthly_expected == pytest.approx(static_monthly + 5 * per_replica * 720)
+    (row,) = result.workloads
+    assert (row.mean_replicas, row.peak_replicas) == (5.0, 8)
+    assert result.peak_hour == 12
+    assert result.peak_hourly == pytest.approx((2 + 8) * per_replica)
+
+
+def test_simulation_without_profile_keeps_manifest_replicas_clamped():
+    pytest.importorskip("numpy")
+    hpa = HpaItem(name="api", target_kind="Deployment", target_name="api", max_replicas=3)
+    result, _ = simulate_hpa([_wl("api", replicas=5)], [hpa], RATES, chunk_rows=1)
+    assert result.workloads[0].peak_replicas == 3
+    assert result.monthly_expected == pytest.approx(result.monthly_max)
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from eks_cost_estimator.calculators.jobsim import job_duration_minutes, simulate_jobs
+from eks_cost_estimator.models.resources import BatchJobItem, WorkloadItem
+from eks_cost_estimator.parsers.yaml_parser import parse_files
+from eks_cost_estimator.utils.cron import CronSchedule, parse_duration_minutes
+
+CRONJOB = """\
+apiVersion: batch/v1
+kind: CronJob
+metadata:
+  name: report
+  annotations:
+    eks-cost-estimator/duration: 15m
+spec:
+  schedule: "0 */6 * * *"
+  concurrencyPolicy: Forbid
+  jobTemplate:
+    spec:
+      parallelism: 2
+      completions: 4
+      template:
+        spec:
+          containers:
+            - name: r
+              resources:
+                requests:
+                  cpu: 500m
+                  memory: 1Gi
+---
+apiVersion: batch/v1
+kind: CronJob
+metadata:
+  name: broken
+spec:
+  schedule: "every tuesday"
+  jobTemplate:
+    spec:
+      template:
+        spec:
+          containers:
+            - name: b
+"""
+
+SIZING = dict(instance_type="m6i.large", node_cpu_vcpu=2, node_mem_gb=8, node_hourly_price=0.1)
+
+
+def _cron(name, schedule, **kw):
+    return BatchJobItem(
+        name=name,
+        kind="CronJob",
+        cpu_vcpu_per_pod=1.0,
+        memory_gb_per_pod=1.0,
+        schedule=schedule,
+        **kw,
+    )
+
+
+def test_cron_fields_macros_and_names():
+    s = CronSchedule.parse("*/15 9-17 * * MON-FRI")
+    assert s.minutes == (0, 15, 30, 45)
+    assert s.hours == tuple(range(9, 18))
+    assert s.weekdays == frozenset({1, 2, 3, 4, 5})
+    assert CronSchedule.parse("@daily") == CronSchedule.parse("0 0 * * *")
+    assert CronSchedule.parse("CRON_TZ=UTC 0 0 * * 7").weekdays == frozenset({0})
+    with pytest.raises(ValueError):
+        CronSchedule.parse("61 * * * *")
+    with pytest.raises(ValueError):
+        CronSchedule.parse("* * *")
+
+
+def test_fire_offsets_day_of_month_or_weekday():
+    # 2024-01-01 is a Monday: the 1st matches by day of month, Fridays by weekday
+    s = CronSchedule.parse("0 12 1 * FRI")
+    offsets = list(s.fire_offsets(datetime(2024, 1, 1), 10 * 1440))
+    assert offsets == [12 * 60, 4 * 1440 + 12 * 60]
+    # A stepped "*/2" day of month is restricted too: odd days or Fridays
+    s = CronSchedule.parse("0 12 */2 * FRI")
+    offsets = list(s.fire_offsets(datetime(2024, 1, 1), 10 * 1440))
+    assert offsets == [d * 1440 + 12 * 60 for d in (0, 2, 4, 6, 8)]
+    s = CronSchedule.parse("0 12 1-31/2 * FRI")
+    assert list(s.fire_offsets(datetime(2024, 1, 2), 10 * 1440)) == [
+        d * 1440 + 12 * 60 for d in (1, 3, 5, 7, 9)
+    ]
+    # "*/1" keeps the star: only Fridays
+    s = CronSchedule.parse("0 12 */1 * FRI")
+    assert list(s.fire_offsets(datetime(2024, 1, 1), 10 * 1440)) == [4 * 1440 + 12 * 60]
+
+
+def test_parse_duration_minutes():
+    assert parse_duration_minutes("90s") == 1.5
+    assert parse_duration_minutes("1h30m") == 90
+    assert parse_duration_minutes("20") == 20
+    with pytest.raises(ValueError):
+        parse_duration_minutes("10x")
+
+
+def test_single_job_runs_in_waves():
+    job = BatchJobItem(
+        name="batch",
+        kind="Job",
+        cpu_vcpu_per_pod=1.0,
+        memory_gb_per_pod=1.0,
+        completions=5,
+        parallelism=2,
+        duration_minutes=10,
+    )
+    r = simulate_jobs([], [job], horizon_minutes=120, **SIZING)
+    # 1.8 vCPU allocatable: one pod per node; waves of 2, 2, 1 pods for 10 min each
+    assert r.job_runs == 1 and r.pod_starts == 5
+    assert r.peak_node_count == 2 and r.steady_node_count == 0
+    assert r.node_hours == pytest.approx((2 * 10 + 2 * 10 + 1 * 10) / 60)
+
+
+def test_cronjob_adds_to_steady_nodes_only_while_running():
+    steady = WorkloadItem(
+        name="web",
+        kind="Deployment",
+        replicas=2,
+        cpu_vcpu_per_replica=1.0,
+        memory_gb_per_replica=1.0,
+    )
+    r = simulate_jobs(
+        [steady], [_cron("hourly", "0 * * * *", duration_minutes=6)], horizon_minutes=1440, **SIZING
+    )
+    assert r.steady_node_count == 2
+    assert r.peak_node_count == 3
+    assert r.job_runs == 24
+    assert r.average_node_count == pytest.approx(2 + 0.1)
+    assert r.monthly_node_cost == pytest.approx(2.1 * 720 * 0.1)
+
+
+def test_concurrency_policies():
+    long_runs = dict(duration_minutes=90)
+    allow = simulate_jobs([], [_cron("a", "0 * * * *", **long_runs)], horizon_minutes=600, **SIZING)
+    forbid = simulate_jobs(
+        [],
+        [_cron("f", "0 * * * *", concurrency_policy="Forbid", **long_runs)],
+        horizon_minutes=600,
+        **SIZING,
+    )
+    replace = simulate_jobs(
+        [],
+        [_cron("r", "0 * * * *", concurrency_policy="Replace", **long_runs)],
+        horizon_minutes=600,
+        **SIZING,
+    )
+    assert allow.peak_node_count == 2 and allow.runs_skipped == 0
+    assert forbid.peak_node_count == 1 and forbid.runs_skipped == 5
+    assert replace.peak_node_count == 1 and replace.job_runs == 10
+
+
+def test_deadline_caps_duration():
+    job = _cron("d", "@hourly", duration_minutes=50, deadline_minutes=20)
+    assert job_duration_minutes(job, 10) == 20
+    assert job_duration_minutes(_cron("x", "@hourly"), 7.5) == 8
+
+
+def test_parser_captures_batch_parameters(tmp_path: Path):
+    f = tmp_path / "cron.yaml"
+    f.write_text(CRONJOB)
+    out = parse_files([str(f)])
+    assert len(out.workloads) == 2
+    (job,) = out.batch_jobs
+    assert job.schedule == "0 */6 * * *"
+    assert (job.parallelism, job.completions) == (2, 4)
+    assert job.concurrency_policy == "Forbid"
+    assert job.duration_minutes == 15
+    assert job.cpu_vcpu_per_pod == pytest.approx(0.5)
+    assert out.warnings.counts["invalid_schedule"] == 1
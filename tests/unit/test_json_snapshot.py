@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import yaml
+
+from eks_cost_estimator.parsers.json_snapshot import looks_like_json
+from eks_cost_estimator.parsers.yaml_parser import parse_files
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+_OWNED = {"ownerReferences": [{"kind": "ReplicaSet", "name": "web-abc", "controller": True}]}
+
+
+def _pod(name: str, **meta):
+    return {
+        "kind": "Pod",
+        "metadata": {"name": name, "namespace": "prod", **meta},
+        "spec": {
+            "containers": [{"name": "c", "resources": {"requests": {"cpu": "1", "memory": "1Gi"}}}]
+        },
+    }
+
+
+def test_looks_like_json():
+    assert looks_like_json(b'  \n{"kind": "List"}')
+    assert looks_like_json(b"[]")
+    assert not looks_like_json(b"apiVersion: v1\nkind: Pod\n")
+
+
+def test_json_list_matches_yaml_manifests(tmp_path: Path):
+    paths = sorted(FIXTURES.glob("*.yaml"))
+    docs = [d for p in paths for d in yaml.safe_load_all(p.read_text()) if d]
+    dump = tmp_path / "snapshot.json"
+    dump.write_text(json.dumps({"apiVersion": "v1", "kind": "List", "items": docs}))
+
+    from_yaml = parse_files([str(p) for p in paths])
+    from_json = parse_files([str(dump)])
+    assert from_json.workloads == from_yaml.workloads
+    assert from_json.storage == from_yaml.storage
+    assert from_json.services == from_yaml.services
+
+
+def test_controlled_objects_and_vct_claims_not_double_counted(tmp_path: Path):
+    items = [
+        _pod("web-abc-1", **_OWNED),
+        _pod("standalone"),
+        # Owned by a controller the tool does not cost: the pod is the only record
+        _pod(
+            "etcd-0",
+            ownerReferences=[{"kind": "EtcdCluster", "name": "etcd", "controller": True}],
+        ),
+        {"kind": "ReplicaSet", "metadata": {"name": "web-abc", "namespace": "prod"}},
+        {
+            "kind": "StatefulSet",
+            "metadata": {"name": "db", "namespace": "prod"},
+            "spec": {
+                "replicas": 2,
+                "template": {"spec": {"containers": [{"name": "c"}]}},
+                "volumeClaimTemplates": [
+                    {
+                        "metadata": {"name": "data"},
+                        "spec": {"resources": {"requests": {"storage": "10Gi"}}},
+                    }
+                ],
+            },
+        },
+        {
+            "kind": "PersistentVolumeClaim",
+            "metadata": {"name": "data-db-0", "namespace": "prod"},
+            "spec": {"resources": {"requests": {"storage": "10Gi"}}},
+        },
+    ]
+    dump = tmp_path / "snapshot.json"
+    dump.write_text(json.dumps({"kind": "List", "items": items}))
+
+    out = parse_files([str(dump)])
+    assert sorted(w.name for w in out.workloads) == ["db", "etcd-0", "standalone"]
+    assert [s.kind for s in out.storage] == ["StatefulSetVolumeClaimTemplate"]
+
+
+def test_flow_style_yaml_falls_back_to_yaml_loader(tmp_path: Path):
+    path = tmp_path / "flow.yaml"
+    path.write_text(
+        "{apiVersion: v1, kind: Pod, metadata: {name: flow, namespace: prod},"
+        " spec: {containers: [{name: c, resources: {requests: {cpu: 1, memory: 1Gi}}}]}}\n"
+    )
+    assert looks_like_json(path.read_bytes())
+    (w,) = parse_files([str(path)]).workloads
+    assert (w.name, w.cpu_vcpu_per_replica) == ("flow", 1.0)
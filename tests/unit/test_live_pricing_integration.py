@@ -72,3 +72,50 @@ def test_orchestrate_uses_live_pricing_when_enabled(monkeypatch):
     assert res.baseline.vcpu == 4
     assert res.baseline.memory_gb == 16
 
+
+def _cfg():
+    return EstimationConfig(
+        region="eu-west-3",
+        baseline_instance="m6i.large",
+        baseline_price_override=None,
+        cpu_weight=0.6,
+        mem_weight=0.4,
+        live_pricing=True,
+    )
+
+
+def test_live_pricing_fetch_overlaps_parsing(monkeypatch):
+    import threading
+
+    import eks_cost_estimator.core.orchestrator as orch
+
+    real_parse = orch.parse_files
+    # Parsing and fetching each wait for the other to start: run one after the other,
+    # the barrier breaks and the estimate fails
+    both_running = threading.Barrier(2, timeout=10)
+
+    def parse_after_fetch_started(paths, **kwargs):
+        both_running.wait()
+        return real_parse(paths, **kwargs)
+
+    def fetch_during_parse(**kwargs):
+        both_running.wait()
+        return {"price": 0.2, "vcpu": 2.0, "memory_gb": 8.0}
+
+    monkeypatch.setattr(orch, "parse_files", parse_after_fetch_started)
+    monkeypatch.setattr(orch, "get_live_baseline", fetch_during_parse)
+
+    res = orchestrate(["tests/fixtures/deployment.yaml"], _cfg())
+    assert abs(res.baseline.price - 0.2) < 1e-9
+
+
+def test_live_pricing_failure_falls_back_to_static_baseline(monkeypatch):
+    import eks_cost_estimator.core.orchestrator as orch
+    from eks_cost_estimator.pricing.aws_pricing import LivePricingError
+
+    def failing_fetch(**kwargs):
+        raise LivePricingError("no credentials")
+
+    monkeypatch.setattr(orch, "get_live_baseline", failing_fetch)
+    res = orchestrate(["tests/fixtures/deployment.yaml"], _cfg())
+    assert abs(res.baseline.price - 0.119) < 1e-9
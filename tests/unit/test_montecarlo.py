@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import pytest
+
+from eks_cost_estimator.calculators.montecarlo import (
+    MonteCarloParams,
+    parse_range,
+    run_monte_carlo,
+)
+from eks_cost_estimator.core.orchestrator import EstimationConfig, orchestrate
+from eks_cost_estimator.models.resources import HpaItem
+from eks_cost_estimator.models.results import WorkloadCost
+
+pytest.importorskip("numpy")
+
+
+def _cost(name, replicas, hourly):
+    return WorkloadCost(
+        name=name,
+        kind="Deployment",
+        replicas=replicas,
+        cpu_vcpu_per_replica=1.0,
+        memory_gb_per_replica=2.0,
+        hourly=hourly,
+        monthly=hourly * 720,
+    )
+
+
+COSTS = [_cost("api", 4, 0.08), _cost("static", 2, 0.04)]
+HPAS = {0: HpaItem(name="api", target_kind="Deployment", target_name="api", max_replicas=10)}
+
+
+def test_fixed_inputs_reproduce_deterministic_total():
+    params = MonteCarloParams(trials=100, binpack_efficiency=(1.0, 1.0))
+    r = run_monte_carlo(COSTS, {}, fixed_monthly=5.0, params=params)
+    assert r.p50_monthly == pytest.approx(0.12 * 720 + 5.0)
+    assert r.std_monthly == pytest.approx(0.0, abs=1e-9)
+
+
+def test_percentiles_ordered_and_bounded():
+    params = MonteCarloParams(trials=5000, seed=7, spot_share=0.5)
+    r = run_monte_carlo(COSTS, HPAS, fixed_monthly=0.0, params=params)
+    assert r.autoscaled_workloads == 1
+    assert r.min_monthly <= r.p50_monthly <= r.p90_monthly <= r.p99_monthly <= r.max_monthly
+    # Bounds: 1 api replica, 80% spot discount, 95% efficiency .. 10 replicas, 60%, 70%
+    low = (0.02 + 0.04) * 720 * (1 - 0.5 * 0.8) / 0.95
+    high = (0.2 + 0.04) * 720 * (1 - 0.5 * 0.6) / 0.7
+    assert low <= r.min_monthly and r.max_monthly <= high
+
+
+def test_seeded_and_independent_of_workers():
+    params = MonteCarloParams(trials=2000, seed=3)
+    serial = run_monte_carlo(COSTS, HPAS, fixed_monthly=1.0, params=params, batch_elements=300)
+    parallel = run_monte_carlo(
+        COSTS,
+        HPAS,
+        fixed_monthly=1.0,
+        params=MonteCarloParams(trials=2000, seed=3, workers=2),
+        batch_elements=300,
+    )
+    assert serial.model_dump() == parallel.model_dump()
+    other = run_monte_carlo(
+        COSTS, HPAS, fixed_monthly=1.0, params=MonteCarloParams(trials=2000, seed=4)
+    )
+    assert other.p50_monthly != serial.p50_monthly
+
+
+def test_fargate_skips_binpack_efficiency():
+    cfg = EstimationConfig(
+        region="eu-west-3",
+        baseline_instance="m6i.large",
+        baseline_price_override=None,
+        cpu_weight=0.6,
+        mem_weight=0.4,
+        compute_mode="fargate",
+        monte_carlo=MonteCarloParams(trials=50, binpack_efficiency=(0.5, 0.6)),
+    )
+    result = orchestrate(["tests/fixtures/deployment.yaml"], cfg)
+    t = result.totals
+    # No HPAs and no spot: every trial is exactly the Fargate bill
+    expected = t.compute_monthly + t.storage_monthly + t.lb_monthly
+    assert result.monte_carlo.min_monthly == pytest.approx(expected)
+    assert result.monte_carlo.max_monthly == pytest.approx(expected)
+
+
+def test_parse_range():
+    assert parse_range("0.6:0.8") == (0.6, 0.8)
+    assert parse_range("0.5") == (0.5, 0.5)
+    with pytest.raises(ValueError):
+        parse_range("0.9:0.1")
+    with pytest.raises(ValueError):
+        parse_range("a:b")
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from eks_cost_estimator.calculators.binpack import (
+    NodePool,
+    attribute_node_costs,
+    simulate_binpack,
+    simulate_binpack_pools,
+)
+from eks_cost_estimator.core.orchestrator import EstimationConfig, orchestrate
+from eks_cost_estimator.models.resources import WorkloadItem
+
+
+def _wl(name, cpu, mem, replicas=1, selector=None):
+    return WorkloadItem(
+        name=name,
+        namespace="default",
+        kind="Deployment",
+        replicas=replicas,
+        cpu_vcpu_per_replica=cpu,
+        memory_gb_per_replica=mem,
+        node_selector=selector,
+    )
+
+
+def _pack(workloads):
+    # 2 vCPU / 8 GB nodes with no overhead: allocatable is the whole node
+    return simulate_binpack(
+        workloads,
+        instance_type="m6i.large",
+        node_cpu_vcpu=2.0,
+        node_mem_gb=8.0,
+        overhead_cpu_vcpu=0.0,
+        overhead_mem_gb=0.0,
+    )
+
+
+def test_dominant_share_and_idle():
+    res = _pack([_wl("cpu-heavy", 1.0, 1.0), _wl("mem-heavy", 0.2, 2.0)])
+    attribute_node_costs(res, {None: 0.1})
+    (node,) = res.nodes
+    costs = {a.workload: a.monthly_cost for a in node.allocations}
+    assert node.hourly_price == 0.1
+    assert node.monthly_cost == pytest.approx(72.0)
+    # 50% of CPU and 25% of memory: the rest of the node is idle
+    assert costs == pytest.approx({"cpu-heavy": 36.0, "mem-heavy": 18.0})
+    assert node.idle_monthly == pytest.approx(18.0)
+    assert (res.node_monthly, res.allocated_monthly, res.idle_monthly) == pytest.approx(
+        (72.0, 54.0, 18.0)
+    )
+
+
+def test_overclaimed_node_is_fully_allocated():
+    # Dominant shares 0.9 + 0.9 exceed the node: scaled to its cost, nothing idle
+    res = _pack([_wl("cpu", 1.8, 0.8), _wl("mem", 0.1, 7.2)])
+    attribute_node_costs(res, {None: 0.1})
+    (node,) = res.nodes
+    assert [a.monthly_cost for a in node.allocations] == pytest.approx([36.0, 36.0])
+    assert node.idle_monthly == 0.0
+
+
+def test_pools_priced_separately():
+    pools = [
+        NodePool(
+            name="big",
+            instance_type="m6i.xlarge",
+            labels={"size": "big"},
+            node_cpu_vcpu=4.0,
+            node_mem_gb=16.0,
+            hourly_price=0.2,
+        ),
+        NodePool(
+            name="default",
+            instance_type="m6i.large",
+            labels={"size": "small"},
+            node_cpu_vcpu=2.0,
+            node_mem_gb=8.0,
+        ),
+    ]
+    workloads = [
+        _wl("a", 1.0, 1.0, replicas=3, selector={"size": "big"}),
+        _wl("b", 1.0, 1.0, selector={"size": "small"}),
+    ]
+    res, _ = simulate_binpack_pools(
+        workloads,
+        pools,
+        overhead_cpu_vcpu=0.0,
+        overhead_mem_gb=0.0,
+        workers=1,
+    )
+    attribute_node_costs(res, {"big": 0.2, "default": 0.1})
+    by_pool = {p.pool: p for p in res.pools}
+    assert by_pool["big"].node_monthly == pytest.approx(144.0)
+    assert by_pool["big"].idle_monthly == pytest.approx(36.0)
+    assert by_pool["default"].idle_monthly == pytest.approx(36.0)
+    assert res.node_monthly == pytest.approx(216.0)
+    allocated = sum(a.monthly_cost for n in res.nodes for a in n.allocations)
+    assert res.allocated_monthly == pytest.approx(allocated)
+
+
+def test_orchestrate_surfaces_node_and_idle_totals(tmp_path: Path):
+    path = tmp_path / "m.yaml"
+    path.write_text(
+        """
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: web
+spec:
+  replicas: 3
+  template:
+    spec:
+      containers:
+        - name: app
+          resources:
+            requests:
+              cpu: "500m"
+              memory: "1Gi"
+"""
+    )
+    cfg = EstimationConfig(
+        region="eu-west-3",
+        baseline_instance="m6i.large",
+        baseline_price_override=0.1,
+        cpu_weight=0.6,
+        mem_weight=0.4,
+        binpack=True,
+    )
+    result = orchestrate([str(path)], cfg)
+    bp = result.binpacking
+    assert result.totals.node_monthly == pytest.approx(bp.node_count * 72.0)
+    assert result.totals.idle_monthly == pytest.approx(bp.idle_monthly)
+    assert result.totals.idle_hourly == pytest.approx(bp.idle_monthly / 720)
+    assert 0 < bp.idle_monthly < bp.node_monthly
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from eks_cost_estimator.calculators.binpack import (
+    NodePool,
+    Taint,
+    parse_node_pool,
+    pool_for,
+    simulate_binpack_pools,
+)
+from eks_cost_estimator.core.orchestrator import EstimationConfig, orchestrate
+from eks_cost_estimator.models.resources import WorkloadItem
+
+GPU_DEPLOYMENT = """\
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: trainer
+spec:
+  replicas: 2
+  template:
+    spec:
+      nodeSelector:
+        nodegroup: gpu
+      tolerations:
+        - key: nvidia.com/gpu
+          operator: Exists
+          effect: NoSchedule
+      containers:
+        - name: app
+          resources:
+            requests:
+              cpu: "2"
+              memory: 8Gi
+---
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: web
+spec:
+  replicas: 3
+  template:
+    spec:
+      containers:
+        - name: app
+          resources:
+            requests:
+              cpu: 500m
+              memory: 1Gi
+"""
+
+
+def _wl(name, selector=None, tolerations=None):
+    return WorkloadItem(
+        name=name,
+        kind="Deployment",
+        replicas=2,
+        cpu_vcpu_per_replica=0.5,
+        memory_gb_per_replica=1.0,
+        node_selector=selector,
+        tolerations=tolerations,
+    )
+
+
+def test_parse_node_pool():
+    pool = parse_node_pool("gpu:g5.xlarge:nodegroup=gpu:nvidia.com/gpu=true:NoSchedule")
+    assert pool.name == "gpu" and pool.instance_type == "g5.xlarge"
+    assert pool.labels == {"nodegroup": "gpu"}
+    assert pool.taints == (Taint(key="nvidia.com/gpu", value="true", effect="NoSchedule"),)
+    with pytest.raises(ValueError):
+        parse_node_pool("gpu")
+
+    sized = parse_node_pool("gpu:g5.xlarge/4/16/1.006::nvidia.com/gpu:NoSchedule")
+    assert (sized.instance_type, sized.node_cpu_vcpu, sized.node_mem_gb) == ("g5.xlarge", 4, 16)
+    assert sized.hourly_price == 1.006 and sized.labels == {}
+    assert parse_node_pool("big:m6i.xlarge/4/16").hourly_price is None
+    with pytest.raises(ValueError):
+        parse_node_pool("gpu:g5.xlarge/4")
+
+
+def test_well_known_labels_and_equal_tolerations():
+    default = NodePool(name="default", instance_type="m6i.large")
+    arm = NodePool(name="arm", instance_type="m7g.large")
+    linux = {"kubernetes.io/os": "linux"}
+    assert pool_for(_wl("a", linux), [default]) is default
+    assert pool_for(_wl("b", {"kubernetes.io/arch": "arm64"}), [default, arm]) is arm
+    assert pool_for(_wl("c", {"node.kubernetes.io/instance-type": "m6i.large"}), [arm, default])
+    assert pool_for(_wl("d", {"kubernetes.io/os": "windows"}), [default]) is None
+
+    # No operator means Equal; a taint without a value matches a toleration without one
+    tainted = NodePool(name="t", instance_type="m6i.large", taints=(Taint(key="dedicated"),))
+    assert pool_for(_wl("e", tolerations=[{"key": "dedicated"}]), [tainted]) is tainted
+    other = [{"key": "dedicated", "value": "db"}]
+    assert pool_for(_wl("f", tolerations=other), [tainted]) is None
+
+
+def test_selector_and_taints_route_workloads():
+    gpu = NodePool(
+        name="gpu",
+        instance_type="g5.xlarge",
+        labels={"nodegroup": "gpu"},
+        taints=(Taint(key="nvidia.com/gpu", effect="NoSchedule"),),
+        node_cpu_vcpu=4,
+        node_mem_gb=16,
+    )
+    general = NodePool(name="general", instance_type="m6i.large", node_cpu_vcpu=2, node_mem_gb=8)
+    pools = [gpu, general]
+    tolerant = [{"key": "nvidia.com/gpu", "operator": "Exists"}]
+
+    assert pool_for(_wl("a", {"nodegroup": "gpu"}, tolerant), pools) is gpu
+    assert pool_for(_wl("b"), pools) is general
+    # Selects the GPU group but does not tolerate its taint
+    assert pool_for(_wl("c", {"nodegroup": "gpu"}), pools) is None
+
+    merged, unmatched = simulate_binpack_pools(
+        [_wl("a", {"nodegroup": "gpu"}, tolerant), _wl("b"), _wl("c", {"nodegroup": "gpu"})],
+        pools,
+        workers=1,
+    )
+    assert [w.name for w in unmatched] == ["c"]
+    assert [p.pool for p in merged.pools] == ["gpu", "general"]
+    assert merged.node_count == sum(p.node_count for p in merged.pools)
+    assert [n.index for n in merged.nodes] == list(range(1, merged.node_count + 1))
+    assert {n.pool for n in merged.nodes} == {"gpu", "general"}
+
+
+def test_orchestrate_with_pools(tmp_path: Path):
+    path = tmp_path / "m.yaml"
+    path.write_text(GPU_DEPLOYMENT)
+    cfg = EstimationConfig(
+        region="eu-west-3",
+        baseline_instance="m6i.large",
+        baseline_price_override=None,
+        cpu_weight=0.6,
+        mem_weight=0.4,
+        binpack=True,
+        node_pools=(
+            NodePool(
+                name="gpu",
+                instance_type="g5.2xlarge",
+                labels={"nodegroup": "gpu"},
+                taints=(Taint(key="nvidia.com/gpu", effect="NoSchedule"),),
+                node_cpu_vcpu=8,
+                node_mem_gb=32,
+            ),
+        ),
+    )
+    result = orchestrate([str(path)], cfg)
+    by_pool = {p.pool: p for p in result.binpacking.pools}
+    assert set(by_pool) == {"gpu", "default"}
+    assert by_pool["gpu"].node_count == 1
+    assert by_pool["default"].instance_type == "m6i.large"
+
+
+def test_parallel_matches_serial(monkeypatch):
+    from eks_cost_estimator.calculators import binpack
+
+    pools = [
+        NodePool(
+            name="a", instance_type="m6i.large", labels={"g": "a"}, node_cpu_vcpu=2, node_mem_gb=8
+        ),
+        NodePool(name="b", instance_type="m6i.xlarge", node_cpu_vcpu=4, node_mem_gb=16),
+    ]
+    workloads = [_wl(f"w{i}", {"g": "a"} if i % 2 else None) for i in range(40)]
+    serial, _ = simulate_binpack_pools(workloads, pools, workers=1)
+    monkeypatch.setattr(binpack, "PARALLEL_MIN_REPLICAS", 0)
+    parallel, _ = simulate_binpack_pools(workloads, pools, workers=2)
+    assert parallel.model_dump() == serial.model_dump()
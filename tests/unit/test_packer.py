@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import random
+
+from eks_cost_estimator.calculators.packer import IncrementalPacker
+
+
+def _packer(**kw) -> IncrementalPacker:
+    return IncrementalPacker(instance_type="m6i.large", node_cpu_vcpu=2.0, node_mem_gb=8.0, **kw)
+
+
+def _check(packer: IncrementalPacker, expected: dict) -> None:
+    res = packer.result()
+    placed: dict = {}
+    for n in res.nodes:
+        assert n.cpu_used <= n.cpu_capacity + 1e-6
+        assert n.mem_used_gb <= n.mem_capacity_gb + 1e-6
+        assert n.allocations
+        for a in n.allocations:
+            placed[a.workload] = placed.get(a.workload, 0) + a.replicas
+    assert placed == expected
+
+
+def test_add_remove_resize_keep_state_consistent():
+    p = _packer(repack_every=0)
+    p.add(("a", "ns", "Deployment"), 1.0, 4.0, 3)
+    p.add(("b", "ns", "Deployment"), 0.4, 1.0, 4)
+    _check(p, {"a": 3, "b": 4})
+
+    p.resize(("a", "ns", "Deployment"), replicas=1)
+    _check(p, {"a": 1, "b": 4})
+    p.resize(("b", "ns", "Deployment"), cpu=0.2)
+    _check(p, {"a": 1, "b": 4})
+    p.remove(("a", "ns", "Deployment"))
+    _check(p, {"b": 4})
+    # 4 x 0.2 vCPU fit on one node once the large replicas are gone
+    assert p.node_count == 1
+
+
+def test_local_repair_tracks_full_repack():
+    rng = random.Random(7)
+    p = _packer(repack_every=0)
+    expected = {}
+    for i in range(200):
+        reps = rng.randint(1, 3)
+        cpu, mem = rng.choice([0.1, 0.25, 0.5]), rng.choice([0.5, 1.0])
+        p.add((f"w{i}", None, "Deployment"), cpu, mem, reps)
+        expected[f"w{i}"] = reps
+    for i in rng.sample(range(200), 80):
+        p.remove((f"w{i}", None, "Deployment"))
+        del expected[f"w{i}"]
+    _check(p, expected)
+    incremental = p.node_count
+    p.repack()
+    _check(p, expected)
+    assert incremental <= p.node_count * 1.25
+
+
+def test_periodic_full_repack():
+    p = _packer(repack_every=3)
+    for i in range(3):
+        p.add((f"w{i}", None, "Job"), 0.5, 1.0, 1)
+    assert p.updates_since_repack == 0
+
+
+def test_batch_defers_repair_and_threshold_limits_it():
+    p = _packer(repack_every=0)
+    # Node 1: a (1.0) + b (0.6); node 2: c (1.0)
+    p.add(("a", None, "Job"), 1.0, 1.0, 1)
+    p.add(("b", None, "Job"), 0.6, 1.0, 1)
+    p.add(("c", None, "Job"), 1.0, 1.0, 1)
+    assert p.node_count == 2
+    with p.batch():
+        p.remove(("a", None, "Job"))
+        # Without deferral node 1 would be drained into node 2 before d arrives
+        p.add(("d", None, "Job"), 1.0, 1.0, 1)
+    _check(p, {"b": 1, "c": 1, "d": 1})
+    assert p.node_count == 2
+
+    for repair_below, nodes in ((0.5, 1), (0.4, 2)):
+        q = _packer(repack_every=0, repair_below=repair_below)
+        q.add(("p", None, "Job"), 0.8, 1.0, 1)
+        q.add(("q", None, "Job"), 0.9, 1.0, 1)
+        q.add(("r", None, "Job"), 1.0, 1.0, 1)
+        q.remove(("q", None, "Job"))
+        # p's node is left 44% busy: drained into r's node only under a 50% threshold
+        _check(q, {"p": 1, "r": 1})
+        assert q.node_count == nodes
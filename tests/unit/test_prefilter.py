@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from eks_cost_estimator.parsers.prefilter import peek_kind, split_documents
+from eks_cost_estimator.parsers.yaml_parser import parse_files
+
+
+STREAM = """\
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: blob
+data:
+  payload: {unterminated: [flow
+---
+apiVersion: apps/v1
+kind: "Deployment"
+metadata:
+  name: api
+spec:
+  replicas: 2
+  template:
+    spec:
+      containers:
+        - name: app
+          resources:
+            requests: {cpu: 500m, memory: 1Gi}
+--- # comment after marker
+{"apiVersion": "v1", "kind": "Secret", "metadata": {"name": "s"}}
+"""
+
+
+def test_split_and_peek_kind():
+    chunks = list(split_documents(STREAM))
+    assert len(chunks) == 3
+    assert [peek_kind(c) for c in chunks] == ["ConfigMap", "Deployment", None]
+
+
+def test_unsupported_documents_are_never_deserialized(tmp_path):
+    f = tmp_path / "render.yaml"
+    f.write_text(STREAM, encoding="utf-8")
+    # The ConfigMap body is invalid YAML; skipping it by kind must avoid a parse error
+    out = parse_files([str(f)])
+    assert [w.name for w in out.workloads] == ["api"]
+    assert out.workloads[0].replicas == 2
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+import eks_cost_estimator.pricing.registry as registry_mod
+from eks_cost_estimator.pricing.rates import get_baseline
+from eks_cost_estimator.pricing.registry import (
+    BaselineRegistry,
+    PricingDataError,
+    compile_baselines,
+)
+
+
+def _write_catalog(path, price):
+    path.write_text(
+        json.dumps({"eu-west-3": {"m6i.large": {"price": price, "vcpu": 2, "memory_gb": 8}}}),
+        encoding="utf-8",
+    )
+
+
+def test_registry_loads_once_and_reloads_on_change(tmp_path, monkeypatch):
+    catalog = tmp_path / "baselines.json"
+    _write_catalog(catalog, 0.1)
+    reg = BaselineRegistry(catalog)
+    assert reg.lookup("eu-west-3", "m6i.large").price == 0.1
+    fp1 = reg.fingerprint()
+
+    loads = []
+    real_validate = registry_mod._validate
+    monkeypatch.setattr(
+        registry_mod, "_validate", lambda data, src: loads.append(src) or real_validate(data, src)
+    )
+    for _ in range(100):
+        reg.lookup("eu-west-3", "m6i.large")
+    assert loads == []
+
+    _write_catalog(catalog, 0.25)
+    st = catalog.stat()
+    os.utime(catalog, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert reg.lookup("eu-west-3", "m6i.large").price == 0.25
+    assert len(loads) == 1
+    assert reg.fingerprint() != fp1
+
+
+def test_compiled_catalog_matches_json(tmp_path):
+    src = tmp_path / "baselines.json"
+    src.write_text(
+        json.dumps(
+            {
+                f"r-{r}": {
+                    f"i{i}.large": {"price": r + i / 100, "vcpu": i + 1, "memory_gb": 4}
+                    for i in range(20)
+                }
+                for r in range(10)
+            }
+        ),
+        encoding="utf-8",
+    )
+    dst = tmp_path / "baselines.bin"
+    assert compile_baselines(src, dst) == 200
+    for path in (src, dst):
+        b = get_baseline(region="r-7", instance="i13.large", pricing_path=path)
+        assert b == {"price": 7.13, "vcpu": 14.0, "memory_gb": 4.0}
+    assert BaselineRegistry(dst).lookup("r-7", "missing") is None
+
+
+def test_invalid_catalog_is_rejected(tmp_path):
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps({"eu-west-3": {"m6i.large": {"price": 1}}}), encoding="utf-8")
+    with pytest.raises(PricingDataError):
+        BaselineRegistry(bad).lookup("eu-west-3", "m6i.large")
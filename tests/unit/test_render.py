@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import io
+
+from rich.console import Console
+
+from eks_cost_estimator.calculators.compute import compute_costs
+from eks_cost_estimator.models.resources import WorkloadItem
+from eks_cost_estimator.models.results import (
+    BaselineInfo,
+    DerivedRates,
+    EstimationResult,
+    Totals,
+)
+from eks_cost_estimator.output.render import render_table
+
+
+def _result(n: int) -> EstimationResult:
+    workloads = [
+        WorkloadItem(
+            name=f"wl-{i}",
+            namespace="default",
+            kind="Deployment",
+            replicas=1,
+            cpu_vcpu_per_replica=float(i),
+            memory_gb_per_replica=1.0,
+        )
+        for i in range(n)
+    ]
+    costs, totals = compute_costs(workloads, {"per_vcpu_hour": 0.03, "per_gb_ram_hour": 0.005})
+    return EstimationResult(
+        baseline=BaselineInfo(
+            region="eu-west-3",
+            instance_type="m6i.large",
+            price=0.119,
+            vcpu=2,
+            memory_gb=8,
+            cpu_weight=0.6,
+            mem_weight=0.4,
+        ),
+        derived_rates=DerivedRates(
+            per_vcpu_hour=0.03, per_gb_ram_hour=0.005, storage_gb_month=0.08
+        ),
+        workloads=costs,
+        storage=[],
+        totals=Totals(
+            compute_hourly=totals["hourly"],
+            compute_monthly=totals["monthly"],
+            storage_hourly=0.0,
+            storage_monthly=0.0,
+        ),
+        assumptions=[],
+        warnings=[],
+    )
+
+
+def _render(result: EstimationResult, **kwargs) -> str:
+    buf = io.StringIO()
+    render_table(result, console=Console(file=buf, width=200), **kwargs)
+    return buf.getvalue()
+
+
+def test_top_n_shows_most_expensive_and_folds_the_tail():
+    out = _render(_result(1000), top=3)
+    assert "top 3 of 1000" in out
+    for name in ("wl-999", "wl-998", "wl-997"):
+        assert name in out
+    assert "wl-996" not in out
+    assert "other (997 rows)" in out
+
+
+def test_paging_walks_the_cost_ranking():
+    out = _render(_result(100), top=10, page=2)
+    assert "page 2/10" in out
+    assert "wl-89" in out and "wl-80" in out
+    assert "wl-90" not in out and "wl-79" not in out
+
+    # Past the middle of the ranking the section is sorted instead: same slice
+    out = _render(_result(100), top=10, page=9)
+    assert "page 9/10" in out
+    assert "wl-19" in out and "wl-10" in out
+    assert "wl-20" not in out and "wl-9 " not in out
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+import shutil
+
+from eks_cost_estimator.core import result_cache
+from eks_cost_estimator.core.orchestrator import EstimationConfig, orchestrate
+from eks_cost_estimator.core.result_cache import ResultCache, orchestrate_cached
+from eks_cost_estimator.utils.timings import Timings
+
+
+def _cfg(**kwargs):
+    return EstimationConfig(
+        region="eu-west-3",
+        baseline_instance="m6i.large",
+        baseline_price_override=None,
+        cpu_weight=0.6,
+        mem_weight=0.4,
+        **kwargs,
+    )
+
+
+def test_identical_run_is_served_from_cache(tmp_path):
+    manifest = tmp_path / "deployment.yaml"
+    shutil.copy("tests/fixtures/deployment.yaml", manifest)
+    cache = ResultCache(tmp_path / "cache")
+
+    first = orchestrate_cached([str(manifest)], _cfg(binpack=True), cache)
+    timings = Timings()
+    second = orchestrate_cached([str(manifest)], _cfg(binpack=True), cache, timings=timings)
+    assert timings.counters == {"cache_hits": 1}
+    assert second.model_dump() == first.model_dump()
+
+    # Any change to inputs or config produces a different key
+    key = cache.key([str(manifest)], _cfg(binpack=True))
+    assert cache.key([str(manifest)], _cfg(binpack=False)) != key
+    manifest.write_text(manifest.read_text().replace("replicas: 3", "replicas: 4"))
+    assert cache.key([str(manifest)], _cfg(binpack=True)) != key
+    changed = orchestrate_cached([str(manifest)], _cfg(binpack=True), cache)
+    assert changed.workloads[0].replicas == 4
+
+    # Same contents under another path: warnings would name the old file
+    moved = tmp_path / "moved.yaml"
+    shutil.copy(manifest, moved)
+    assert cache.key([str(moved)], _cfg(binpack=True)) != cache.key(
+        [str(manifest)], _cfg(binpack=True)
+    )
+
+
+def test_result_schema_change_invalidates_keys(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path / "cache")
+    key = cache.key(["tests/fixtures/deployment.yaml"], _cfg())
+    monkeypatch.setattr(result_cache, "_result_schema_hash", lambda: "other-schema")
+    assert cache.key(["tests/fixtures/deployment.yaml"], _cfg()) != key
+
+
+def test_lru_eviction_keeps_recent_entries(tmp_path):
+    cache = ResultCache(tmp_path / "cache", max_entries=2)
+    result = orchestrate(["tests/fixtures/pvc.yaml"], _cfg())
+    for i, key in enumerate(["aa" + "0" * 62, "bb" + "0" * 62, "cc" + "0" * 62]):
+        cache.put(key, result)
+        os.utime(cache._entry_path(key), ns=(i * 10**9, i * 10**9))
+    cache.evict()
+    remaining = sorted(p.name[:2] for p in (tmp_path / "cache").rglob("*.json"))
+    assert remaining == ["bb", "cc"]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import gzip
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from eks_cost_estimator.calculators.hpa import SimulationError
+from eks_cost_estimator.calculators.rightsizing import (
+    RightsizingParams,
+    read_usage_metrics,
+    recommend_requests,
+)
+from eks_cost_estimator.core.orchestrator import EstimationConfig, orchestrate
+from eks_cost_estimator.models.resources import WorkloadItem
+from eks_cost_estimator.utils.sketch import DDSketch
+
+
+MANIFEST = """
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: api
+  namespace: shop
+spec:
+  replicas: 4
+  template:
+    spec:
+      containers:
+        - name: app
+          resources:
+            requests:
+              cpu: "1"
+              memory: "2Gi"
+"""
+
+
+def _wl(name, namespace="shop", kind="Deployment"):
+    return WorkloadItem(
+        name=name,
+        namespace=namespace,
+        kind=kind,
+        replicas=2,
+        cpu_vcpu_per_replica=1.0,
+        memory_gb_per_replica=2.0,
+    )
+
+
+def test_sketch_quantiles_within_relative_accuracy():
+    rng = random.Random(0)
+    values = [rng.lognormvariate(0.0, 1.5) for _ in range(20_000)] + [0.0] * 500
+    sketch = DDSketch(0.01)
+    for v in values:
+        sketch.add(v)
+    values.sort()
+    for q in (0.0, 0.1, 0.5, 0.95, 0.99, 1.0):
+        exact = values[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.0101, abs=1e-12)
+
+    # Collapsing the lowest buckets keeps the upper quantiles accurate
+    small = DDSketch(0.01, max_buckets=256)
+    other = DDSketch(0.01, max_buckets=256)
+    for i, v in enumerate(values):
+        (small if i % 2 else other).add(v)
+    small.merge(other)
+    assert len(small._bins) <= 256
+    assert small.count == len(values)
+    p99 = values[int(0.99 * (len(values) - 1))]
+    assert small.quantile(0.99) == pytest.approx(p99, rel=0.0101)
+
+
+def test_read_csv_ndjson_and_gzip_map_pods_to_workloads(tmp_path: Path):
+    workloads = [_wl("api"), _wl("api-gateway"), _wl("db", kind="StatefulSet")]
+    csv_path = tmp_path / "usage.csv"
+    csv_path.write_text(
+        "namespace,pod,container,cpu,memory\n"
+        "shop,api-7d9f8-x2x7q,app,0.2,500000000\n"
+        "shop,api-7d9f8-k8d2m,app,250m,600Mi\n"
+        "shop,api-gateway-5c4b-abcde,proxy,0.1,\n"
+        "shop,db-0,postgres,0.5,1Gi\n"
+        "other,api-7d9f8-x2x7q,app,9,9\n"
+    )
+    usage = read_usage_metrics(csv_path, workloads)
+    # api-gateway matches its own workload, not the shorter "api" prefix
+    assert sorted(usage.sketches) == [(0, "app"), (1, "proxy"), (2, "postgres")]
+    assert usage.samples == 7
+    assert usage.unmatched_samples == 2
+    cpu, mem = usage.sketches[(0, "app")]
+    assert cpu.count == mem.count == 2
+    assert mem.max == pytest.approx(600 * 2**20 / 1e9)
+
+    labels = {"namespace": "shop", "container": "postgres"}
+    lines = [
+        {
+            "metric": {"__name__": "container_memory_working_set_bytes", "pod": "db-0", **labels},
+            "value": [1700000000, "2e9"],
+        },
+        {"pod": "db-1", "metric": "container_cpu_usage", "value": 0.75, **labels},
+    ]
+    nd = tmp_path / "usage.ndjson.gz"
+    with gzip.open(nd, "wt") as f:
+        f.write("\n".join(json.dumps(line) for line in lines) + "\n")
+    usage = read_usage_metrics(nd, workloads)
+    cpu, mem = usage.sketches[(2, "postgres")]
+    assert (cpu.count, mem.count) == (1, 1)
+    assert cpu.max == 0.75 and mem.max == pytest.approx(2.0)
+
+    bad = tmp_path / "bad.csv"
+    bad.write_text("namespace,pod,container,cpu\nshop,api-1,app,0.1\nshop,api-2,app,lots\n")
+    with pytest.raises(SimulationError, match="record 2"):
+        read_usage_metrics(bad, workloads)
+
+
+def test_recommend_sums_containers_and_keeps_unsampled_resources(tmp_path: Path):
+    workloads = [_wl("api"), _wl("idle")]
+    path = tmp_path / "u.csv"
+    rows = ["namespace,pod,container,cpu"]
+    rows += [f"shop,api-1,app,{v / 100}" for v in range(1, 101)]
+    rows += ["shop,api-1,sidecar,0.1"] * 10
+    path.write_text("\n".join(rows) + "\n")
+    usage = read_usage_metrics(path, workloads)
+    out = recommend_requests(workloads, usage, RightsizingParams(cpu_quantile=0.95, headroom=0.1))
+    assert out[0].cpu_vcpu_per_replica == pytest.approx((0.95 + 0.1) * 1.1, rel=0.02)
+    assert out[0].memory_gb_per_replica == 2.0  # no memory samples
+    assert out[1] is workloads[1]
+
+
+def test_orchestrate_reports_savings_and_node_counts(tmp_path: Path):
+    manifest = tmp_path / "m.yaml"
+    manifest.write_text(MANIFEST)
+    metrics = tmp_path / "u.csv"
+    metrics.write_text(
+        "namespace,pod,container,cpu,memory\n"
+        + "".join(f"shop,api-6b7c-p{i},app,0.1,200Mi\n" for i in range(50))
+    )
+    cfg = EstimationConfig(
+        region="eu-west-3",
+        baseline_instance="m6i.large",
+        baseline_price_override=None,
+        cpu_weight=0.6,
+        mem_weight=0.4,
+        binpack=True,
+        usage_metrics=str(metrics),
+    )
+    rs = orchestrate([str(manifest)], cfg).rightsizing
+    assert rs is not None
+    (row,) = rs.workloads
+    assert row.samples == 100
+    assert row.cpu_recommended == pytest.approx(0.115, rel=0.02)
+    assert rs.savings_monthly == pytest.approx(rs.current_monthly - rs.recommended_monthly)
+    assert 0 < rs.recommended_monthly < rs.current_monthly
+    assert rs.recommended_node_count < rs.current_node_count
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from eks_cost_estimator.core.orchestrator import EstimationConfig, orchestrate
+from eks_cost_estimator.output.sqlite_sink import SinkError, parse_sink_url, write_result
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+def _result():
+    cfg = EstimationConfig(
+        region="eu-west-3",
+        baseline_instance="m6i.large",
+        baseline_price_override=None,
+        cpu_weight=0.6,
+        mem_weight=0.4,
+    )
+    return orchestrate(sorted(str(p) for p in FIXTURES.glob("*.yaml")), cfg)
+
+
+def test_parse_sink_url():
+    assert parse_sink_url("sqlite:///costs.db") == Path("costs.db")
+    assert parse_sink_url("sqlite:////tmp/costs.db") == Path("/tmp/costs.db")
+    with pytest.raises(SinkError):
+        parse_sink_url("postgres://db/costs")
+
+
+def test_unwritable_sink_directory_raises_sink_error(tmp_path: Path):
+    blocker = tmp_path / "hist"
+    blocker.write_text("not a directory")
+    with pytest.raises(SinkError, match="Cannot open sink database"):
+        write_result(blocker / "costs.db", _result())
+
+
+def test_runs_are_appended(tmp_path: Path):
+    db = tmp_path / "hist" / "costs.db"
+    result = _result()
+    first = write_result(db, result, label="main")
+    second = write_result(db, result, label="main")
+    assert second == first + 1
+
+    conn = sqlite3.connect(db)
+    try:
+        rows = conn.execute(
+            "SELECT run_id, COUNT(*), SUM(monthly) FROM workloads GROUP BY run_id"
+        ).fetchall()
+        assert [r[1] for r in rows] == [len(result.workloads)] * 2
+        assert rows[0][2] == pytest.approx(result.totals.compute_monthly)
+        (lb_count,) = conn.execute(
+            "SELECT COUNT(*) FROM load_balancers WHERE run_id = ?", (second,)
+        ).fetchone()
+        assert lb_count == len(result.load_balancers)
+        labels = conn.execute("SELECT DISTINCT label FROM runs").fetchall()
+        assert labels == [("main",)]
+    finally:
+        conn.close()
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+
+from eks_cost_estimator.core.orchestrator import EstimationConfig, orchestrate
+from eks_cost_estimator.utils.timings import Timings
+
+
+def test_orchestrate_records_stage_timings():
+    cfg = EstimationConfig(
+        region="eu-west-3",
+        baseline_instance="m6i.large",
+        baseline_price_override=None,
+        cpu_weight=0.6,
+        mem_weight=0.4,
+        binpack=True,
+    )
+    timings = Timings(trace_memory=True)
+    timings.start()
+    orchestrate(
+        ["tests/fixtures/deployment.yaml", "tests/fixtures/statefulset_with_vct.yaml"],
+        cfg,
+        timings=timings,
+    )
+    timings.stop()
+
+    data = json.loads(timings.to_json())
+    for stage in (
+        "parse",
+        "parse.file_read",
+        "parse.yaml_load",
+        "parse.parse_workload",
+        "pricing_lookup",
+        "compute_costs",
+        "storage_costs",
+        "simulate_binpack",
+    ):
+        assert stage in data["stages"]
+        assert data["stages"][stage]["wall_s"] >= 0
+        assert "peak_bytes" in data["stages"][stage]
+    assert data["stages"]["parse.parse_workload"]["calls"] == 2
+    assert data["counters"]["documents"] == 2
+    assert [f["documents"] for f in data["files"]] == [1, 1]
+    assert data["documents_per_s"] > 0